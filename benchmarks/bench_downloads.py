@@ -0,0 +1,76 @@
+"""Latency of repeated URL downloads: a new session per request vs the shared session
+
+Usage: python benchmarks/bench_downloads.py [requests] [size_kb]
+
+Serves a payload from a local aiohttp server over plain HTTP, so the gap
+measured here is connection setup only. Against real hosts the shared
+session also skips DNS lookups and TLS handshakes, which widens it.
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+import aiohttp
+
+import bot
+
+PORT = 18090
+
+
+def summarize(label, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<22} mean {statistics.mean(samples) * 1000:7.2f} ms | "
+          f"p50 {statistics.median(samples) * 1000:7.2f} ms | p95 {p95 * 1000:7.2f} ms")
+    return statistics.mean(samples)
+
+
+async def timed_downloads(url, dest_path, requests, shared):
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        if shared:
+            size, error = await bot.download_file_from_url(url, dest_path)
+        else:
+            async with aiohttp.ClientSession() as session:
+                size, error = await bot.download_file_from_url(url, dest_path, session=session)
+        if error:
+            raise RuntimeError(error)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def main(requests, size_kb):
+    payload = b'-' * (size_kb * 1024)
+
+    async def serve_payload(request):
+        return web.Response(body=payload)
+
+    app = web.Application()
+    app.router.add_get('/script.lua', serve_payload)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', PORT).start()
+    url = f'http://127.0.0.1:{PORT}/script.lua'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dest_path = os.path.join(tmp, 'input.lua')
+        print(f"{requests} sequential downloads of {size_kb}KB from one host")
+        fresh = summarize('session per request', await timed_downloads(url, dest_path, requests, shared=False))
+        shared = summarize('shared session', await timed_downloads(url, dest_path, requests, shared=True))
+        print(f"saved {(fresh - shared) * 1000:.2f} ms per download ({fresh / shared:.1f}x)")
+
+    await bot.close_http_session()
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    size_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    asyncio.run(main(requests, size_kb))
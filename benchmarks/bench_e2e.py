@@ -0,0 +1,258 @@
+"""End-to-end load test of the .deobf command path
+
+Usage: python benchmarks/bench_e2e.py [--requests N] [--concurrency C] [--mode attachment|url|batch]
+                                      [--latency S] [--input-kb K] [--output-kb K] [--pool-size P]
+                                      [--queue-size Q] [--repeat-inputs] [--queue-db]
+
+Drives the real deobf command callback with fake Discord context, message
+and attachment objects. Jobs go to a pool of deobf_worker.py --fake stubs
+with the given latency and output size, and URL inputs come from a local
+aiohttp server. Reports requests/sec, p50/p95/p99 latency, peak RSS of the
+bot process and its workers, and event loop lag, so runs can be compared
+before and after a change. Every request uses a fresh user id, so the
+token ledger is exercised but never runs dry.
+"""
+import argparse
+import asyncio
+import collections
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep the ledger, settings, cache and work files out of the checkout
+WORK_ROOT = tempfile.mkdtemp(prefix='bench-e2e-')
+os.environ.setdefault('LEDGER_FILE', os.path.join(WORK_ROOT, 'tokens.db'))
+os.environ.setdefault('DEOBF_CACHE_DIR', os.path.join(WORK_ROOT, 'cache'))
+os.environ.setdefault('DEOBF_WORK_DIR', os.path.join(WORK_ROOT, 'work'))
+os.environ.setdefault('DEOBF_JOB_LOG', '0')
+# The stub payloads are not Moonsec scripts, measure the path behind the pre-flight check
+os.environ.setdefault('DEOBF_PREFLIGHT', '0')
+os.chdir(WORK_ROOT)
+
+from aiohttp import web
+
+import bot
+from deobf_worker import JobQueue
+
+PORT = 18091
+LAG_SAMPLE_INTERVAL = 0.01
+
+
+class FakeChannel:
+    id = 1
+
+
+class FakeMessage:
+    _ids = iter(range(1, 1 << 62))
+
+    def __init__(self, attachments=()):
+        self.id = next(self._ids)
+        self.channel = FakeChannel()
+        self.attachments = list(attachments)
+
+    async def edit(self, **kwargs):
+        pass
+
+    async def delete(self):
+        pass
+
+
+class FakeAttachment:
+    def __init__(self, filename, payload):
+        self.filename = filename
+        self.payload = payload
+        self.size = len(payload)
+
+    async def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.payload)
+
+
+class FakeAuthor:
+    def __init__(self, user_id):
+        self.id = user_id
+        self.display_name = f'bench-{user_id}'
+        self.roles = []
+
+
+class FakeContext:
+    """Just enough of commands.Context for the deobf callback"""
+
+    def __init__(self, user_id, attachments=()):
+        self.author = FakeAuthor(user_id)
+        self.message = FakeMessage(attachments)
+        self.outcome = None
+
+    async def reply(self, content=None, embed=None, file=None, view=None):
+        if file is not None:
+            # Read the upload like discord.py would, then release the handle
+            while file.fp.read(1024 * 1024):
+                pass
+            file.close()
+        if embed is not None and embed.title and embed.title.startswith('✅'):
+            self.outcome = 'success'
+        elif content is None or not content.startswith('<a:Loading'):
+            self.outcome = 'failed'
+        return FakeMessage()
+
+
+class LagSampler:
+    """Measures how late the loop wakes up short sleeps"""
+
+    def __init__(self):
+        self.samples = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+            self.samples.append(max(0.0, loop.time() - start - LAG_SAMPLE_INTERVAL))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        self._task.cancel()
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def peak_rss_kb(pid):
+    """Peak resident set size of a process from /proc, 0 where unavailable"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def make_payload(index, size_kb, repeat):
+    header = b'-- bench script\n' if repeat else f'-- bench script {index}\n'.encode()
+    return header + b'-' * max(0, size_kb * 1024 - len(header))
+
+
+async def start_payload_server(args):
+    async def serve_payload(request):
+        index = int(request.match_info['index'])
+        return web.Response(body=make_payload(index, args.input_kb, args.repeat_inputs))
+
+    app = web.Application()
+    app.router.add_get('/script/{index}.lua', serve_payload)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', PORT).start()
+    return runner
+
+
+def build_backend(args):
+    fake = ['--fake', '--fake-latency', str(args.latency)]
+    if args.output_kb is not None:
+        fake += ['--fake-output-bytes', str(args.output_kb * 1024)]
+    if args.queue_db:
+        db_path = os.path.join(WORK_ROOT, 'jobs.db')
+        return bot.QueueBackend(
+            JobQueue(db_path),
+            args.pool_size,
+            lambda: ([sys.executable, bot.WORKER_SCRIPT, '--queue', db_path] + fake, None),
+            job_timeout=bot.DEOBF_TIMEOUT
+        )
+    return bot.DeobfuscatorPool(
+        args.pool_size,
+        lambda: ([sys.executable, bot.WORKER_SCRIPT] + fake, None),
+        job_timeout=bot.DEOBF_TIMEOUT
+    )
+
+
+async def one_request(args, index):
+    user_id = 10_000 + index
+    base_url = f'http://127.0.0.1:{PORT}/script'
+    if args.mode == 'url':
+        ctx = FakeContext(user_id)
+        invoke = bot.deobf.callback(ctx, f'{base_url}/{index}.lua')
+    elif args.mode == 'batch':
+        attachments = [FakeAttachment(f'script_{i}.lua', make_payload(index * 3 + i, args.input_kb, args.repeat_inputs)) for i in range(3)]
+        ctx = FakeContext(user_id, attachments)
+        invoke = bot.deobf.callback(ctx)
+    else:
+        ctx = FakeContext(user_id, [FakeAttachment('script.lua', make_payload(index, args.input_kb, args.repeat_inputs))])
+        invoke = bot.deobf.callback(ctx)
+    start = time.perf_counter()
+    await invoke
+    return time.perf_counter() - start, ctx.outcome or 'failed'
+
+
+async def main(args):
+    os.makedirs(bot.DEOBF_WORK_DIR, exist_ok=True)
+    bot.deobfuscator = bot.DeobfuscatorCommand(['bench'], WORK_ROOT, 'bench stub')
+    bot.deobf_pool = build_backend(args)
+    bot.job_scheduler = bot.JobScheduler(args.pool_size, args.queue_size)
+    await bot.deobf_pool.start()
+    runner = await start_payload_server(args)
+    bot.get_http_session()
+
+    sampler = LagSampler()
+    sampler.start()
+    latencies = []
+    outcomes = collections.Counter()
+    pending = iter(range(args.requests))
+
+    async def client():
+        for index in pending:
+            latency, outcome = await one_request(args, index)
+            latencies.append(latency)
+            outcomes[outcome] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    sampler.stop()
+
+    if isinstance(bot.deobf_pool, bot.DeobfuscatorPool):
+        worker_pids = [worker.process.pid for worker in bot.deobf_pool._workers if worker.alive]
+    else:
+        worker_pids = [process.pid for process in bot.deobf_pool._processes if process.returncode is None]
+    worker_rss = [peak_rss_kb(pid) for pid in worker_pids]
+
+    await bot.close_http_session()
+    await bot.deobf_pool.close()
+    await runner.cleanup()
+
+    print(f"{args.requests} {args.mode} requests, concurrency {args.concurrency}, "
+          f"{args.pool_size} {'queue ' if args.queue_db else ''}workers, stub latency {args.latency * 1000:.0f} ms, "
+          f"input {args.input_kb}KB, output {'= input' if args.output_kb is None else f'{args.output_kb}KB'}")
+    print(f"throughput   {args.requests / elapsed:8.1f} req/s over {elapsed:.2f}s")
+    print(f"latency      p50 {percentile(latencies, 50) * 1000:8.1f} ms | p95 {percentile(latencies, 95) * 1000:8.1f} ms | "
+          f"p99 {percentile(latencies, 99) * 1000:8.1f} ms | max {max(latencies) * 1000:8.1f} ms")
+    print(f"loop lag     mean {statistics.mean(sampler.samples) * 1000:7.2f} ms | "
+          f"p99 {percentile(sampler.samples, 99) * 1000:7.2f} ms | max {max(sampler.samples) * 1000:7.2f} ms")
+    print(f"peak RSS     bot {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB | "
+          f"workers {sum(worker_rss) / 1024:.1f} MB total over {len(worker_rss)}")
+    print(f"outcomes     {dict(outcomes)}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8, help='simultaneous users issuing commands')
+    parser.add_argument('--mode', choices=('attachment', 'url', 'batch'), default='attachment')
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds each stub job takes')
+    parser.add_argument('--input-kb', type=int, default=64)
+    parser.add_argument('--output-kb', type=int, default=None, help='stub output size, defaults to the input size')
+    parser.add_argument('--pool-size', type=int, default=bot.DEOBF_POOL_SIZE)
+    parser.add_argument('--queue-size', type=int, default=1000, help='scheduler wait queue, large so nothing is rejected')
+    parser.add_argument('--repeat-inputs', action='store_true', help='send identical inputs so the result cache hits')
+    parser.add_argument('--queue-db', action='store_true', help='run jobs through the shared SQLite queue')
+    asyncio.run(main(parser.parse_args()))
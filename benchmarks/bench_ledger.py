@@ -0,0 +1,97 @@
+"""Compare the legacy tokens.json path with the SQLite TokenLedger
+
+Usage: python benchmarks/bench_ledger.py [users ...]
+Defaults to 10k, 100k and 1M users.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+class LegacyJsonLedger:
+    """The whole-file load/save path bot.py used before the ledger"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def save(self, tokens):
+        with open(self.path, 'w') as f:
+            json.dump(tokens, f, indent=2)
+
+    def get_user_tokens(self, user_id):
+        tokens_data = self.load()
+        user_data = tokens_data.setdefault(str(user_id), {'tokens': bot.INITIAL_TOKENS, 'last_daily': None})
+        if not user_data.get('last_daily'):
+            user_data['last_daily'] = datetime.now().isoformat()
+            self.save(tokens_data)
+        return user_data['tokens']
+
+    def use_token(self, user_id):
+        tokens_data = self.load()
+        tokens = self.get_user_tokens(user_id)
+        if tokens < bot.COST_PER_USE:
+            return False
+        tokens_data[str(user_id)]['tokens'] = tokens - bot.COST_PER_USE
+        self.save(tokens_data)
+        return True
+
+
+def seed_json(path, users):
+    now = datetime.now().isoformat()
+    with open(path, 'w') as f:
+        json.dump({str(i): {'tokens': 1_000_000, 'last_daily': now} for i in range(users)}, f, indent=2)
+
+
+def seed_ledger(ledger, users):
+    now = datetime.now().isoformat()
+    with ledger.transaction() as db:
+        db.executemany(
+            'INSERT INTO users (user_id, tokens, last_daily) VALUES (?, ?, ?)',
+            ((i, 1_000_000, now) for i in range(users))
+        )
+
+
+def measure(fn, users, ops):
+    start = time.perf_counter()
+    for i in range(ops):
+        user_id = (i * 7919) % users
+        fn(user_id)
+    return (time.perf_counter() - start) / ops
+
+
+def run(users):
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'tokens.json')
+        seed_json(json_path, users)
+        legacy = LegacyJsonLedger(json_path)
+        # A .deobf request is one balance check plus one debit
+        json_ops = max(3, 200_000 // users)
+        json_per_op = measure(lambda u: (legacy.get_user_tokens(u), legacy.use_token(u)), users, json_ops)
+
+        ledger = bot.TokenLedger(os.path.join(tmp, 'tokens.db'))
+        seed_ledger(ledger, users)
+        ledger_per_op = measure(lambda u: (ledger.balance(u), ledger.debit(u)), users, 2000)
+        ledger.close()
+
+    print(f"{users:>9} users | json: {json_per_op * 1000:10.2f} ms/request | "
+          f"ledger: {ledger_per_op * 1000:8.3f} ms/request | "
+          f"speedup: {json_per_op / ledger_per_op:8.0f}x")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    for users in sizes:
+        run(users)
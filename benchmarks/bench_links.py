@@ -0,0 +1,173 @@
+"""Golden-output check and benchmark for bot.extract_links
+
+Usage:
+    python benchmarks/bench_links.py             # verify the corpus, then time 1MB/10MB outputs
+    python benchmarks/bench_links.py --regenerate  # rebuild expected.json from the legacy extractor
+
+links_corpus/expected.json holds the links the original split-based
+extractor returned for every corpus file, and extract_links has to match
+it exactly (same links, same order).
+"""
+import json
+import os
+import random
+import sys
+import time
+from urllib.parse import urlparse, unquote
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import bot
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'links_corpus')
+EXPECTED_FILE = os.path.join(CORPUS_DIR, 'expected.json')
+SIZES_MB = [1, 10]
+
+
+def legacy_extract_links(text):
+    """The split-based extractor bot.py used before the single-pass scanner"""
+    cleaned_links = []
+    
+    # Split by 'http' to handle merged URLs
+    parts = text.split('http')
+    
+    for part in parts:
+        if not part:
+            continue
+        
+        # Reconstruct the URL with http/https
+        if part.startswith('://'):
+            link = 'http' + part
+        elif part.startswith('s://'):
+            link = 'https' + part[1:]
+        else:
+            continue
+        
+        try:
+            # Step 1: Remove everything after common terminators
+            for terminator in ['\n', '\r', '\t', ' ', '"', "'", '<', '>', '{', '}', '|', '\\', '^', '`', '[', ']']:
+                if terminator in link:
+                    link = link.split(terminator)[0]
+            
+            # Step 2: Stop at next URL if URLs are concatenated
+            # Look for common URL start patterns after the domain
+            for pattern in ['http://', 'https://']:
+                if link.count(pattern) > 1:
+                    # Find the position of the second occurrence
+                    first_pos = link.find(pattern)
+                    second_pos = link.find(pattern, first_pos + len(pattern))
+                    if second_pos > 0:
+                        link = link[:second_pos]
+            
+            # Step 3: Aggressively remove trailing special characters
+            while link and link[-1] in '.,;:)]}!?"\'>\\|`~@#$%^&*+=':
+                link = link[:-1]
+            
+            # Step 4: Remove URL-encoded characters that might cause issues
+            link = unquote(link)
+            
+            # Step 5: Remove any non-printable ASCII characters
+            link = ''.join(char for char in link if 32 <= ord(char) <= 126)
+            
+            # Step 6: Ensure it's still a valid URL structure
+            if not link.startswith(('http://', 'https://')):
+                continue
+            
+            # Step 7: Parse URL to validate structure
+            parsed = urlparse(link)
+            if not parsed.scheme or not parsed.netloc:
+                continue
+            
+            # Step 8: Skip bot's Discord link
+            if 'discord.gg/Y3yt5XMCGj' in link:
+                continue
+            
+            # Step 9: Final validation - must have protocol and domain
+            if len(link) > 10 and '://' in link and '.' in parsed.netloc:
+                cleaned_links.append(link)
+                
+        except Exception:
+            # If any error occurs, skip this link
+            continue
+    
+    # Remove duplicates while preserving order
+    seen = set()
+    unique_links = []
+    for link in cleaned_links:
+        if link not in seen:
+            seen.add(link)
+            unique_links.append(link)
+    
+    return unique_links
+
+
+def corpus_files():
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        if name != 'expected.json':
+            yield name, os.path.join(CORPUS_DIR, name)
+
+
+def read_text(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def regenerate():
+    expected = {name: legacy_extract_links(read_text(path)) for name, path in corpus_files()}
+    with open(EXPECTED_FILE, 'w', encoding='utf-8') as f:
+        json.dump(expected, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print(f"Wrote {len(expected)} golden outputs to {EXPECTED_FILE}")
+
+
+def verify():
+    with open(EXPECTED_FILE, 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+    failures = 0
+    for name, path in corpus_files():
+        got = bot.extract_links(read_text(path))
+        if got != expected.get(name):
+            failures += 1
+            print(f"MISMATCH {name}\n  expected: {expected.get(name)}\n  got:      {got}")
+    print(f"Golden corpus: {len(expected) - failures}/{len(expected)} files match")
+    return failures == 0
+
+
+def synthetic_output(size):
+    """Deobfuscated-looking Lua with a URL string constant every few lines"""
+    rng = random.Random(size)
+    hosts = ['raw.githubusercontent.com', 'pastebin.com', 'example.org', 'cdn.discordapp.com']
+    lines = []
+    total = 0
+    while total < size:
+        if rng.random() < 0.3:
+            line = f'local s{total} = "https://{rng.choice(hosts)}/raw/{rng.getrandbits(32):x}.lua?v={rng.randint(1, 99)}"'
+        else:
+            line = f'local v{total} = (a{rng.randint(0, 99)} + {rng.random():.6f}) * b[{rng.randint(0, 9999)}]'
+        lines.append(line)
+        total += len(line) + 1
+    return '\n'.join(lines)
+
+
+def bench():
+    for size_mb in SIZES_MB:
+        text = synthetic_output(size_mb * 1024 * 1024)
+        start = time.perf_counter()
+        old = legacy_extract_links(text)
+        legacy_time = time.perf_counter() - start
+        start = time.perf_counter()
+        new = bot.extract_links(text)
+        new_time = time.perf_counter() - start
+        assert old == new, f'{size_mb}MB output: results differ'
+        print(f"{size_mb:>3}MB output, {len(new)} links | legacy {legacy_time * 1000:8.1f} ms | "
+              f"single-pass {new_time * 1000:8.1f} ms | {legacy_time / new_time:5.1f}x")
+
+
+if __name__ == '__main__':
+    if '--regenerate' in sys.argv:
+        regenerate()
+    elif verify():
+        bench()
+    else:
+        sys.exit(1)
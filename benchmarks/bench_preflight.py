@@ -0,0 +1,59 @@
+"""Accuracy and speed of bot.preflight_check on a labelled corpus
+
+Usage: python benchmarks/bench_preflight.py [iterations]
+
+moonsec_corpus/labels.json labels each file 'moonsec' or 'other'. The
+moonsec samples are synthetic reconstructions of the V3 layout (the
+watermark loader, the minified VM and its escaped constant string), with
+and without the watermark. Add real submissions next to them as they turn
+up. Exits non-zero on any false negative, since rejecting a real Moonsec
+V3 file costs a user a result while a false positive only costs a worker
+run. False positives are reported but allowed.
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'moonsec_corpus')
+
+
+def main(iterations):
+    with open(os.path.join(CORPUS_DIR, 'labels.json')) as f:
+        labels = json.load(f)
+
+    false_positives = []
+    false_negatives = []
+    timings = []
+    for name, label in labels.items():
+        path = os.path.join(CORPUS_DIR, name)
+        accepted, reason, _ = bot.preflight_check(path)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            bot.preflight_check(path)
+        per_call = (time.perf_counter() - start) / iterations
+        timings.append(per_call)
+
+        if label == 'moonsec' and not accepted:
+            false_negatives.append(name)
+        elif label != 'moonsec' and accepted:
+            false_positives.append(name)
+        verdict = 'accept' if accepted else 'reject'
+        print(f"{name:<28} {label:<8} {verdict:<7} {reason:<17} {per_call * 1e6:8.1f} us")
+
+    positives = sum(1 for label in labels.values() if label == 'moonsec')
+    negatives = len(labels) - positives
+    print()
+    print(f"false negatives: {len(false_negatives)}/{positives} moonsec files rejected {false_negatives or ''}")
+    print(f"false positives: {len(false_positives)}/{negatives} other files accepted {false_positives or ''}")
+    print(f"rejected before a worker: {negatives - len(false_positives)}/{negatives} non-Moonsec files")
+    print(f"mean {sum(timings) / len(timings) * 1e6:.1f} us, max {max(timings) * 1e6:.1f} us per check (file open included)")
+    return 1 if false_negatives else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -0,0 +1,76 @@
+"""Per-job file round trip on the disk work directory vs a RAM-backed one
+
+Usage: python benchmarks/bench_workdir.py [jobs] [size_kb]
+
+Runs the same temp file steps as .deobf (create input and output files,
+write the input, let a worker write the output, stat and read it back,
+delete both) through a DeobfuscatorPool of fake workers, once with the
+work directory on disk and once on /dev/shm (DEOBF_IO_MODE=memory).
+"""
+import asyncio
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+
+def fake_worker_command():
+    return [sys.executable, bot.WORKER_SCRIPT, '--fake'], None
+
+
+async def run_jobs(pool, work_dir, jobs, payload):
+    samples = []
+    for _ in range(jobs):
+        start = time.perf_counter()
+        input_fd, input_path = tempfile.mkstemp(suffix='.lua', dir=work_dir)
+        output_fd, output_path = tempfile.mkstemp(suffix='_deobf.lua', dir=work_dir)
+        os.close(output_fd)
+        with os.fdopen(input_fd, 'wb') as f:
+            f.write(payload)
+            # Make the write reach the device, as it would under memory pressure
+            f.flush()
+            os.fsync(f.fileno())
+        await pool.run(input_path, output_path)
+        size = os.path.getsize(output_path)
+        with open(output_path, 'r', encoding='utf-8', errors='ignore') as f:
+            assert len(f.read()) == size
+        os.remove(input_path)
+        os.remove(output_path)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def main(jobs, size_kb):
+    payload = b'-' * (size_kb * 1024)
+    modes = [('disk', os.path.join(tempfile.gettempdir(), 'moonsec-deobf-bench'))]
+    if os.path.isdir(bot.RAM_DISK_DIR):
+        modes.append(('memory', os.path.join(bot.RAM_DISK_DIR, 'moonsec-deobf-bench')))
+    else:
+        print(f"{bot.RAM_DISK_DIR} not available, only timing the disk mode")
+
+    pool = bot.DeobfuscatorPool(1, fake_worker_command)
+    await pool.start()
+    print(f"{jobs} jobs with {size_kb}KB inputs")
+    try:
+        for mode, work_dir in modes:
+            os.makedirs(work_dir, exist_ok=True)
+            try:
+                samples = await run_jobs(pool, work_dir, jobs, payload)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            print(f"{mode:<7} {work_dir:<40} mean {statistics.mean(samples) * 1000:7.2f} ms | "
+                  f"p50 {statistics.median(samples) * 1000:7.2f} ms | max {max(samples) * 1000:7.2f} ms")
+    finally:
+        await pool.close()
+
+
+if __name__ == '__main__':
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    size_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+    asyncio.run(main(jobs, size_kb))
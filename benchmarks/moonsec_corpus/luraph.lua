@@ -0,0 +1,2 @@
+-- This file was protected using Luraph Obfuscator v14.1 [https://lura.ph/]
+return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;_sCdub=("\219\119\131\23\19\219\229\177\50\237\17\57\189\188\89\160\233\192\233\112\177\162\109\89\229\184\23\74\187\213\58\99\21\13\2\199\170\238\197\215\13"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _NhLf=_rcvB[499];_FcZZI=("\95\109\238\207\58\58\126\148\148\232\250\88\18\225\4\132\25\70\3\238"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _ncj<=25 then _Kwc=_WTW+1;else _Ncg=nil;end;_uOmij=("\197\141\230\17\165\146\230\152\60\100\35\90\104\44\6\31\21\176\181\224\216\147\61\255\77\68\33\231\50\150\185\93\27\181\29\208\250\157\40\111\185\180\90\62\240\52\106\253\140\39\100\105\46\61\41\68\220\140\195\12\156\136\29\163\73\185\171\240\240\72\43\92"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _AjG<=18 then _IJm=_pqM+1;else _oUb=nil;end;if _wmY<=22 then _dNx=_yBj+1;else _BWW=nil;end;if _Rwz<=86 then _SHA=_XaT+1;else _VXk=nil;end;if _SEH<=28 then _EjC=_eOF+1;else _rDc=nil;end;if _dfG<=76 then _NBy=_Edl+1;else _KGK=nil;end;local _SrRV=_LusD[954];if _hMj<=54 then _vuv=_FcU+1;else _nJd=nil;end;while true do _Aaj=bit32.bxor(_Ltg,66);break;end;while true do _tgJ=bit32.bxor(_xay,4);break;end;while true do _hyo=bit32.bxor(_Zci,193);break;end;if _sjb<=84 then _WvP=_cmI+1;else _Njg=nil;end;local _wYMM=_pExw[388];while true do _nHI=bit32.bxor(_xeK,184);break;end;if _Yaj<=28 then _IkP=_wpf+1;else _Sdg=nil;end;local _DXEu=_qlIe[739];local _BALw=_WJji[504];if _bhb<=6 then _GsJ=_Wgd+1;else _HMf=nil;end;if _Mzg<=82 then _rOr=_guH+1;else _vBI=nil;end;while true do _sMn=bit32.bxor(_ibh,45);break;end;if _pMB<=62 then _wrC=_qTJ+1;else _KhT=nil;end;_uBMyX=("\50\213\225\103\140\65\59\95\230\37\140\183\209\121\250\177\141\150\137\236"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _sIb<=23 then _eVP=_cOL+1;else _QGy=nil;end;local _tGZs=_WdEu[519];if _ryd<=52 then _Ubt=_agk+1;else _oBe=nil;end;_KqTxp=("\17\168\157\204\187\53\174\158\157\170\142\1\242\186\238\61\165\231\180\25\209\231\90\6\18\152\157\88\167\81\170"):gsub("..",function(q)return string.char(tonumber(q,16))end);_DvPEh=("\251\179\236\153\60\133\84\240\243\15\174\221\209\95\74\113\118\56\208\27\19\240\82\164\16\87\49\79\143\240\104\171\245\122\222\250\42\236\124\216\157\245\65\33\148\58\198\242\147\120\69\74\157\179\199\47\194\133\124\217\70\229\159\83\139\29\225\155\164\27"):gsub("..",function(q)return string.char(tonumber(q,16))end);_SIsLr=("\59\230\44\201\46\187\68\171\69\88\26\106\187\91\216\79\236\239\94\187\208\102\159\60\20\50\166\163\40\250\83\252\100\212\114\252\218\67\146\96\26\147\40\56\237\236\3\135\174\24\98\135\219\159\174\185\123\82\110\249\126\13\27\158\231\107\82\249\243\255\208\19"):gsub("..",function(q)return string.char(tonumber(q,16))end);_hMzxB=("\29\169\151\41\128\198\108\17\16\251\244\191\190\204\186\10\25\178\34\71\243\71\172\1\177\109\198\49\255\115\96\126\182\185\177\148\181\108\204"):gsub("..",function(q)return string.char(tonumber(q,16))end);_KYuIn=("\124\165\255\122\33\48\45\51\113\79\88\143\126\183\231\24\217\102\3\141\140\69\111\178\226\116\10\9\113\247\101\42\101\140\177\18\199\39\142\252\86\141\147\201\51\145\187\233\47\159\43\174\39\30"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _oAt=bit32.bxor(_Lwu,0);break;end;if _MOQ<=23 then _yxd=_hbE+1;else _Zdr=nil;end;local _oCxz=_cYZE[732];while true do _Gjd=bit32.bxor(_QHp,201);break;end;_LwwXm=("\55\70\45\214\172\111\236\231\7\108\0\73\46\194\245\208\110\85\189\128\196\140\90\94\141\138\74\93\174\163\5\130\181\152\162\100\185\52\45\216\97\209\44"):gsub("..",function(q)return string.char(tonumber(q,16))end);_hooqZ=("\125\42\226\178\242\173\89\161\76\143\47\230\50\176\24\94\184\11\82\165\157\169\197\142\17\88\4\64\146\124\160\144\106\154\195\48\60\44\231\52\114\201\141"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _wRDt=_UlVf[124];_UeBTs=("\228\72\234\171\207\31\225\51\2\60\213\156\9\158\131\199\151\93\80\10\103\36\47\140\69\185\48\153\70\249\111\34\144\142\16\112\244\87\171\46"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _ajBl=_iraI[382];while true do _FGu=bit32.bxor(_sqD,79);break;end;while true do _APp=bit32.bxor(_xEK,64);break;end;while true do _BsL=bit32.bxor(_zMG,61);break;end;local _AjKS=_PIXE[167];while true do _zRK=bit32.bxor(_DxO,200);break;end;if _kno<=40 then _lJU=_TzN+1;else _hbE=nil;end;while true do _LKN=bit32.bxor(_wXK,166);break;end;local _Pyla=_ycrP[254];local _unMu=_UXqr[722];if _Ufo<=4 then _TVt=_nUY+1;else _nBD=nil;end;local _kzHp=_XneJ[619];while true do _HbA=bit32.bxor(_tKy,77);break;end;if _SDJ<=39 then _WoP=_Rdi+1;else _ntK=nil;end;_ICXSM=("\109\210\191\170\86\227\192\176\160\205\73\29\31\79\247\146\101\118\175\226\130\231\50\151\13\50\58\155\157\202\31\21\184\53\34\252\210\193\249\31\254\14\136\77\245\165\89\41\38\112"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Pjb<=66 then _PBN=_Krx+1;else _GYU=nil;end;if _nQH<=36 then _Pzz=_WLF+1;else _hxH=nil;end;_EtmWB=("\14\70\177\21\66\13\90\225\95\47\3\174\168\255\243\205\192\76\29\138\123\61\214\240\15\178\238\50\100\17\170\114\187\85\44\180\207\189\16\118\230\5\172\240\63\46\104\180\70\188\210\46\221\83\221\181\34\96\243\38\49\136\200\82\121"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _fkOz=_PSUJ[554];_EafEf=("\84\225\57\42\45\84\155\143\214\67\185\184\215\102\133\53\181\135\128\177\85\74\107\41\140\46\248\16"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _TBl<=87 then _CUP=_sMn+1;else _tkr=nil;end;if _Qaf<=0 then _dfO=_GIQ+1;else _bQU=nil;end;_dgxDI=("\30\181\208\133\252\166\100\136\176\12\26\67\199\42\195\255\65\255\215\60\134\89\42\133\48\19\111\211\240\223\13\30\150\117\203\56\168\0\129\76\134\28\70\245\127\39\77\52\117\232\16\227\245\83\225\187\225\108\139\31"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _roTJ=_ylwy[413];_NXIBj=("\199\93\149\199\211\147\114\194\197\190\249\23\66\23\101\30\0\71\157\218\120\83\39\194\142\1\136\128\248\99\83\19\212\229\179\36\127\224"):gsub("..",function(q)return string.char(tonumber(q,16))end);_qPDXX=("\161\167\255\251\46\98\242\67\212\84\237\35\251\241\11\135\145\220\71\245\99\182\27\231\19\209\17\52\98\28\156\207\25"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _TrK<=49 then _mxH=_qBl+1;else _taG=nil;end;_CJeUk=("\106\110\225\63\133\30\155\232\127\123\170\91\77\76\127\123\118\98\251\215\194\218\140\21\191\41\136\137\47\255\8\3\247\51\167\72\152\19\174\181\94\6\217\231\32\95\10\177\31\51\13\202\98\64\250\83\30\30\130\218\128\117\197"):gsub("..",function(q)return string.char(tonumber(q,16))end);_gYCng=("\158\200\192\183\251\98\190\157\5\188\53\101\74\214\17\168\92\247\24\235\170\150\194\75\237\128\137\238\76\215\189\242\244\66\203\187\57\235\247\49\219\9\253\69\232\4\13\227\78\208\85\32\179\221\159\248"):gsub("..",function(q)return string.char(tonumber(q,16))end);_FQKbs=("\154\167\252\90\45\144\109\125\243\239\89\67\109\111\52\246\59\230\191\230\30\119\156\125\211\134\176\198\172\117\240\60\79\203\239\219\36"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Bhr<=95 then _Zzd=_nSr+1;else _msh=nil;end;local _mYLU=_OBVI[760];if _OkC<=74 then _nTv=_mPI+1;else _HVR=nil;end;_ZTTnD=("\63\248\176\111\47\252\150\162\228\160\240\139\196\253\0\219\16\81\41\248\225\61\49\6\180\131\173\189\116\44\120\214\0\42\144\52\203\198\35\68\80\124\53\99\143\7\246\89\206\218\81\220\4\89\31\37"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _gGkx=_lotj[541];local _JUKJ=_zUCP[631];local _htqv=_GePD[225];if _fas<=68 then _GMu=_qSa+1;else _CTn=nil;end;local _hzBK=_eXqt[5];if _WwA<=74 then _XQv=_FZF+1;else _CId=nil;end;_UYSbb=("\10\130\109\178\186\94\154\29\214\208\145\2\23\225\30\88\41\93\93\201\71\71\12\19\80\81\20\15\137\92\219\214\15\49\38\31\115\180\143\88\116\86\159\159\176\247\253\66\200\255\249\8\253\42\17\122\66\33\74\181\254\3\62\160\84\104\244\67\21\173"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _DbvF=_vHIu[730];local _aWtT=_IaTo[229];_huIYu=("\22\37\153\91\198\194\37\48\181\182\238\78\56\11\232\56\211\146\46\76\123\63\31\208\95\190\155\106\139\172\54\0\235\244\1\254\194\74\53\251\23\105\103\44\35\13\105\38\76\195\153\245\226\133\42\65\88\6\13\49\145\9\5\0\250\145"):gsub("..",function(q)return string.char(tonumber(q,16))end);_emNBP=("\103\141\162\3\183\42\215\134\52\183\173\237\206\200\50\253\118\190\154\22\43\235\82\243\182\17\145\30\71\8\50\48\12\229\173\13\23"):gsub("..",function(q)return string.char(tonumber(q,16))end);_pKEPl=("\255\103\30\182\36\146\65\100\148\148\225\160\245\221\254\36\149\58\70\178\53\53\22\72\28\227\103\78\234\126\183\186\160\46\99\247\94\153\80\121\177\11\112\41\193\245\174\213\84\113\16\135\175\176"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _mlr<=51 then _RJc=_rGB+1;else _ZzM=nil;end;if _Ckg<=19 then _JDA=_ImM+1;else _kPK=nil;end;local _cPga=_upwC[97];local _OoGs=_OYVr[823];if _JBk<=88 then _Ico=_uVE+1;else _yeH=nil;end;local _tLKb=_OcWV[607];if _sQX<=33 then _JaX=_qQU+1;else _fne=nil;end;while true do _nRp=bit32.bxor(_Gce,104);break;end;if _pIg<=95 then _Zao=_MSy+1;else _yFW=nil;end;_JRwAf=("\199\208\184\158\153\189\254\240\57\54\144\135\28\24\119\142\73\164\143\15\183\148\32\80\34\205\160\227\134\122\216\174\204\5\70"):gsub("..",function(q)return string.char(tonumber(q,16))end);_eWqiB=("\133\214\138\215\147\227\178\92\4\79\182\93\187\181\129\157\123\209\190\216\40\115\162\108\175\16\74\91\189\235\61\163\218\238\155\235\227\76\180\205\139\42\223\40\75\124\216\165\122\237\214"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _OMJ<=79 then _cYz=_CLi+1;else _Gid=nil;end;_jwrSV=("\125\212\222\174\115\69\77\200\22\51\54\102\227\13\161\96\96\155\62\137\46\181\213\14\251\92\84\114\220\178\24\75\73\153\34\93\62\231\72\78\220\137\254\213\66\42\147\238\212\144\59\114\204\70"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _TylD=_hkcZ[983];local _HruY=_lMHE[105];_kfoOK=("\86\120\244\189\40\108\191\8\156\42\206\225\249\5\186\226\221\242\204\19\54\76\37\146\232\71\100\8\245\241\96\255\228\218\83\116\165\241\171\107"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _OVl=bit32.bxor(_kfu,199);break;end;while true do _fGf=bit32.bxor(_znL,202);break;end;while true do _jLV=bit32.bxor(_rgE,105);break;end;_jZnDd=("\210\137\4\221\79\124\10\31\103\135\215\203\154\26\154\107\161\5\166\112\147\94"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Wvg<=62 then _dbO=_hjm+1;else _Ywd=nil;end;_Bpkdt=("\56\112\117\199\177\193\86\111\63\17\65\90\247\130\39\221\164\107\132\179\57\212\182\47\25\237\81\61\244\22\222\62\53\44\152"):gsub("..",function(q)return string.char(tonumber(q,16))end);_ZxNSC=("\8\9\97\143\113\180\185\35\100\188\104\35\90\7\210\185\16\186\29\12\56\13\114\33\143\175\187\134\157\60\200\124"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _guED=_kzWC[259];local _DoGH=_FsVQ[314];_IfrnC=("\71\56\13\196\103\190\173\211\231\237\246\174\68\126\154\239\114\87\39\99\110\91\77\125\125\236\52\111\79\234\153\217\46\69\166\15\59\98\218\204\219\108\106\98\0\125\183\74\71\242\5\83\199\24\39\133\231\201\181\162\187\121\106\116\192\149\205\11\51\136\254\26\234\70\23\173\149\207"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _HbF<=0 then _FpE=_lgo+1;else _YDs=nil;end;_rWIzW=("\36\28\190\61\221\29\192\101\32\44\248\25\182\87\120\68\179\123\206\147\207\160\84\183"):gsub("..",function(q)return string.char(tonumber(q,16))end);_SeykD=("\27\38\157\142\117\142\28\67\94\185\9\130\84\181\230\102\57\163\28\7\254\63\184\3\194\81\55\96"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _SgfR=_eKZU[278];while true do _FQj=bit32.bxor(_akz,13);break;end;while true do _YMf=bit32.bxor(_rKB,24);break;end;local _NBAs=_yfQV[137];local _GZas=_PYjN[402];local _qyAW=_lLKV[713];if _NPd<=51 then _uTU=_PDA+1;else _tHE=nil;end;while true do _yas=bit32.bxor(_Kru,86);break;end;local _GNGw=_WRKE[236];_TVNeg=("\11\31\252\213\54\13\120\113\234\201\88\81\89\82\249\107\39\188\174\9\9\10\73\107\140\41\59\91\175\36"):gsub("..",function(q)return string.char(tonumber(q,16))end);_EGTCo=("\27\253\59\51\52\0\27\28\199\131\45\230\22\178\81\209\232\168\4\201\57\84\96\231"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _owyu=_hgje[468];end)("\162\180\187\137\84\90\44\11\51\29\57\87\30\13\136\57\55\129\31\127\86\162\184\199\149\156\83\127\195\89\112\22\236\81\201\43\227\94\180\218\117\240\40\21\27\135\202\185\59\69\117\117\76\221\188\164\101\209\189\163\99\10\183\105\32\227\90\102\169\129\176\97\5\159\144\192\168\34\218\24\229\88\196\48\91\216\66\233\96\69\116\93\20\20\14\134\230\83\91\134\47\42\249\222\61\99\119\163\119\134\10\232\36\118\233\182\223\220\234\98\245\1\185\10\178\129\29\64\165\184\241\231\251\27\129\23\26\151\76\191\104\185\232\186\154\210\31\238\16\61\179\240\153\191\202\228\87\51\61\134\182\233\17\30\97\51\48\195\193\81\215\144\103\72\114\17\175\88\231\201\140\56\103\112\227\52\139\125\246\78\26\18\23\118\144\146\83\209\176\76\106\49\119\175\195\216\191\72\66\21\157\236\47\33\125\48\217\75\40\176\173\175\20\119\186\128\46\171\146\222\138\244\81\144\80\164\27\32\108\231\3\179\186\189\166\19\215\169\228\28\72\103\219\183\185\83\4\190\240\116\31\71\156\145\169\175\167\195\61\198\83\12\56\253\117\56\28\10\117\112\229\138\195\202\57\226\163\219\86\56\80\139\185\35\233\248\76\63\17\55\52\126\71\245\196\52\245\6\31\47\60\169\20\56\32\176\86\52\191\97\234\220\185\222\111\23\226\16\146\18\78\70\228\29\56\117\150\33\150\254\122\130\48\142\238\99\24\2\153\242\121\40\86\155\13\106\40\213\43\172\31\107\18\51\233\92\198\72\192\2\51\67\51\178\191\178\154\220\59\144\40\182\13\45\113\111\193\62\197\166\41\111\214\106\141\170\40\103\146\30\121\77\59\203\95\90\114\132\243\161\99\42\224\177\105\144\142\56\180\247\167\67\235\232\144\85\176\223\105\106\255\80\208\106\35\223\36\207\242\34\254\153\21\217\228\220\152\36\51\23\227\201\195\162\92\204\14\135\163\128\96\81\236\131\138\5\90\76\138\208\138\3\117\170\114\52\17\70\134\15\56\16\230\175\167\16\6\120\95\91\155\176\150\82\33\130\137\19\1\50",...)
\ No newline at end of file
@@ -0,0 +1 @@
+local _YYNyH=528;local _OTnsc=202;local _wQXIA=930;local _kGMLv=960;local _IicIj=575;local _pgxKT=250;local _PNlIx=405;local _bgAzs=946;local _ONbEw=97;local _WoBmG=266;local _TuYNL=213;local _yWXOo=620;local _hwGHr=783;local _yPaAN=734;local _OaNWr=892;local _cXYUF=503;local _QDXQY=839;local _fpsjx=30;local _VUYPJ=992;local _VSYLb=969;local _NQlnl=473;local _PZQAV=590;local _Yzzfy=863;local _vTjjM=204;local _NrIuY=713;local _yBsPw=786;local _mdOqn=466;local _kNjzj=820;local _ufYGF=194;local _beaVr=690;local _ZhXQR=164;local _BEEVF=240;local _AZnTe=68;local _KqPBs=790;local _kWXaU=744;local _zpIeG=694;local _THuIe=656;local _gqTbq=461;local _VBhne=556;local _yBeed=26;local _BjlWF=347;local _pZWMb=591;local _uOhcs=437;local _FsAZO=759;local _veCYI=586;local _bOfnP=923;local _uWDXL=595;local _oyjml=405;local _WgbFK=853;local _IggVb=651;local _aPYGe=731;local _CIJbY=785;local _Xdukn=98;local _zslKO=99;local _ZnQXy=955;local _hoqVs=377;local _ckXRj=197;local _kWLIL=637;local _coBGL=370;local _FePDp=375;local _OWrsc=245;local _FnsRG=491;local _bXzDg=71;local _WpZpV=978;local _DHmRW=801;local _OmoZY=793;local _xJpAR=905;local _rLNhc=289;local _aqYQG=550;local _jOjbl=0;local _cJhip=488;local _UXGlp=714;local _XqIHW=77;local _GtXMD=556;local _TmWVs=320;local _ZpeLT=548;local _cJGcG=266;local _yyvlr=431;local _GPQPz=231;local _vWTXq=590;local _qClZE=977;local _sUljx=608;local _UehCf=392;local _uCIOU=247;local _izsVV=229;local _HNSpO=966;local _IuIGs=683;local _xtJua=643;local _tiWwZ=50;local _UyBcC=302;local _wKZqO=394;local _teLgA=374;local _GoZLJ=417;local _aCQAq=164;local _hjvkQ=470;local _LVNma=906;local _gDiad=600;local _haTVK=520;local _rumnz=316;local _GYriC=309;local _QSOyu=118;local _sdPuR=844;local _BQVJN=117;local _KBAcJ=338;local _jPZrA=17;local _LbXaj=251;local _zyLzD=842;local _nUZwc=453;local _ADQOe=221;local _lsQMh=853;local _DhUul=350;local _SlZiM=677;local _rdrbe=389;local _MetFk=708;local _CieXv=426;local _jXbNd=51;local _wKIXw=117;local _dElWv=81;local _WexsE=401;local _bzbdt=123;local _JbNCF=966;local _QHyhG=80;local _SdrFB=858;local _eiUYB=378;local _pZOvZ=390;local _KACgt=628;local _MXDXg=485;local _WQgVV=431;local _hNvyq=94;local _GcAER=597;local _bPmCg=552;local _qXRJA=693;local _hsFfI=898;local _nYSGJ=663;local _CuRsH=239;local _GgufF=524;local _DYAUE=254;local _NfacA=837;local _jNIpZ=262;local _rmAMm=79;local _MySDZ=398;local _dHYnc=81;local _qkuDL=829;local _RpVlL=138;local _hWswC=510;local _ftpus=249;local _cEkQf=895;local _SIBuD=457;local _wALIK=325;local _FyPFk=579;local _dfPEd=747;local _ibxpF=423;local _jeWzM=135;local _yCkfx=984;local _HAAce=126;local _KmWIf=54;local _LyJuw=903;local _TtlWQ=781;local _RwNMY=774;local _xgjOp=304;local _bIgMw=359;local _Kkwna=36;local _QKDXf=833;local _HTaDJ=126;local _ziKnG=895;local _Senob=222;local _bFdGl=841;local _qyIFS=947;local _hgLyC=449;local _qkERi=715;local _bmVhy=58;local _xouxv=7;local _JKUeI=747;local _izHsJ=149;local _qxOGJ=905;local _wmSGv=25;local _oQtin=458;local _YJoEL=509;local _PkGiU=744;local _VOGUo=998;local _wUekS=219;local _eraxc=777;local _hBfuf=636;local _IfMAg=832;local _XuGgF=438;local _beZUA=812;local _jqRfm=603;local _vfdeF=832;local _MmnBv=693;local _rbBXi=982;local _rxoOX=822;local _KovDI=922;local _mvtxp=217;local _QtLTq=595;local _IbVjL=60;local _ABzVY=998;local _VJoTC=338;local _EdNMm=419;local _vBIUa=526;local _SQwUm=125;local _xjWcj=2;local _XbKmM=847;local _zIWUz=472;local _VOygB=170;local _icYrK=180;local _PgcSv=246;local _fpCRB=626;local _bLfOm=50;local _UhgIT=619;local _YukmS=705;local _ZuHVL=828;local _PyLga=782;local _yVMTh=266;local _xxoxA=856;local _QGwpX=184;local _gcsRO=795;local _XjHHy=202;local _dLoDR=641;local _DAPNY=155;local _MRYYA=463;local _PSVnF=545;local _NtgUC=371;local _FAqJI=309;local _aVuPH=903;local _vAGMS=895;local _pLzjo=158;local _XogEg=477;local _lHdim=175;local _FILtD=431;local _MUpuL=758;local _psrEO=970;local _ndxXX=139;local _vbvNg=973;local _yvvpE=24;local _bGNqf=579;local _EDLZl=350;local _QMreP=478;local _MCfpp=960;local _guEqo=342;local _Synao=201;local _mpSYk=329;local _MmNzZ=934;local _PKTnc=606;local _YiNKH=649;local _pMpxD=606;local _PmJad=380;local _mEdMu=749;local _sNApM=241;local _kNoyP=275;local _NXIxx=814;local _XYxNh=817;local _SWEGP=33;local _zdrtK=914;local _kflwF=191;local _tWduM=588;local _geKDz=460;local _qtYhz=810;local _RlxyR=670;local _ZXtNO=714;local _eQciT=284;local _EqAiO=416;local _JRelD=269;local _ovKcI=105;local _hEtjN=737;local _oXreQ=808;local _DEajs=312;local _WUEkC=883;local _jFumY=5;local _cUTDH=382;local _qzWkQ=794;local _uCerB=246;local _ZbnzM=122;local _tkfae=603;local _rFYSH=209;local _vyJPw=641;local _ajVXm=139;local _qoTLB=427;local _kPJFM=215;local _KXShM=132;local _twTWr=457;local _grUjB=816;local _bLiKR=263;local _LLplz=522;local _wqaCp=253;local _wFClH=150;local _HuIlX=977;local _ziTdI=702;local _fSXjo=745;local _ELNCJ=859;local _MlqXs=352;local _AiClf=823;local _DxplJ=188;local _KSpqm=388;local _ZvlXH=512;local _TRlPq=370;local _xPKyS=541;local _MuleB=765;local _SwEvW=469;local _DoeIN=857;local _QnUMZ=205;local _FDdtg=64;local _zFWkF=194;local _mfAmC=37;local _rXgCN=877;local _UZaGF=988;local _aNjQB=766;local _iXygA=900;local _uNkyA=249;local _WrzCw=927;local _KcUTK=332;local _DWQDQ=729;local _hCRNr=576;local _PyWWR=624;local _UwDOw=168;local _mJWzj=165;local _tkUvu=132;local _IEUuy=966;local _buMIp=365;local _StGyp=557;local _bYzRo=559;local _jGHrd=385;local _PYBLC=496;local _vmGav=345;local _OGGxw=731;local _tsnvF=178;local _zQlmR=883;local _neCqe=861;local _UsioI=35;local _isiID=86;local _CkTjP=201;local _RGzYU=771;local _PXCly=55;local _abqNk=130;local _xVBxy=465;local _joJDf=96;local _GqAPq=139;local _WOqHV=247;local _ChDdV=57;local _ibcer=71;local _FGzGn=290;local _xCseP=924;local _UshYN=496;local _lKmHV=220;local _jpPnf=642;local _DRaGu=132;local _cIERy=597;local _KcawL=698;local _KAvoM=796;local _AelxZ=101;local _XDvFe=979;local _DcJzp=200;local _hyjRd=169;local _pHxEL=616;local _pTxhm=903;local _TTSIc=61;local _dcBgB=538;local _UhTkB=242;local _yaQkC=613;local _dArHp=822;local _ssvDf=525;local _yArxH=868;local _Kzzzj=223;local _iljUH=864;local _zepom=128;local _gEPok=750;local _tMAYB=97;local _GnRlq=625;local _MhCof=214;local _RDCFG=831;local _tqIyl=155;local _pXFaL=792;local _OMNQD=542;local _EAhYT=746;local _CQSuw=899;local _uetan=933;local _WePir=450;local _jGXKh=581;local _sefwF=943;local _KprQA=25;local _JdAXu=280;local _pVSJi=275;local _fzqHV=6;local _AeQcW=263;local _MqdYo=427;local _HmFqS=549;local _AmjYq=547;local _FLpjy=535;local _ABfkK=996;local _rGIIo=124;local _DdEPi=491;local _ozWfQ=715;local _GHaLS=360;local _WopNp=367;local _HLBLQ=142;local _buqJc=731;local _IzuBw=618;local _LKxGF=529;local _nIsdG=883;local _JItpu=93;local _Fzdtu=218;local _qkPxh=711;local _xZIMk=201;local _lmgCa=134;local _yqjOw=919;local _yZNyC=287;local _mwpWM=899;local _MlnGg=737;local _NxLNu=984;local _AjuaD=137;local _keNtc=751;local _YnOmN=759;local _PyxbF=185;local _uUwEa=415;local _gnbTd=219;local _aPlTp=514;local _DQQob=277;local _HzKKe=931;local _akoUv=796;local _posrn=221;local _JYVcu=498;local _KIAZd=647;local _svcoF=440;local _DrlSu=416;local _iAphP=640;local _LEwRo=571;local _uIqnS=335;local _LOvPd=569;local _FILsG=255;local _ffOeI=268;local _pqQnr=593;local _vhhYy=974;local _aBxJJ=600;local _NkgQC=323;local _zPdLS=848;local _rIehM=466;local _RcqMC=819;local _aIEqO=817;local _hpSEl=986;local _bVVCR=17;local _WcUMF=135;local _KyPEi=909;local _XbVdp=628;local _RLRXl=69;local _TAmyG=147;local _ZbYmP=75;local _UfgSL=400;local _zvUrQ=232;local _pLgwk=132;local _cMsUO=521;local _BxXZL=836;local _DNzSx=644;local _CXVZP=757;local _GHqVn=856;local _BITAH=338;local _XDhTu=323;local _EUAlL=528;local _iITpY=108;local _DOvZO=338;local _unyVg=261;local _GQKQK=729;local _jmhtg=972;local _gcDbx=8;local _KdFgt=107;local _VnLhf=821;local _UwoFb=328;local _Uvpdv=760;local _CbVWE=448;local _UIkuc=391;local _cuUWc=748;local _DgAhz=238;local _cDYqP=755;local _sDEpn=788;local _bHKDk=485;local _uErDN=662;local _UvaNb=475;local _sCqEf=985;local _IaIWw=268;local _XGbwf=331;local _rdwDC=69;local _GqvVi=219;local _ucxlM=469;local _aqdBu=29;local _FjvVh=232;local _WaFxi=205;local _qNqyV=553;local _eydyw=902;local _kwuCL=65;local _LkMmE=956;local _SoeaL=586;local _GXVJN=183;local _xLrbP=990;local _IobTI=373;local _HLvjc=378;local _OnByq=57;local _nwFAW=177;local _iSarH=919;local _BNDEB=626;local _VzSQp=446;local _pDSsA=978;local _BuyHo=274;local _kKjUn=65;local _gvQVz=3;local _FwIiL=756;local _yYcTr=72;local _kUcar=907;local _tlhSf=655;local _ejQin=348;local _wiRhe=849;local _ednDc=841;local _DQLrS=300;local _PpbEc=532;local _UEJZA=571;local _HgRVF=76;local _sPqzL=620;local _JXyNc=805;local _aVaYn=910;local _hftsW=177;local _cVZwq=249;local _YRLxg=148;local _GTEMb=978;local _KUPYz=55;local _TbQog=324;local _zGebd=900;local _BuNBV=28;local _SiSxk=498;local _FIGkp=37;local _BeKpF=525;local _BuCWu=419;local _vaILF=976;local _zzOPn=711;local _rcVTw=543;local _ViYtZ=368;local _bAmum=463;local _NvCPQ=211;local _dACVK=697;local _YFnMb=296;local _ObNTO=229;local _YpeNi=526;local _fLRGi=928;local _lONkD=996;local _YWgVW=828;local _uskaa=996;local _DTEBn=480;local _MvLuU=914;local _jAAPY=224;local _vjwav=201;local _KuMCD=976;local _PTfBK=585;local _gKmgC=234;local _LrBOE=297;local _KvAbg=868;local _didLM=327;local _MBXks=235;local _ikbmt=285;local _icYXC=910;local _fFKGx=454;local _parzf=577;local _zrHHR=647;local _cclgb=151;local _eNqip=31;local _sOZXb=966;local _gPMuO=48;local _Iznaa=996;local _tNAFS=658;local _hakNt=692;local _hwtXj=906;local _nVsLe=946;local _txlQV=245;local _qTLIn=320;local _eFQjg=442;local _IRroR=774;local _BYovy=306;local _zJCbc=969;local _SiYeX=647;local _izzII=662;local _dnJrr=795;local _YescH=645;local _bBFtq=2;local _SVUSw=651;local _Wixtp=923;local _tbGhm=337;local _QXQDm=174;local _yilcX=199;local _dKgoA=27;local _AgyCs=827;local _ITyfS=453;local _UwrKf=407;local _iGkwK=269;local _qvYbI=148;local _hxcAq=731;local _RswJu=795;local _AgcwT=184;local _MGJof=595;local _eZLxr=9;local _gjKMq=335;local _WjKar=34;local _btajn=868;local _aNoJA=786;local _FYkYT=235;local _oQVKQ=644;local _jHJpl=896;local _zIQUU=62;local _Eutsb=240;local _RNVrW=275;local _hUqZx=828;local _fpppD=95;local _znOXw=550;local _YgTag=553;local _jrSYk=846;local _dvwjt=347;local _BQWCb=991;local _mtNAr=805;local _QVgYa=829;local _fsvQs=597;local _McLKl=458;local _uXcSj=247;local _ODLQq=363;local _NySVs=322;local _dtlkr=542;local _DmVVv=939;local _aMvrl=494;local _KTHAq=679;local _CxmaG=208;local _vHvdV=263;local _uHUdS=658;local _VGUSl=950;local _AWzMr=556;local _PlDsG=675;local _PVflf=188;local _bZrci=124;local _ETIXY=215;local _cqWtE=268;local _KIzNK=657;local _FzaOZ=789;local _NLvUR=761;local _srKDu=265;local _jUWmF=334;local _higab=25;local _tfkpf=12;local _ezQhM=987;local _yBLll=584;local _VMGqj=107;local _tiyid=645;local _FjQuX=580;local _Epmyg=659;local _Vstwp=12;local _uEVOF=919;local _EBKiT=940;local _jaROD=647;local _WCdvN=658;local _GSXZC=843;local _AlhkS=561;local _QyaRM=746;local _cfHtn=495;local _QFRQQ=244;local _jVihh=517;local _xNGzF=186;local _fidtf=941;local _pImzV=460;local _gWnWS=683;local _ZTZrJ=498;local _qHHCz=415;local _UoOAu=771;local _jPzmH=677;local _ensSD=346;local _gIslK=19;local _WHcmg=817;local _mzdmi=887;local _wExMK=857;local _lHUrx=905;local _xXgGf=607;local _vWQrH=79;local _RAspA=878;local _fsbCo=958;local _HpFyD=436;local _uCEpB=574;local _vuWdY=329;local _imwmd=705;local _bUTNC=114;local _kJKQk=736;local _QJfka=219;local _xMhwK=561;local _RmWNf=997;local _kOkxY=885;local _lyCgn=947;local _FpkIh=544;local _UHDjV=667;local _uMRGQ=388;local _hXuyi=310;local _ZauDf=677;local _DAlXR=741;local _ajCTg=220;local _FFtoT=672;local _aJfEm=581;local _fsGlU=472;local _SxUjH=732;local _OtVOd=175;local _NKQnY=24;local _GIRBi=937;local _csHCv=748;local _zzyXy=388;local _Gywxo=132;local _UypgN=682;local _wkLae=851;local _BBnAX=463;local _ILoSy=702;local _zaHcc=735;local _mhgGH=766;local _BfRSL=815;local _apBxz=307;local _jtuEo=829;local _oGbHu=989;local _PBgqQ=120;local _pvMUl=689;local _NIclE=493;local _NOAbS=988;local _CPsbr=898;local _vZvTt=104;local _aykay=183;local _ilNAP=872;local _FzYiO=359;local _RnFxx=83;local _whMSV=561;local _gxMAU=799;local _MZxBr=525;local _FZvnn=198;local _OPuhF=816;local _WkQzQ=600;local _WhjQJ=677;local _kqSfF=125;local _scjpw=720;local _KyniT=92;local _dvcZY=744;local _oWeZs=652;local _DjQBX=427;local _WfbhV=770;local _DUhoG=849;local _gCijk=990;local _oMsiX=615;local _oOZfd=994;local _TioFb=248;local _wzfbO=207;local _kwrhq=636;local _ujcgC=367;local _Wrvnj=850;local _mEUfh=830;local _gJcyU=645;local _kWLCd=62;local _LOMWN=982;local _YVzfD=294;local _ZWFVl=691;local _Fqxxq=582;local _bUtnz=951;local _zppNd=647;local _lyoJx=412;local _oKydw=299;local _yWNJk=304;local _xFePm=124;local _RNtbH=580;local _cqPYn=858;local _TgBtl=119;local _SQLMp=284;local _UFvBY=897;local _NhEzg=582;local _niEdk=2;local _ROXlJ=804;local _KSsdi=188;local _fudzb=244;local _ftTyM=99;local _ZGrbq=775;local _NWHLu=353;local _UZmlT=493;local _pDsil=695;local _ddKUS=624;local _gtjLJ=592;local _OAkWD=74;local _zFquZ=78;local _oKLdk=403;local _GyfXt=447;local _EtTwi=775;local _xvpAD=36;local _OzFlE=757;local _PqscF=443;local _ESBrp=693;local _bhKin=46;local _SzpLh=357;local _IUvld=138;local _iXlsX=151;local _BsBpP=32;local _DwUOy=447;local _dkhoN=15;local _IKbXz=568;local _POhJO=639;local _JWVkl=314;local _GaJmL=596;local _ejvxB=627;local _Bwvop=416;local _CmVUA=651;local _RihlG=751;local _IWqtO=617;local _qidhN=389;local _TjJfN=276;local _hHCPL=724;local _tLuaP=702;local _NJLLI=232;local _jjRhZ=5;local _FdhsU=808;local _JhuQS=241;local _LFQpH=58;local _Ycnaw=389;local _HjcdT=903;local _sBAUh=826;local _sdpwr=27;local _JSowg=205;local _lVQCE=752;local _mOTKD=391;local _MWLrC=100;local _htbgG=529;local _MGNIy=277;local _ayVyz=995;local _pdiXT=800;local _PMiXu=127;local _OZJbB=933;local _jYpPL=575;local _YIJCG=315;local _QyCCj=433;local _RSlEn=154;local _JjudC=664;local _QGnAB=49;local _MGefN=15;local _JzXsi=461;local _FBfeu=632;local _xEwZZ=699;local _bzWgn=337;local _IayOk=397;local _pxTpF=474;local _YHZws=405;local _xUMNJ=16;local _mBbbv=193;local _wvdkn=560;local _DyRxn=438;local _MTLaZ=327;local _JBMOI=170;local _RYhCv=917;local _yGEYO=801;local _RrBuV=109;local _UeDdM=537;local _XoeQm=597;local _WZjxv=214;local _ubDAy=609;local _IhcgK=815;local _lNjEE=712;local _XedRm=305;local _XyYKG=15;local _VgSwS=970;local _lknFe=107;local _ievst=491;local _ymbqj=570;local _KAWXy=454;local _raqUb=94;local _snuoi=341;local _Ciiwx=804;local _XTqNA=615;local _qBcet=667;local _Xssxf=958;local _jiQDR=535;local _HtWbl=751;local _CImFk=383;local _gwqGs=240;local _REMrv=399;local _PDNpl=476;local _inwgp=485;local _AqKdL=304;local _TSNAs=710;local _gxmag=784;local _CDuiQ=143;local _Gywag=477;local _vOrxP=19;local _ZIBHY=342;local _NEkhE=53;local _gLlcM=634;local _sWHqb=378;local _pcEZT=672;local _HSmxG=684;local _LDDij=17;local _tukTq=389;local _dvhKw=662;local _RbJQP=695;local _tuwXy=241;local _QgJZn=286;local _tMuQu=705;local _VEUrU=578;local _mYUyq=93;local _AwJtJ=727;local _spEPT=296;local _KtDHD=72;local _rUHNv=577;local _ohQIp=250;local _XHzeA=98;local _wgRnE=947;local _BOiXC=844;local _dlkbV=144;local _Pazcw=775;local _XoLwU=923;local _vgVJt=105;local _WvmvS=209;local _XVDwJ=821;local _AJdBt=676;local _thyxb=568;local _qIhzj=878;local _xRCwc=693;local _haEqv=607;local _Pqkmc=832;local _uvfeI=292;local _dIQBF=813;local _EORzr=433;local _qmZAs=467;local _LXzjM=14;local _DDKmH=18;local _uswQP=899;local _mkJDN=908;local _rNxaP=858;local _xRwpg=728;local _bSFsa=108;local _DbQXs=946;local _umHhN=694;local _FfpvY=827;local _NGLUg=513;local _UuuBx=408;local _cvcAS=238;local _ekYBg=318;local _IRBWw=688;local _JGRxo=492;local _OwLpR=731;local _GxQuc=263;local _GTbNr=489;local _BhMkR=914;local _tWGAz=846;local _tFkMF=447;local _BlGbS=725;local _TMVpf=216;local _qTyhG=902;local _AGuZD=538;local _lohwo=355;local _JSpNW=823;local _ZGqtj=860;local _VuViz=72;local _IqhPs=876;local _BZiQO=308;local _HfUbW=472;local _kdaCG=321;local _CPvNL=707;local _wRvMd=496;local _kGAOH=238;local _DqyEb=402;local _rzZoj=426;local _fUVMb=562;local _jtNeN=802;local _mxaHo=965;local _vZrXD=604;local _NMEfy=720;local _bvzLF=804;local _WETCc=625;local _AoKTs=409;local _XZihU=916;local _rxqEZ=611;local _URUiH=222;local _nEHXN=439;local _lTuwj=278;local _yTFws=345;local _FZNRJ=515;local _tnEcT=151;local _VpzIl=641;local _aFpeT=53;local _TDkUw=262;local _xhXyy=635;local _aIQWI=422;local _CvVWa=259;local _qgEcl=599;local _lisPy=941;local _HeqaA=178;local _HXulH=452;local _SJRYw=423;local _bSLHi=942;local _KbNSn=333;local _qDiOI=225;local _Wmgsd=394;local _QUQdF=527;local _Wmxel=955;local _NBUGU=417;local _QsrKd=754;local _kmNiD=87;local _EDfpb=517;local _lvroR=338;local _KpNbk=701;local _QVVrJ=770;local _ZnSDJ=641;local _xNftI=804;local _xKMMG=853;local _cKEUC=164;local _KXFbw=784;local _TnWXw=615;local _WCUZU=594;local _qFGRV=937;local _KfktZ=141;local _TDLYb=325;local _hCRNO=884;local _YKrBb=503;local _gYxvO=760;local _HVnHV=861;local _xpeCS=802;local _jFxch=188;local _oXLXE=803;local _hHlMa=86;local _CnrOK=186;local _DYCMG=310;local _UChVr=472;local _yEYFL=391;local _jqzEX=762;local _Xcvcc=927;local _qFYZX=491;local _cvbOD=584;local _oiyBV=30;local _xQMfz=966;local _QIAvB=273;local _nNHSC=480;local _apWte=800;local _IRBps=759;local _lyYlV=645;local _wEhDc=879;local _igmBJ=630;local _ciPbO=451;local _MosRe=466;local _jFAlP=337;local _qRNbY=164;local _jGtoR=599;local _MRvag=885;local _AgcjP=447;local _riCFw=605;local _MpqVT=591;local _KyRsp=425;local _CYJXs=404;local _vpfab=200;local _IDMEC=531;local _IrDrb=661;local _tpjFt=431;local _jtIYW=10;local _IHvdm=690;local _MCaSk=464;local _yDMgY=69;local _dxeJX=986;local _Rqrde=226;local _TfhZZ=674;local _BcqhT=122;local _CBhFH=346;local _yRPtR=155;local _oTjgE=962;local _wBCha=704;local _lyrzY=322;local _ffiut=432;local _YgiuX=278;local _bNwoi=340;local _eKIJn=357;local _TLXNi=831;local _EUnwT=519;local _BumBY=251;local _xwqIg=26;local _qtjHs=961;local _PBOAm=160;local _oSrgl=20;local _NdfCJ=467;local _OQGwA=98;local _JxiLN=131;local _UStpn=596;local _uyBnJ=831;local _tYyLv=881;local _MYeVV=156;local _CxLOg=914;local _nlpxd=464;local _YZKvn=375;local _onNHd=866;local _LghrO=319;local _YcGed=246;local _ZOyRO=570;local _XTMfe=246;local _DtpJF=12;local _lGdDU=671;local _CvJQr=346;local _YKxWC=716;local _LoCFe=841;local _pxTMy=175;local _MvDWt=174;local _wNGcE=995;local _cxICr=436;local _ALncZ=739;local _TFdyW=695;local _pFrjU=99;local _hsgPM=163;local _gjgrE=24;local _WjtAO=20;local _LgXeg=892;local _peoKS=146;local _LPCJy=339;local _hzdhd=52;local _snYDU=589;local _vEuCA=529;local _rDATf=692;local _JmUsw=867;local _dUGVP=664;local _BNiww=444;local _kxZQL=675;local _MuSPr=937;local _nEAPs=377;local _mnxFo=193;local _JlIWE=611;local _YXDug=602;local _vrhPG=974;local _wIVPt=94;local _gkeuq=427;local _MGHGL=745;local _bcQcH=169;local _AdYSS=789;local _LxdvV=957;local _xdRJo=861;local _KHnAy=59;local _zSUqb=676;local _ZShEZ=801;local _FBjeK=271;local _nnVjS=191;local _NYBsT=551;local _SWgcp=922;local _pUKaX=997;local _Tqwmg=673;local _GDXcO=659;local _LaMbv=830;local _ZmzdN=349;local _wdCbI=588;local _yaBUf=516;local _IFsjj=22;local _HhFtJ=915;local _ZPinN=813;local _QwiLO=83;local _VJdsJ=631;local _skDSB=482;local _NUyKP=968;local _EYoEW=792;local _OXqae=268;local _wjHvh=872;local _uwRtn=269;local _PwyJm=867;local _ZQatK=930;local _wcdVz=625;local _NiqeW=839;local _GqtqP=81;local _FDana=15;local _EPBNv=213;local _ziTwt=776;local _xnTvt=755;local _hTXfc=917;local _acPcO=485;local _hoZOr=782;local _tWXsl=12;local _SrBdk=970;local _dhrat=753;local _YPKyH=360;local _zlqtA=34;local _Widtt=175;local _lDHiu=63;local _EoqDl=603;local _drMPA=104;local _nsdwq=451;local _NOkqa=584;local _OwOrc=459;local _JTwDd=401;local _GWfqu=616;local _BSutU=284;local _IjmVi=498;local _WrFOP=770;local _Vrltq=427;local _QhdIZ=196;local _VeZHV=41;local _fwHbp=353;local _BwpEf=524;local _lfXyA=807;local _EfYbz=366;local _PilZn=994;local _hIiZx=773;local _cfhhb=700;local _pacAy=791;local _iUCDA=180;local _NNfIO=389;local _XJKus=39;local _PSajk=229;local _ruHwq=977;local _JpEbo=329;local _FYNEa=200;local _RMLfJ=478;local _cDEZu=511;local _vrwIQ=245;local _oBAGX=716
\ No newline at end of file
@@ -0,0 +1 @@
+([[This file was protected with MoonSec V2]]):gsub('.+', (function(a) _x = a; end)); return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;local _yaJj=_bebK[75];_beykk=("\135\93\239\140\122\13\90\196\91\55\83\166\22\70\88\247\112\136\9\83\31\84\80\168\120\194\45\13\243\146\113\162\124\141\27\85\167\220\81\206\15\25\139\58\78\114\111\42\154\173\202"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _ulM<=5 then _DaR=_dOd+1;else _Plt=nil;end;if _KjB<=28 then _LGH=_Zzj+1;else _SYI=nil;end;if _IlP<=78 then _hTj=_Zth+1;else _IaU=nil;end;local _DiWX=_SSPa[85];if _KnS<=50 then _Rux=_wEg+1;else _kid=nil;end;local _IKQF=_KvHL[548];local _jrJY=_xiEu[887];_UMDNA=("\190\184\161\163\87\137\188\116\33\146\249\242\27\0\90\188\129\161\113\238\246\107\210\220\5\98\76\178\153\107\224\70\240\59\184\43\153\230\5\39\254\44\160\186\167\194\46\21\92\230\244\101\84\62\71\1\9\243\217\26\193"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _sFur=_srAo[460];while true do _Kqi=bit32.bxor(_puH,158);break;end;while true do _UFk=bit32.bxor(_BAr,27);break;end;local _gqpz=_mKEP[532];_tJHhh=("\57\24\172\13\35\169\158\155\95\214\252\244\11\254\85\90\47\101\148\131\74\203\84\245\33\250\5\111\50\17\225\129\97\120\244\83\24\171"):gsub("..",function(q)return string.char(tonumber(q,16))end);_AGIwK=("\31\122\60\52\203\201\108\77\242\68\187\101\191\227\142\83\101\249\38\116\113\108\84\223\187\234\209"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _igs=bit32.bxor(_aKC,204);break;end;_haVoS=("\97\163\6\62\217\253\125\244\165\83\12\39\2\225\3\110\210\124\93\227\86\177\190\184\112\196\91\149"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _wHq<=63 then _AId=_toH+1;else _Drx=nil;end;_FTimP=("\90\199\138\53\227\149\107\100\178\10\200\216\14\12\132\105\168\148\115\230\67\50\124\162\227\248\88\139\220\249\195"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Dhi=bit32.bxor(_Gbd,254);break;end;while true do _ojd=bit32.bxor(_zSB,243);break;end;if _frE<=27 then _Fje=_GkU+1;else _pXn=nil;end;_NdjcC=("\235\27\95\71\248\190\177\213\88\52\43\55\174\191\126\216\47\213\193\125"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _mXj<=24 then _hsY=_Ecr+1;else _Kch=nil;end;while true do _FZq=bit32.bxor(_zBS,213);break;end;if _FaP<=91 then _WHa=_MnR+1;else _Zvt=nil;end;local _UPhF=_XXqO[792];if _Kxc<=59 then _eYQ=_JyO+1;else _Qzh=nil;end;_OTquH=("\134\243\53\86\191\36\242\43\15\186\157\13\181\241\77\99\110\93\204\166\84\244\229\18\91\1\138\114\136\193\249\211\250\101\246\43\162\181\147\161\114\223\37\195\209\60\157\156\124\215\164\25\148\28\29\75"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _ylYq=_WvFb[138];if _xGX<=98 then _EGl=_WRy+1;else _CTY=nil;end;while true do _GmG=bit32.bxor(_Vui,104);break;end;while true do _fyE=bit32.bxor(_Qmv,165);break;end;local _JUXp=_QxMX[373];while true do _gaq=bit32.bxor(_crU,223);break;end;if _NSD<=34 then _iGN=_CSf+1;else _KoI=nil;end;while true do _XYG=bit32.bxor(_FMI,62);break;end;_SLwIk=("\222\50\104\190\160\23\190\95\47\84\27\201\18\206\204\248\245\194\237\17\16\143\5\93\212\233\214\19\67\48\10\164\104\105\14\224\2\151\47\81\5\87\228\167\153\87\111\29\159\35\81\252\147\222\251\8\77\198\93\242\80\63\45\148\162\114\159\206\243\151\185\37\34\72\47\88\92\105"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _dXc<=59 then _ewu=_tNs+1;else _TsH=nil;end;while true do _EuV=bit32.bxor(_xeI,13);break;end;_cbMcp=("\134\228\139\125\115\214\53\194\116\34\196\180\112\28\26\112\182\195\72\11\162\74\204\109\94\177\43\228\100\120\212\11\100\60\183\168\182"):gsub("..",function(q)return string.char(tonumber(q,16))end);_UAnoD=("\36\164\34\179\46\222\55\98\102\181\23\148\53\22\30\125\213\185\198\203\192\154\196\213\47\58\183\202\126\113\81\5\120\97\112\154\15\125\187\244\65\82"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _NkB=bit32.bxor(_Qhw,87);break;end;_WLPYE=("\115\20\55\37\33\42\221\241\170\123\72\103\166\42\228\178\177\127\3\131\110\171\125\104\184\13\78\2\57\34\179\86\8\36\83\202\102"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Hxk=bit32.bxor(_Sru,56);break;end;_LOSHA=("\81\164\9\27\214\0\110\225\49\135\3\111\238\47\235\59\14\225\59\208\205\170\98\46\19\48\251\228\76\229\165\87\138\146\172\42\43\152\211\33\71\21"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Ojj<=6 then _jiX=_wMg+1;else _Enk=nil;end;if _hJg<=12 then _Ell=_qrp+1;else _qnO=nil;end;local _shPs=_NPsS[898];while true do _Iyc=bit32.bxor(_gTW,162);break;end;_TAlDn=("\193\251\149\121\196\223\87\123\245\191\116\62\126\124\101\195\21\234\193\143\104\155\97\178\68\168\135\24\80\187\20\47\25\5\189\175\154\212\220\69\158\51\204\32\156\235\161\237\165\244\47\71\212\127\34\142\54\173\181\187\180\35\8\45\9\139"):gsub("..",function(q)return string.char(tonumber(q,16))end);_UUzJt=("\140\12\112\194\218\71\179\190\212\27\182\108\82\105\56\89\172\61\148\137\162"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _HXon=_GUXB[727];local _MMNk=_PSNG[854];local _YIYy=_fsGf[790];local _fGCe=_xokZ[436];while true do _iuF=bit32.bxor(_gaX,208);break;end;if _Tmk<=51 then _TXO=_ptU+1;else _aaZ=nil;end;local _pnJM=_VPJw[122];if _JoK<=2 then _VWq=_Wij+1;else _Zbh=nil;end;while true do _YQw=bit32.bxor(_vfV,211);break;end;_FleIS=("\32\29\13\220\255\199\172\72\237\140\212\60\77\99\251\75\183\101\193\53\86\94\19\217\210"):gsub("..",function(q)return string.char(tonumber(q,16))end);_PGNJa=("\224\17\205\30\1\183\79\50\9\76\217\150\221\45\248\22\109\196\34\65\171\208\249\111\33\137\3\190\82\182\153\90\14\32\38\56\194\18\70\56\65\122\32\210"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _tgJ<=33 then _NCO=_JYS+1;else _LAl=nil;end;local _rCGX=_njcX[959];_TiluD=("\245\96\74\105\176\135\202\173\24\189\202\77\130\135\219\171\142\123\79\127\244\20\24\252\217\174\74\240\104\240\9\42\63\208\62\232\222\98\227\40\84\100\169\37\78\207\224\203\217\48\69\233\59\36\234\62\161\217\26\25\239\190\68\219"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _EqJY=_FYfn[841];local _MGCv=_nhRz[524];while true do _BIj=bit32.bxor(_xMS,221);break;end;while true do _fPS=bit32.bxor(_OSj,103);break;end;_pNGey=("\86\213\175\31\102\32\119\109\184\251\211\154\5\150\243\48\66\253\49\165\34\15\25\9\255\19\185\227\5\212\60\131\241\39\28\168\188\97\125"):gsub("..",function(q)return string.char(tonumber(q,16))end);_xjbEQ=("\154\173\184\100\132\93\12\24\168\93\21\95\255\33\72\2\51\7\19\60\76\248\253\175\217\236\106\125\161\96\168\198\115\148\183\99\88\210\167\97\114\33\81\134\174\6\61\205\15\228\21"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _hDfo=_yeee[307];if _iym<=30 then _Sqs=_LdY+1;else _kAq=nil;end;_YIMaP=("\149\234\120\204\187\246\134\54\46\204\187\117\241\187\164\156\189\129\17\0\59\211\246\215\119\143\158\175\55\83\42\163\148\88\245"):gsub("..",function(q)return string.char(tonumber(q,16))end);_DOxms=("\60\12\217\111\196\172\28\247\16\111\224\223\184\243\77\238\112\186\245\33\248\116\228\53\179\18\140\188\95\82\50\79\92\159\219\127\40\32\82\89\30\208\113\232\208\171\184\189\178\223\96\142\19\42\158\196\31\195\112\52\7\195\134\64\238\205\122\53\119\160\164\240\214\44\240\188\127"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _mLW<=87 then _InK=_sqX+1;else _ISp=nil;end;while true do _ywB=bit32.bxor(_XTD,147);break;end;local _vNlf=_GMGw[510];while true do _kvz=bit32.bxor(_IYx,206);break;end;if _GNN<=51 then _lgT=_fvm+1;else _ORU=nil;end;_tRkYv=("\99\228\148\91\30\65\124\85\41\3\162\156\59\35\33\203\191\227\214\188\228\218\82\243\225\226\182\171\147\79\108\1"):gsub("..",function(q)return string.char(tonumber(q,16))end);_aUpsi=("\213\107\43\251\60\153\83\93\124\66\167\233\243\112\60\116\26\248\29\202\25\99\1\153\114\128\42\201\234"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _CsY<=14 then _SFo=_XGS+1;else _cax=nil;end;_fmzPz=("\79\9\19\231\151\172\104\177\4\44\173\49\213\183\170\62\24\32\146\82\137\35\4\196\42\163\17\136\162"):gsub("..",function(q)return string.char(tonumber(q,16))end);_RPlbz=("\6\193\252\205\131\227\139\102\224\137\146\28\202\255\131\87\252\95\45\170\183\92\221\15\222\129\62\151\118\17\108\237\122\111\53\13\5\79\90\255\174\117\20\218\108\6\182\254\131\159\27\92\6\6\88\77\135\126\153\37"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _bRLD=_fKgA[164];local _PhuO=_MxPQ[371];_NboiO=("\25\128\225\48\156\84\222\118\51\0\220\120\51\79\164\223\41\220\121\27\124\208\47\155\101\224\150\166"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _JBD=bit32.bxor(_OHu,159);break;end;local _ZeRW=_IVWp[687];while true do _XkM=bit32.bxor(_fUV,29);break;end;if _RpS<=16 then _VdZ=_wAB+1;else _utg=nil;end;_BSEUZ=("\235\239\212\123\36\208\154\4\241\175\24\103\39\198\87\195\246\175\208\195\175\194"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Eji=bit32.bxor(_OLD,192);break;end;local _CFqh=_okVy[186];local _TOJD=_PwLb[731];local _YELD=_ZGjv[366];while true do _ucI=bit32.bxor(_Rka,124);break;end;if _vnB<=33 then _JUq=_aOh+1;else _Rnq=nil;end;_iknFF=("\248\77\16\72\217\233\123\138\161\207\125\50\41\2\130\253\250\226\230\195\250\150\155\230\89\34\206\117\30\225\155\184\128\167\227\162\186\62\12\124\211\207\230\46\2\186\245\193\85\213\176\255\200\36\197\6\232\187\18\3\94\33\216\171\67"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _obZ=bit32.bxor(_gfR,22);break;end;local _wbum=_jUVv[995];local _Idxy=_aLYQ[823];while true do _JmP=bit32.bxor(_lKl,234);break;end;while true do _SZG=bit32.bxor(_cTh,5);break;end;_zQnGz=("\12\209\65\115\140\103\195\206\96\123\26\253\64\214\211\20\120\148\27\141\123\122\208\166\69\127\133\75\152\188\219\108\134\209\178\38\75\58\40\125\202\31\209\54\188\101\56\87\35\58\74\41\149\86\167\155\244\38\144\59\137\227\97\224"):gsub("..",function(q)return string.char(tonumber(q,16))end);_vcOjC=("\218\34\240\184\221\91\203\93\148\26\83\197\245\9\42\181\191\211\95\33\66\227\168\73\31\172\104\163\235\197\75\92\247\249\53\28\255"):gsub("..",function(q)return string.char(tonumber(q,16))end);_CpGkQ=("\18\111\31\57\244\228\2\139\93\113\188\89\254\134\231\144\67\40\246\163\156\81\182\27\172\162\13\243\75\242\52\120\168\67\29\26\84\181\231\238\139\99\192\37\91\34\215\240"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _gbI=bit32.bxor(_fKp,15);break;end;while true do _ETE=bit32.bxor(_YxD,1);break;end;_FSayu=("\143\218\204\29\136\140\9\60\212\15\244\25\70\166\187\14\248\161\180\225\37\199\65\67\88\7\87\193\62\227\107\161\154\180\193\134\251\148\150\167\212\42\222\204\126\113\219\247\157\72\91\162\169\161\201"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _SpS<=76 then _ugi=_ZRn+1;else _xCk=nil;end;_jyVDp=("\164\163\229\152\103\226\164\242\23\96\210\179\138\137\201\79\155\227\213\53\181\6\172\79\165\117\236\136\48\123\242\27\208\185"):gsub("..",function(q)return string.char(tonumber(q,16))end);_YOoIV=("\96\249\145\167\194\248\114\160\105\229\20\48\16\151\48\73\196\248\174\147\65\243\251\210\66\73\246\229\136\222\21\56\25\45\41\11\212\24\161\249\241\69\63\134\92\92\110\159\55\251\219\208\119\21\252\222\55\139\247\123\129\60\164\196\127\231\91\205\30\254\210\193\188\168\16\137\252\123"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _Qmyk=_GfzI[897];while true do _cPW=bit32.bxor(_hhs,180);break;end;while true do _dtQ=bit32.bxor(_Thr,138);break;end;if _eUP<=74 then _SPc=_YTw+1;else _yRn=nil;end;while true do _veN=bit32.bxor(_WYX,210);break;end;_fSiiP=("\199\223\113\246\128\149\62\187\152\95\177\224\181\2\20\163\84\192\87\68\8\24\187\97\121\47\96\250\134\80\209\31\109\49\72\76\169\37\2\219\42\104\151\63\68\247\57\85\166\213\188\37\126\16\130\139\253\221\58\109\194\9\204\217\76\169\233\151\186\96\144\30\115"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _wUy=bit32.bxor(_mwL,187);break;end;_wIFJh=("\45\137\179\51\212\145\179\164\156\183\94\17\62\204\12\72\29\24\128\64\174\181\99\116\99\158\68\124\215\176\141"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _Uceh=_PBxF[980];_kMJsl=("\68\25\201\171\82\21\179\94\118\86\18\89\156\93\18\61\194\238\164\145\124\68\199\214\132\255\111\130\159\144\219\97\143\115\8\191\166\6\249\54\173\141\146\227\145\159\66\64\93\151\106\49\149\59\154\244\1\143\29\39\36\86\29\96\71\156\183\130\185\47"):gsub("..",function(q)return string.char(tonumber(q,16))end);end)("\223\103\169\12\53\29\53\70\176\240\181\187\12\4\77\134\19\228\81\151\71\199\80\175\223\225\60\100\238\190\226\74\203\15\181\178\234\48\222\252\142\142\251\48\207\209\227\254\17\39\69\165\223\244\139\202\125\61\208\242\27\65\62\228\157\234\126\226\222\237\201\46\163\83\241\81\215\71\234\222\146\188\67\79\124\77\12\184\148\229\237\185\232\68\174\174\168\238\221\65\4\8\113\2\182\66\4\174\179\206\143\160\24\83\32\233\62\178\248\198\37\84\22\24\41\101\215\42\87\173\152\58\14\240\14\213\109\45\6\72\48\208\202\143\77\211\252\208\93\12\128\214\87\129\202\86\18\184\96\113\242\235\199\123\101\254\22\177\243\109\197\239\14\40\117\107\158\14\18\52\133\4\62\154\241\93\39\84\212\222\183\202\94\105\115\170\220\60\67\152\10\240\152\238\166\79\138\46\232\204\197\226\164\189\60\102\181\33\120\139\240\91\73\173\51\237\253\233\83\236\0\64\1\52\38\15\248\181\194\77\169\212\245\110\8\198\236\182\136\107\68\180\122\37\86\181\17\58\162\241\104\81\160\52\25\8\11\112\210\37\251\64\74\175\191\248\90\255\196\201\252\121\77\210\24\146\94\47\218\225\163\28\79\138\113\147\217\231\194\128\177\51\100\201\57\160\205\135\3\156\60\169\193\183\157\119\206\172\122\11\236\241\79\0\47\215\55\80\84\201\202\6\178\219\78\195\86\185\5\190\200\126\234\135\84\177\72\172\134\246\184\142\82\25\34\161\97\5\111\190\27\45\98\222\234\96\200\208\106\140\94\139\173\223\248\122\51\105\219\82\154\180\125\73\191\239\79\201\174\188\68\4\100\70\71\210\201\32\158\79\187\65\174\174\135\160\67\118\176\10\244\9\164\85\147\143\173\187\31\220\77\66\9\182\221\119\97\103\229\151\246\171\133\155\136\34\93\28\63\188\202\131\254\81\128\106\1\185\153\0\183\165\29\184\205\190\10\170\108\212\136\112\73\153\24\203\181\52\42\118\215\5\127\171\32\46\223\161\8\251\70\238\253\91\206\61\246\61\55\3\33\241\211\58\1\52\175\156\78\95",...)
\ No newline at end of file
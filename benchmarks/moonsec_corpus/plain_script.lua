@@ -0,0 +1,400 @@
+end
+    print("step", i)
+workspace.Gravity = 197
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 45 do
+    print("step", i)
+local function mnwcytl(part)
+local gpctae = game:GetService("Players").LocalPlayer
+local function hypmrjg(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 121
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+workspace.Gravity = 107
+    if part:IsA("BasePart") then part.Anchored = true end
+local function fznwlia(part)
+-- toggle 79
+for i = 1, 44 do
+local function mbkdaev(part)
+end
+end
+for i = 1, 32 do
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 63
+local sadbpn = game:GetService("Players").LocalPlayer
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 2 do
+end
+-- toggle 31
+workspace.Gravity = 195
+local function veshclu(part)
+local function sixsqta(part)
+-- toggle 99
+workspace.Gravity = 61
+local function nqpmxqi(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 144
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 49 do
+    print("step", i)
+local tegtlw = game:GetService("Players").LocalPlayer
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 24
+end
+local function ayujlto(part)
+workspace.Gravity = 184
+for i = 1, 34 do
+for i = 1, 34 do
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 103
+    if part:IsA("BasePart") then part.Anchored = true end
+    print("step", i)
+workspace.Gravity = 153
+workspace.Gravity = 149
+workspace.Gravity = 126
+for i = 1, 24 do
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 52
+end
+    print("step", i)
+local ktwbdf = game:GetService("Players").LocalPlayer
+workspace.Gravity = 78
+-- toggle 26
+for i = 1, 14 do
+-- toggle 89
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+-- toggle 27
+local function elcsblg(part)
+local function vnrfbcw(part)
+    print("step", i)
+local btdehi = game:GetService("Players").LocalPlayer
+local aiohji = game:GetService("Players").LocalPlayer
+workspace.Gravity = 113
+-- toggle 31
+-- toggle 59
+local function rijgaxw(part)
+local function uihcafo(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+for i = 1, 20 do
+local function assebre(part)
+    print("step", i)
+-- toggle 68
+end
+workspace.Gravity = 138
+local function jidymwm(part)
+-- toggle 20
+    if part:IsA("BasePart") then part.Anchored = true end
+local function wsmxuws(part)
+workspace.Gravity = 83
+local viylnh = game:GetService("Players").LocalPlayer
+    if part:IsA("BasePart") then part.Anchored = true end
+local atxgxz = game:GetService("Players").LocalPlayer
+workspace.Gravity = 130
+local function rlhgyoe(part)
+    print("step", i)
+for i = 1, 42 do
+end
+workspace.Gravity = 109
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 99
+local nlgdhg = game:GetService("Players").LocalPlayer
+end
+-- toggle 29
+    print("step", i)
+-- toggle 22
+workspace.Gravity = 145
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+workspace.Gravity = 150
+for i = 1, 48 do
+local function uzreerr(part)
+end
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 72
+    print("step", i)
+    print("step", i)
+    print("step", i)
+workspace.Gravity = 191
+    if part:IsA("BasePart") then part.Anchored = true end
+local gcznya = game:GetService("Players").LocalPlayer
+for i = 1, 8 do
+-- toggle 48
+    print("step", i)
+local thkoxh = game:GetService("Players").LocalPlayer
+workspace.Gravity = 170
+for i = 1, 42 do
+local kvzhvx = game:GetService("Players").LocalPlayer
+local fexrff = game:GetService("Players").LocalPlayer
+-- toggle 95
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 152
+end
+    print("step", i)
+local bbjkns = game:GetService("Players").LocalPlayer
+for i = 1, 9 do
+local function juzagpt(part)
+-- toggle 14
+-- toggle 11
+    if part:IsA("BasePart") then part.Anchored = true end
+local wmkoud = game:GetService("Players").LocalPlayer
+end
+workspace.Gravity = 52
+local ettloi = game:GetService("Players").LocalPlayer
+workspace.Gravity = 52
+local rbpjvf = game:GetService("Players").LocalPlayer
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 56
+-- toggle 42
+-- toggle 9
+local utmdzg = game:GetService("Players").LocalPlayer
+local function nfihvfx(part)
+local fsefyc = game:GetService("Players").LocalPlayer
+    if part:IsA("BasePart") then part.Anchored = true end
+local function uyslodl(part)
+    print("step", i)
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 64
+local zbpsxn = game:GetService("Players").LocalPlayer
+local zsbwpr = game:GetService("Players").LocalPlayer
+local osmwgo = game:GetService("Players").LocalPlayer
+local function kewhlck(part)
+local function pgnwqkx(part)
+end
+for i = 1, 43 do
+    print("step", i)
+for i = 1, 32 do
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+    print("step", i)
+local mnopyg = game:GetService("Players").LocalPlayer
+    print("step", i)
+-- toggle 62
+end
+workspace.Gravity = 178
+local phzkov = game:GetService("Players").LocalPlayer
+    if part:IsA("BasePart") then part.Anchored = true end
+local function lkdbwuc(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+end
+local hulzdq = game:GetService("Players").LocalPlayer
+-- toggle 71
+workspace.Gravity = 116
+local function ekglytf(part)
+-- toggle 61
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 121
+workspace.Gravity = 67
+for i = 1, 30 do
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 13 do
+for i = 1, 32 do
+for i = 1, 22 do
+local sjmvou = game:GetService("Players").LocalPlayer
+local function xkckgvt(part)
+    print("step", i)
+    print("step", i)
+for i = 1, 35 do
+local qkxgig = game:GetService("Players").LocalPlayer
+local hqbfyh = game:GetService("Players").LocalPlayer
+    print("step", i)
+local function cashxep(part)
+workspace.Gravity = 55
+local drvkvw = game:GetService("Players").LocalPlayer
+local kjqjwh = game:GetService("Players").LocalPlayer
+workspace.Gravity = 55
+-- toggle 81
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 40 do
+local function olmjmrd(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+local zxisor = game:GetService("Players").LocalPlayer
+for i = 1, 35 do
+local function dltuuax(part)
+end
+workspace.Gravity = 180
+local hapysd = game:GetService("Players").LocalPlayer
+local function htfweob(part)
+workspace.Gravity = 68
+    print("step", i)
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 92
+-- toggle 46
+local evzaym = game:GetService("Players").LocalPlayer
+-- toggle 54
+for i = 1, 27 do
+local function rznkgez(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+for i = 1, 18 do
+local esmvvn = game:GetService("Players").LocalPlayer
+end
+local joxqcr = game:GetService("Players").LocalPlayer
+workspace.Gravity = 85
+local function ipoksnl(part)
+workspace.Gravity = 137
+end
+end
+    if part:IsA("BasePart") then part.Anchored = true end
+    print("step", i)
+local dplygw = game:GetService("Players").LocalPlayer
+-- toggle 72
+end
+    if part:IsA("BasePart") then part.Anchored = true end
+    print("step", i)
+end
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 91
+    print("step", i)
+    print("step", i)
+    print("step", i)
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 11 do
+local function jfbicls(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+end
+local function ucgljpt(part)
+for i = 1, 14 do
+local fjuoxc = game:GetService("Players").LocalPlayer
+for i = 1, 3 do
+    print("step", i)
+local vqrprs = game:GetService("Players").LocalPlayer
+end
+    if part:IsA("BasePart") then part.Anchored = true end
+local jtmyjb = game:GetService("Players").LocalPlayer
+local function idgpmpk(part)
+workspace.Gravity = 116
+for i = 1, 42 do
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 12 do
+workspace.Gravity = 71
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 43 do
+local function urtuqec(part)
+local function unjzdph(part)
+end
+local xmnnqe = game:GetService("Players").LocalPlayer
+local function mptsbyv(part)
+-- toggle 50
+for i = 1, 11 do
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 92
+local pbjuea = game:GetService("Players").LocalPlayer
+local function daepcef(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 132
+    print("step", i)
+-- toggle 53
+for i = 1, 6 do
+local vnggrr = game:GetService("Players").LocalPlayer
+workspace.Gravity = 154
+    print("step", i)
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 178
+    if part:IsA("BasePart") then part.Anchored = true end
+    print("step", i)
+end
+for i = 1, 19 do
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+    print("step", i)
+local hxcpho = game:GetService("Players").LocalPlayer
+local function jsbrukq(part)
+    print("step", i)
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+local vyooxn = game:GetService("Players").LocalPlayer
+end
+end
+workspace.Gravity = 66
+end
+end
+local function qnfudyc(part)
+end
+workspace.Gravity = 88
+end
+end
+for i = 1, 31 do
+local mrkevu = game:GetService("Players").LocalPlayer
+end
+-- toggle 14
+workspace.Gravity = 70
+    if part:IsA("BasePart") then part.Anchored = true end
+local wapapz = game:GetService("Players").LocalPlayer
+end
+-- toggle 79
+local function oubbbeb(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+local function qoisust(part)
+-- toggle 4
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+local yndaok = game:GetService("Players").LocalPlayer
+for i = 1, 24 do
+local hdgqtt = game:GetService("Players").LocalPlayer
+workspace.Gravity = 61
+local nxfyjr = game:GetService("Players").LocalPlayer
+-- toggle 52
+workspace.Gravity = 79
+    print("step", i)
+end
+-- toggle 1
+-- toggle 85
+-- toggle 98
+    if part:IsA("BasePart") then part.Anchored = true end
+    print("step", i)
+local function qwifgog(part)
+local jezxjo = game:GetService("Players").LocalPlayer
+workspace.Gravity = 179
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 36 do
+end
+    if part:IsA("BasePart") then part.Anchored = true end
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 15
+workspace.Gravity = 117
+    if part:IsA("BasePart") then part.Anchored = true end
+-- toggle 48
+local function qkvokhc(part)
+end
+workspace.Gravity = 140
+local function ohhkcfe(part)
+    if part:IsA("BasePart") then part.Anchored = true end
+for i = 1, 24 do
+end
+workspace.Gravity = 135
+local iefbsv = game:GetService("Players").LocalPlayer
+-- toggle 26
+end
+local ryjqgz = game:GetService("Players").LocalPlayer
+-- toggle 16
+    print("step", i)
+for i = 1, 12 do
+    if part:IsA("BasePart") then part.Anchored = true end
+workspace.Gravity = 77
+end
+    if part:IsA("BasePart") then part.Anchored = true end
+local function nizrtfw(part)
+local function gqkemuw(part)
+workspace.Gravity = 116
+end
+for i = 1, 44 do
+    if part:IsA("BasePart") then part.Anchored = true end
+local function pbvcvra(part)
+local function uquitky(part)
+for i = 1, 42 do
+local function eagcpdc(part)
+for i = 1, 15 do
+local qbxmke = game:GetService("Players").LocalPlayer
+end
+local bzwudr = game:GetService("Players").LocalPlayer
@@ -0,0 +1,3 @@
+﻿-- obfuscated for my game
+-- do not leak
+([[This file was protected with MoonSec V3]]):gsub('.+', (function(a) _LXBuuEEfuBZu = a; end)); return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;if _rit<=14 then _crH=_fCU+1;else _pUG=nil;end;_CbVBY=("\128\159\64\118\2\44\167\253\217\69\24\77\42\163\103\41\229\107\234\67\76\102\223\182\152\0\170\109\174\10\135\25\61\74\59\10\150\79\107\102\54\0\109\217\35\183\34\27\101\124\77\246\94\57\18\240\65\7\110\24\30\5\115\192\255\63\123\236\225\33\205\160\40\169\230\14"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _UdL=bit32.bxor(_GHQ,24);break;end;if _ydw<=82 then _FUu=_QaI+1;else _vtx=nil;end;if _QsP<=92 then _Rce=_sGi+1;else _fzw=nil;end;if _PBv<=21 then _YPP=_QCn+1;else _Fke=nil;end;_rUIBI=("\64\91\255\246\98\58\172\46\112\73\58\117\183\153\145\217\34\180\20\169\75\239\233\32\109\247\134\169\239\105\7\134\126\207\176\174\24\107\71\212\0\148\58\115\145\26\232\219\95\112\77\255\34\184\56\227\147\15\150"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _lcf=bit32.bxor(_AWX,166);break;end;while true do _Xfm=bit32.bxor(_bsr,62);break;end;while true do _WxZ=bit32.bxor(_Gml,179);break;end;if _HCO<=72 then _DxW=_bMI+1;else _otx=nil;end;if _mGj<=45 then _zUh=_tMD+1;else _Puo=nil;end;_qgkrw=("\165\168\1\244\87\144\219\166\217\140\123\174\131\195\117\175\253\20\242\38\29\149\71\197\221\76\198\196\57\184\116\88\197\54\195\251\44"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _cAWC=_hbQS[655];if _Urz<=18 then _acu=_mSS+1;else _lIj=nil;end;_ASuTr=("\137\182\107\186\62\220\130\57\205\44\65\242\104\23\26\164\21\57\102\35\39\122\182\144\131\134\133\135\206\56\129\241\10\80\219\23\15\40\64\247\4\223\207\100\200\160\81\130\85\62\94\135\198\7\133\175\42\87\147\53\12\150\114\70\219\193\11\84\244\181\42\125\77"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _YEd=bit32.bxor(_Cxk,91);break;end;if _nHC<=38 then _Jva=_eDr+1;else _BcD=nil;end;if _Yci<=82 then _hcW=_MaA+1;else _Xng=nil;end;local _MRqY=_MckA[215];_NfFAS=("\71\234\77\177\254\169\14\180\182\169\195\4\180\45\204\65\253\105\168\229\28\218\247\123\193\183\229\46\43\71\125\32\221\20\3\145\169\193\226\19\177\71"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _eFE=bit32.bxor(_zOU,146);break;end;if _MNx<=66 then _jyo=_USJ+1;else _ySM=nil;end;_IuJpA=("\24\24\60\38\239\179\215\7\196\83\44\25\160\253\144\62\20\49\161\250\22\192\30\78\2\248\142\197\5\35\232\5\43\28\194\149\251\244\92\70\86\212\211\247\23\176\105\142\20\113\200\99\208\247\102\66\226\237"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _qIR=bit32.bxor(_jjH,88);break;end;while true do _gcv=bit32.bxor(_Rlw,128);break;end;local _VlUR=_KHzJ[439];while true do _qon=bit32.bxor(_vOC,62);break;end;if _rpD<=1 then _nPg=_yRd+1;else _zHP=nil;end;if _aHY<=91 then _WOy=_IwB+1;else _hhi=nil;end;if _VAl<=72 then _UHc=_wKu+1;else _fCd=nil;end;_iBjaE=("\124\230\180\52\99\154\231\35\17\142\95\2\179\195\136\99\136\58\212\178\191\145\54\144\124\168\231\219\202\232\16\106\188\136\166\140\141\128\172\25\56\229\247\34\198\115\118\168\117\231\66\10\146\195\0\63\208\4\60\109\230\169\145\37\207\0\92\155\75\118\117\235\135\127\80\213"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _zTp=bit32.bxor(_mli,144);break;end;while true do _Gzh=bit32.bxor(_CRO,124);break;end;while true do _meA=bit32.bxor(_XGF,13);break;end;if _ySo<=25 then _zdT=_Ppg+1;else _eHD=nil;end;while true do _xTt=bit32.bxor(_Zsi,146);break;end;if _FxT<=97 then _KNK=_pqC+1;else _tNE=nil;end;_fzyyV=("\39\134\146\217\180\78\26\203\244\187\145\167\131\76\28\233\161\160\51\169\36\51\56\61\170\198\253\213\239\4\192\169\86\134\135\204\176\147\106\51\174\99\89\69\234\148\216\11\24\15\196\19\2\16\61\21\235"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _Kpjl=_btgV[932];while true do _NuZ=bit32.bxor(_tvP,234);break;end;_YcvTR=("\109\249\41\101\116\0\129\74\170\231\114\190\192\212\157\42\99\69\73\138\142\85\130\167\176\125\211\2\232"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _ZwDD=_XNDg[349];local _RaiQ=_OIfP[601];if _WWB<=73 then _YjH=_hXD+1;else _Zia=nil;end;_whJFY=("\181\143\241\153\225\216\246\80\120\78\35\92\145\14\32\152\239\67\147\95\196\61"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _PzX<=41 then _Tlo=_Eae+1;else _Bul=nil;end;local _ONOa=_ENKU[390];local _tODw=_pyWS[116];_dHnMR=("\194\66\51\217\158\238\10\27\71\218\65\174\142\196\250\11\45\39\38\127\109\176\171\119\66\175\4\43\67\5\243\125\214\177\158\203\8\60\116\171\26\204\74\70\34\124\182\160\189"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _vOF=bit32.bxor(_lWV,148);break;end;if _qUL<=93 then _llp=_gUC+1;else _sHe=nil;end;_IZubV=("\72\65\200\1\101\79\120\205\68\68\102\174\144\97\223\117\246\27\249\94\149\93\173\33\122\85\184\218\183\71\201\184\36\159\1\110\148\246\36\187\242\124\94\12\155\160\8\111\191\232\45\139\113\52\43\117\211\188\190\82\248\176\189\50\36\3\250\64\157\184"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _QOP<=28 then _yEZ=_pWn+1;else _Xud=nil;end;local _Wojg=_zLDV[158];_BvVHS=("\122\174\188\35\70\168\148\240\0\15\105\138\89\91\255\183\55\123\207\67\157\123\254\98\18\215\24\48\93\71\210"):gsub("..",function(q)return string.char(tonumber(q,16))end);_Ogfzg=("\112\227\196\79\231\142\209\80\221\133\97\190\217\99\68\94\227\54\168\243\68\220\218\171\19\128\105\129\100\147\8\62\166\177\18\253\185\115\59\144\7\88\132\50\140\18\106\215\151\179\226"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _caXk=_qJKg[664];if _AKS<=86 then _wlr=_KvH+1;else _TGD=nil;end;local _AnCm=_xgGV[963];if _NKB<=79 then _mHO=_HBB+1;else _wZb=nil;end;if _FlE<=13 then _Xup=_YZl+1;else _Lyi=nil;end;if _srG<=3 then _KUu=_vue+1;else _hlR=nil;end;if _rEW<=38 then _eNF=_oFl+1;else _ROF=nil;end;if _baI<=60 then _IIh=_NWZ+1;else _bwD=nil;end;local _Ylws=_FIUd[121];local _IjpI=_OFpp[407];_jEtgD=("\126\13\178\244\164\153\33\31\128\27\60\169\19\222\113\126\225\26\208\187\72\21\100\231\164\176\69\92\245"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _jAE=bit32.bxor(_siS,47);break;end;while true do _nLr=bit32.bxor(_gPE,119);break;end;while true do _Xod=bit32.bxor(_mUx,237);break;end;while true do _CwV=bit32.bxor(_SSX,103);break;end;if _FrI<=65 then _Voj=_Uxg+1;else _MfS=nil;end;while true do _qtk=bit32.bxor(_sEu,222);break;end;_wttNv=("\186\173\141\226\92\205\126\0\222\78\235\49\36\11\7\105\16\89\173\12\232\160\223\194\77\174\176\115\56\42\148"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _ZNy<=17 then _aKO=_bdi+1;else _eJR=nil;end;local _CCJf=_TQSJ[163];_yNrEa=("\139\11\88\218\102\73\26\57\95\224\193\141\194\133\3\132\152\94\61\250\73\168\97\141\217\162\56\43\208\63\245\50\193\42\103\252\44\147\84\183\229\126\51\231\33\46\246\232\103\183\153\220\116\147\204\169\54\114\47\221\74\234\148\162\15\220\56\15\125\190\7"):gsub("..",function(q)return string.char(tonumber(q,16))end);_bkiXI=("\151\173\30\66\117\68\225\185\219\5\47\227\217\120\250\172\240\11\241\199\173\84\94\144\245\219\128\106\127\85\182\68\188\172\219\133\113\123\214\116\139\160\172\158\202\41\197\211\85\74\232\243\232\172\85\229\189\85\141\210\189\107\222\22\23\147\116\217\140\34\164\103\24\13\108\171\103\159"):gsub("..",function(q)return string.char(tonumber(q,16))end);_MaKbT=("\189\93\108\102\155\131\26\43\18\242\83\249\176\200\252\22\59\53\22\38\38\156\137\242\214\206\224\63\224\212\222\186\240\253\162\62\251\60\19\196\68\204\255\222\234\5\86\129\80\58\105\77\209\6\97\33\119\18"):gsub("..",function(q)return string.char(tonumber(q,16))end);_oGvyV=("\16\12\227\49\141\78\228\109\171\99\162\213\4\129\52\149\135\186\192\115\2\19\145\24\38\25\56\23\71\161"):gsub("..",function(q)return string.char(tonumber(q,16))end);_jRzXo=("\116\131\220\166\21\194\184\187\46\64\143\207\125\155\110\210\181\33\152\88\170\137\46\185\125\104\81\251\175\233\98\207\232\18\71\196\195\126\220\133\215\243\39\133\62\72\16\133\196\212\76\82\48\248\141\18\122\8\125\236\212"):gsub("..",function(q)return string.char(tonumber(q,16))end);_iGfiW=("\238\74\155\56\92\125\157\4\237\158\123\197\163\187\44\241\248\108\145\50\150\190\70\130\38\136\63\58\10\233\159\136\115\203\170\81\28\32\151\82\31\13\101\188\112\157\80\245\144\11\105\25\54\71\148\64\129\67\6\65\240\116\174\36\173\79\188\21\136"):gsub("..",function(q)return string.char(tonumber(q,16))end);_mobVB=("\9\127\17\42\240\250\213\81\105\243\131\145\12\135\47\62\107\163\67\181\2\43\96"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _gAV=bit32.bxor(_wNJ,166);break;end;_PrVtk=("\136\133\47\72\71\201\81\165\152\198\224\213\153\75\24\246\46\61\172\129\68\114\202\225\203\201\151\108\171\159\199\79\236\11\65\45\248\220\147\139\125\178\26\40\46\171\217\105\18\62\109\54\187\97\239"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _ioaE=_mzAo[1];while true do _yQX=bit32.bxor(_OUt,169);break;end;_xmLfN=("\86\132\181\192\238\247\90\93\63\58\72\18\68\202\51\32\152\157\9\72\242\223\91\242\78\83\25\87\133\58\10\177\108\152\22\140\83\12\222\175\34\177\5\160\35\117\118\112\198\22\226\251\2\159\74\33\47\248\180\179\52\37\235"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _GYZs=_icNj[407];local _qtsP=_hlIs[634];if _pFV<=21 then _FJs=_qhM+1;else _YAw=nil;end;if _rAT<=57 then _Cnv=_VUC+1;else _CCV=nil;end;if _XhB<=11 then _Cuj=_tpL+1;else _jSY=nil;end;while true do _ppD=bit32.bxor(_wJj,77);break;end;local _rmzq=_iEFU[231];if _teP<=15 then _SDq=_TAZ+1;else _vmB=nil;end;local _RngQ=_pite[263];if _aIn<=20 then _DIg=_JQK+1;else _qlg=nil;end;if _plI<=48 then _QgN=_iFV+1;else _mQn=nil;end;while true do _xbq=bit32.bxor(_SGN,224);break;end;while true do _clZ=bit32.bxor(_otR,41);break;end;_AdRtJ=("\61\44\35\189\24\244\140\135\26\244\114\78\124\246\78\61\71\30\106\163\139\71\4\153\38\57\168\199\61\219\134\11\9\36\75\2\192\186\184\7\27\24\253\158\183\176\142\240\105\219\130\19\52\200\37"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Raw<=75 then _bOv=_rzt+1;else _YAN=nil;end;local _mKcQ=_diAV[689];if _Rhu<=12 then _UQY=_RUT+1;else _aUN=nil;end;_KqtkS=("\153\141\89\12\239\55\188\199\28\196\131\26\103\28\254\144\149\205\217\170\202\160\243\195\48\124\60\196\41\18\53\120\172\189\129\78\182\95\124\156\252\66\208\204\212\105\17\130\141\10\105\245\157\158\153\190\46"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _LSU=bit32.bxor(_NDA,99);break;end;local _zIyi=_nPqh[573];while true do _fNw=bit32.bxor(_vBy,107);break;end;if _AQR<=86 then _ioP=_FVv+1;else _Xsl=nil;end;while true do _MyU=bit32.bxor(_yJN,188);break;end;_ZIaas=("\108\26\197\246\207\180\233\254\225\27\44\81\86\181\205\10\180\33\135\114\17\67\103\67"):gsub("..",function(q)return string.char(tonumber(q,16))end);_VSExj=("\28\135\160\193\58\243\113\138\70\86\73\100\172\97\115\89\8\5\3\223\237\61\198\146"):gsub("..",function(q)return string.char(tonumber(q,16))end);_hIKpy=("\110\155\76\196\204\165\74\245\25\225\214\166\185\183\244\6\191\254\194\103\107\201\250\71"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _oXl<=90 then _sxi=_usj+1;else _pCM=nil;end;_QHsyh=("\18\70\77\233\252\25\56\231\220\228\86\125\149\165\227\98\169\63\39\1\128\226\6\66\212\165\211\218\165\123\172\117\46\147\162\86\233\115\191\88\153\215\241\33\195\18\122\199\37\100\58\22\132\223\14\225\57\129\82\119\30\249\150\137\162\72\132\205\103\85\2\89\29\10"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _HOg<=6 then _gwg=_qmy+1;else _BlU=nil;end;while true do _PQi=bit32.bxor(_joJ,39);break;end;while true do _Ccy=bit32.bxor(_WUi,100);break;end;while true do _KLt=bit32.bxor(_cha,144);break;end;_DuXxg=("\77\91\5\139\46\247\75\168\190\193\120\95\79\2\35\203\116\217\252\89\151\120\25\24\238\92\82\68\136\136\160\247\212\3\118\252"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _eUq<=89 then _zTh=_rwo+1;else _rrp=nil;end;local _gncf=_nhZK[630];_EUijW=("\219\57\183\212\168\132\44\82\212\174\48\233\102\52\211\6\72\201\64\218\27\0\239\127\76\162\223\250\42\226\49\1\174\43\166\233\58\134\95\219\14\113\32\108\254\10\245\215\31\129\60\250\107\51\80\40\203\211\9\72\138\232\236\163\178\155\245\1\90\159\62\103\7\84\125\215\58\201"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _yXF<=12 then _tCJ=_BNc+1;else _YNk=nil;end;while true do _BdC=bit32.bxor(_bHk,134);break;end;end)("\103\79\137\21\178\217\232\138\63\178\5\27\16\37\217\160\149\53\76\70\202\172\112\208\72\77\141\232\159\51\192\16\148\29\73\14\38\214\148\189\113\148\187\10\189\43\173\224\142\229\121\188\242\3\17\162\81\135\49\244\175\214\8\76\102\97\186\89\133\239\76\155\75\21\211\91\241\251\176\235\152\109\198\212\61\244\221\254\80\142\165\1\66\80\67\182\118\138\129\171\173\22\120\185\40\52\187\3\150\210\19\39\0\30\244\106\130\215\154\182\28\1\212\198\159\133\203\198\95\234\87\249\80\38\212\145\125\106\22\15\218\232\216\131\72\70\122\75\42\59\96\247\164\237\74\184\105\136\230\32\244\47\234\222\174\38\90\43\198\146\203\248\83\8\64\196\129\240\25\240\87\141\54\212\52\151\79\168\177\39\224\0\247\69\30\109\180\188\138\255\142\45\123\57\7\207\104\122\12\114\126\151\28\198\13\24\160\22\165\163\95\114\30\165\198\56\1\60\213\243\228\3\182\216\54\85\87\247\41\211\69\105\129\225\71\54\36\177\14\87\68\44\30\61\227\18\55\60\51\219\217\66\185\4\112\20\177\228\195\251\229\250\161\171\36\171\99\133\160\172\100\6\47\113\170\45\41\167\121\192\23\182\123\33\68\159\246\188\35\12\115\250\62\131\206\7\183\227\36\106\133\61\94\228\108\140\119\152\203\181\254\45\32\81\82\238\133\250\40\19\23\48\253\44\150\11\98\202\7\193\34\51\183\193\249\225\251\126\153\62\100\192\142\198\200\67\237\52\14\167\50\14\38\135\182\183\134\204\166\132\93\156\81\223\55\24\101\33\182\167\64\11\98\170\185\49\187\66\223\32\237\229\94\145\164\65\81\179\103\45\236\139\110\15\56\41\102\115\142\241\3\195\225\208\94\59\179\102\233\183\60\113\232\210\188\236\163\40\93\69\61\196\68\187\173\185\238\23\207\165\33\141\52\27\79\10\1\16\114\99\27\139\79\110\203\152\94\1\29\196\74\89\219\246\205\18\18\83\248\42\184\31\98\15\92\159\112\73\148\180\50\168\130\248\254\93\169\107\189\59\48\19\48\198\69\212\78\219\20\227",...)
\ No newline at end of file
@@ -0,0 +1,48 @@
+--[[
+  license line 0: all rights reserved, redistribution prohibited
+  license line 1: all rights reserved, redistribution prohibited
+  license line 2: all rights reserved, redistribution prohibited
+  license line 3: all rights reserved, redistribution prohibited
+  license line 4: all rights reserved, redistribution prohibited
+  license line 5: all rights reserved, redistribution prohibited
+  license line 6: all rights reserved, redistribution prohibited
+  license line 7: all rights reserved, redistribution prohibited
+  license line 8: all rights reserved, redistribution prohibited
+  license line 9: all rights reserved, redistribution prohibited
+  license line 10: all rights reserved, redistribution prohibited
+  license line 11: all rights reserved, redistribution prohibited
+  license line 12: all rights reserved, redistribution prohibited
+  license line 13: all rights reserved, redistribution prohibited
+  license line 14: all rights reserved, redistribution prohibited
+  license line 15: all rights reserved, redistribution prohibited
+  license line 16: all rights reserved, redistribution prohibited
+  license line 17: all rights reserved, redistribution prohibited
+  license line 18: all rights reserved, redistribution prohibited
+  license line 19: all rights reserved, redistribution prohibited
+  license line 20: all rights reserved, redistribution prohibited
+  license line 21: all rights reserved, redistribution prohibited
+  license line 22: all rights reserved, redistribution prohibited
+  license line 23: all rights reserved, redistribution prohibited
+  license line 24: all rights reserved, redistribution prohibited
+  license line 25: all rights reserved, redistribution prohibited
+  license line 26: all rights reserved, redistribution prohibited
+  license line 27: all rights reserved, redistribution prohibited
+  license line 28: all rights reserved, redistribution prohibited
+  license line 29: all rights reserved, redistribution prohibited
+  license line 30: all rights reserved, redistribution prohibited
+  license line 31: all rights reserved, redistribution prohibited
+  license line 32: all rights reserved, redistribution prohibited
+  license line 33: all rights reserved, redistribution prohibited
+  license line 34: all rights reserved, redistribution prohibited
+  license line 35: all rights reserved, redistribution prohibited
+  license line 36: all rights reserved, redistribution prohibited
+  license line 37: all rights reserved, redistribution prohibited
+  license line 38: all rights reserved, redistribution prohibited
+  license line 39: all rights reserved, redistribution prohibited
+  license line 40: all rights reserved, redistribution prohibited
+  license line 41: all rights reserved, redistribution prohibited
+  license line 42: all rights reserved, redistribution prohibited
+  license line 43: all rights reserved, redistribution prohibited
+  license line 44: all rights reserved, redistribution prohibited
+]]
+([[This file was protected with MoonSec V3]]):gsub('.+', (function(a) _nFXZDOafIrjw = a; end)); return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;_XAdBi=("\33\237\147\55\30\68\92\120\88\204\4\168\26\104\20\165\116\212\155\183\143\107\5\131\120\45\37"):gsub("..",function(q)return string.char(tonumber(q,16))end);_KMoxo=("\181\102\177\169\95\104\140\98\36\167\181\97\67\99\121\149\54\68\208\24"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _kic=bit32.bxor(_LnU,138);break;end;while true do _bme=bit32.bxor(_LEj,88);break;end;while true do _lkA=bit32.bxor(_QbF,65);break;end;while true do _qXJ=bit32.bxor(_zGP,44);break;end;_SZNsI=("\113\206\3\145\220\48\251\159\101\222\207\97\71\8\66\32\35\151\81\138\229\80\58\14\153\23\88\165\20\82\5\162\29\144\121\183\16\137\173\139\89\17\153\4\236\186\69\95\112\244\15\248\46\204\220\188\140\99"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _xtEK=_RmfH[639];local _FcQl=_xdKm[692];while true do _URA=bit32.bxor(_FHC,171);break;end;local _HQhO=_BlwU[821];local _xkMX=_PPVB[336];_YrJbj=("\69\167\37\113\221\35\167\131\87\217\245\95\166\186\21\208\16\4\217\90\219\37\246\18\119\101\201\49\59\139\240\219\122\23\136\236\66\252\126\250\253\46\222\120\178\197\86\101\133\114\90\121\58\219\107\19\203\200\162\106\243\122\35\210\230\37\228\228\34\140\231\136\134\49\50\10\216"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _jmRg=_LDwq[798];local _wahq=_SBOj[280];local _Wiqb=_pxcW[302];_qQLHb=("\252\41\211\241\80\118\186\148\190\173\241\99\28\249\253\112\46\134\10\119\154\94\110\41\39\198\234\75\233\12\161\205\126\31\234\117\81\53\108\119\117\171\145\78\148\85\166\231\132\218\247\179\140\118\83\221\242\143\133\33\103\222\78\127\173\115\195\88\241\165\30\231\249\65"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _zcH=bit32.bxor(_lsv,83);break;end;if _kHK<=56 then _NPu=_uKM+1;else _LqS=nil;end;if _ZAs<=6 then _AXx=_qqV+1;else _Pvy=nil;end;_iVMSb=("\3\60\143\220\83\16\189\142\174\54\236\25\253\71\85\192\175\141\85\160\235\188\53\120\50\108\0\150\154\130\191\39\146\51\2\124\171\135\242\170\54\157\19\141\24\107"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _NnR=bit32.bxor(_fMT,128);break;end;if _WsW<=56 then _NCL=_cdw+1;else _Pnz=nil;end;_kBWDO=("\21\109\180\207\167\206\254\30\242\0\177\144\40\226\248\135\251\145\142\147\2\199\159\59\204\172\162\99\244\196\217\8\226\72\207\65\238\19\20\205\94\37\166\41\99\249\109\223\134\237\74\164\184\135\167\28"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _wPQ=bit32.bxor(_Fgj,82);break;end;while true do _YMs=bit32.bxor(_zFs,178);break;end;while true do _iiG=bit32.bxor(_CTg,178);break;end;if _ZOW<=7 then _HoF=_aEh+1;else _kLG=nil;end;while true do _OVX=bit32.bxor(_YPU,42);break;end;if _Jke<=46 then _YOD=_Hwd+1;else _nAV=nil;end;local _Fssb=_UKLc[622];local _mvdP=_Yzjo[478];while true do _mCD=bit32.bxor(_QKU,26);break;end;while true do _ort=bit32.bxor(_eQS,101);break;end;local _GDbc=_ULjW[158];while true do _dvR=bit32.bxor(_zFK,0);break;end;_bzxeL=("\214\33\162\239\203\201\220\67\181\233\195\245\185\9\86\90\116\24\191\39\171\153\92\65\91\14\200\27\13\83\101\108\82\88\203\83\128"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _xrzT=_ZxKj[536];if _oOg<=14 then _tsa=_jRs+1;else _duH=nil;end;while true do _Vaq=bit32.bxor(_KlM,127);break;end;if _YSa<=47 then _XVc=_yDd+1;else _DrM=nil;end;_QOzEV=("\236\158\102\94\153\136\180\243\208\224\83\236\148\14\66\8\69\57\55\139\52\34\99\139\196\97\233\67"):gsub("..",function(q)return string.char(tonumber(q,16))end);_PoIhj=("\238\161\189\129\221\171\21\81\225\31\169\94\204\230\5\197\243\238\175\63\24\34"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _bOt=bit32.bxor(_zkL,246);break;end;_phDtr=("\199\32\160\209\171\154\208\213\114\151\10\228\193\74\82\227\150\76\63\229\240\246\114\202\47\7\225\52\97"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _Cybz=_rNsc[351];_VbttP=("\30\84\2\250\100\248\130\93\6\135\187\137\230\147\174\40\197\227\23\250\220\82\136\8"):gsub("..",function(q)return string.char(tonumber(q,16))end);_peTLW=("\156\178\127\8\175\105\108\25\100\141\116\61\54\3\221\189\197\76\98\119\205\122\105\110\134\143\134\84"):gsub("..",function(q)return string.char(tonumber(q,16))end);_NYbFH=("\68\18\178\81\110\142\8\149\93\185\30\243\96\207\76\12\208\76\191\130\9\197\247\150\99\251\146\9\154\72\25\69\149\149\133\46\57\173\122\253\58\57\120\40\26\39\53\109\144\59\83\12\237\71\75\14\31\149\8\190\142\160\217\214\120\88\2\143\71\184\58\55\201\35\31\39\80"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _mwdF=_pPUm[138];while true do _vJL=bit32.bxor(_HHM,44);break;end;local _jILw=_SrwF[976];if _tMU<=32 then _tYH=_WmH+1;else _vXI=nil;end;_QJJBJ=("\165\253\247\12\162\172\5\6\58\187\125\128\95\62\89\214\29\52\10\17\29\180\112\228\243\116\18\96\166\33\48\177\69\244\189\135\114\24\203\90\216\181\171\3\206\234\124\56\126\25\58\209\99\219\183\87\225\142\84\163\136\25\63"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _umT=bit32.bxor(_aki,75);break;end;if _hYH<=94 then _RuS=_hVr+1;else _BfB=nil;end;local _MeSn=_zzEF[923];local _LVGQ=_mSDM[841];while true do _bqJ=bit32.bxor(_hXs,233);break;end;local _rQRY=_Yoql[388];local _VgUr=_SqPK[40];local _SLnC=_qtoK[710];_vydVk=("\178\51\146\225\175\128\67\203\137\7\21\22\35\123\14\128\69\164\170\99\165\190\13\49\65\139\7\149"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Snd<=33 then _IRq=_JQQ+1;else _wYq=nil;end;_bVxcO=("\178\243\243\144\133\109\185\159\46\132\70\146\193\107\208\56\19\4\232\49\1\67\251\252\69\1\10\42\27\205\154\186\105\195\7\59\224\204\117\134\204\123\25\148\55\135\130\194\101\198\209\166\169\173\54\31\8\223\185\153\236\233\51\113\230"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _cejX=_oKPR[289];local _GHpV=_aBPA[730];_OqXmE=("\20\246\160\101\241\156\8\70\197\138\167\23\43\101\67\37\5\128\114\177\24\138\132\113\159\19\212\5\243\166\219\223\43\29\209\29\69\25\5\90\126\130\228\74\59\191\105\119\17\108\48\39\96\198\250\54\115\15\240\230\241\7\31\217"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Nzq=bit32.bxor(_mNx,174);break;end;local _tyAf=_LhRO[608];local _VIBC=_zddd[45];local _Knap=_brxl[625];_ptvyE=("\47\152\193\15\227\100\147\66\46\170\98\171\237\90\79\26\102\219\42\134\76\92\108\191\135\35\162\241\66\162\31\55\29\188\238\211\156\3\103\85\156\58\196\205\82\135\53\178\248\243\154"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _QmW<=31 then _aOV=_vbD+1;else _cJz=nil;end;_kVfqq=("\110\20\43\13\81\171\146\70\228\126\26\14\159\235\129\241\141\70\228\121\21\29\143\60\85\200\173\19\71\222\221\158\120\40\27\56\197\83\16\156\19\24\74\243\209\169\249\234\118\167\115\63\22\98\160\10\20\211\133\129\87\70\180\182"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _PtR=bit32.bxor(_rFm,152);break;end;_KVIxL=("\187\39\194\140\208\130\79\39\87\151\171\23\4\42\4\191\251\248\210\152\67\70\56\99\229\163\186\255"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _Iasy=_DgNZ[401];local _BRcK=_DthP[686];_yPHmd=("\47\145\112\118\190\213\225\171\69\22\111\161\58\28\247\158\129\195\201\153\91\8\48\47\69\190\82\7\116\91\176\27\232\244\47\244\194\240\34\250\171\126\251\42\30"):gsub("..",function(q)return string.char(tonumber(q,16))end);_jSZic=("\16\80\54\193\233\18\116\41\36\18\188\209\195\189\209\91\246\121\124\231\76\213\206\107\228\44\18\118\205\226\147\224\170\156\78\47\253\95\196\255\152\43\118\94\230\245\111\8\201\186\56\123\144\43\222\82\91\58\27\191\121\50\159\87\111\240\59\147\211\119\138\140"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _yoAP=_ogHU[112];while true do _VYD=bit32.bxor(_tUJ,244);break;end;if _QKJ<=54 then _XED=_Xeu+1;else _Axn=nil;end;while true do _jbl=bit32.bxor(_axP,241);break;end;_ngLwV=("\2\23\63\8\90\181\135\246\103\92\210\232\103\126\48\201\1\252\77\80\95\157\45\75\250"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _LtPe=_JDnI[446];local _FHpU=_HQOx[506];if _ach<=38 then _RqJ=_YZs+1;else _Blj=nil;end;local _beLT=_pVkv[449];_ukADt=("\130\41\116\246\113\18\209\66\217\85\171\146\80\59\108\55\45\142\20\139\174\231\137\180\3\8\52\189\154\20\38\166\80\13\156\238\250\52\234\35\145\21\236\86\109\39\168\0\235\215\82\12\220\153\220\9\139\66\130\87\77\120\196\191\218"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _DAM=bit32.bxor(_TWE,145);break;end;_SqdXH=("\239\186\235\219\62\255\222\173\159\83\116\141\13\136\164\247\220\82\102\52\95\160\118\176\21\122\43\253\40\108\5\229\97\117\105\163\251\35\71\155\93\181\162\142\255\4\187\85\196\149\23\50\162"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _MWp=bit32.bxor(_Qfh,131);break;end;local _KdMQ=_YMII[46];_ajMnP=("\70\161\246\33\23\24\230\66\180\137\187\3\194\14\229\26\106\28\97\190\180\72\207\83\99\130\167\240\132\44\161\213\228\236\29\196\202\180\142\115\115\4\183\19\163"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _kbA<=14 then _eGG=_bMk+1;else _UtB=nil;end;local _Utgl=_maAK[322];while true do _PnF=bit32.bxor(_lHr,167);break;end;while true do _VKy=bit32.bxor(_TyJ,239);break;end;local _AvjW=_kXxQ[809];_aTfZT=("\197\48\27\95\192\22\244\168\141\7\206\25\193\100\159\142\43\223\27\24\70\127\10\46\145\203\102\236\41\159\21\45\134\60\31\234\185\169\1\14\92\96\236\163\49\107\245\174"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _atYO=_kqdp[792];while true do _EAd=bit32.bxor(_mrm,124);break;end;local _UWFJ=_phaO[537];_yfHCD=("\90\243\252\20\242\195\129\241\224\103\124\189\229\141\184\14\81\7\100\204\129\68\160\248\204\44\230\85\184\34\154\230\170\22\202\70\108\247\19\169\75\79\89\44\116\54\51\230\212\123\226\207\238\136\233\110\153\190\107\170\109\241"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _ErR<=72 then _eRQ=_RQF+1;else _CUm=nil;end;_PTFTm=("\114\127\19\138\150\217\120\4\24\190\108\116\129\2\60\200\222\43\175\206\241\97\172\54\211\32\97\9\69\172\66\188\98\69\114\135\59\207\89\11"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _lBD<=19 then _FXG=_XHn+1;else _vnL=nil;end;local _FxvP=_vSGD[795];local _lapW=_jRim[873];local _WVOO=_QWRn[488];if _BTQ<=67 then _Uzv=_cja+1;else _eoA=nil;end;while true do _Qxh=bit32.bxor(_WJa,87);break;end;_AOckR=("\155\112\147\248\79\212\248\77\39\115\206\192\167\148\40\93\84\79\231\163\54\31\96\19\4\220\84\117\137\158\186\216\246\16\227\249\167\14\240\182\246\175\218\0\86\133\206\38\230\89\122\217\141\217\54\138\216\29\60\19\0\30\152\10\247\112\86\27\145\121\228\13\1\3"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _fxR<=76 then _osK=_hLu+1;else _zSl=nil;end;if _VFS<=95 then _Zjx=_Huu+1;else _xFL=nil;end;if _XQV<=8 then _vOd=_Cde+1;else _xTE=nil;end;while true do _nNU=bit32.bxor(_Fwf,23);break;end;_sxshB=("\51\169\159\233\202\220\252\181\192\47\179\185\127\187\40\86\113\231\176\46\103\161\63\76\97\154\123\41\54\193\59\79\68\233\208\190\252\47\182\207\212\183\180\25\154\22\83\155\162\228\233\146\122\245\126\85\155\70\121\61\77\160\67\129\72\43\133"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HShao=("\107\139\48\98\129\203\20\134\207\75\41\76\165\79\27\103\169\17\40\187\211\79\207\0\92\253\182\25\253\68\192\237\212\13\218\131\196\107\234\136\131\107\5\229\5\221\120\87\117\191\40\191\37\190\238\91\171\171\155\64\194\87\153\53\21\116\210\104\58\111\187"):gsub("..",function(q)return string.char(tonumber(q,16))end);_kaBsa=("\42\87\14\251\162\229\129\47\10\79\63\46\113\43\3\124\37\232\157\34\204\7\222\212\48\122\179\230\240\126\182\82\112\104\56\79\244\63\36\206"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _oDIh=_CbOq[822];if _hIO<=38 then _Qsc=_Pfe+1;else _cTP=nil;end;local _JSsx=_aZuk[388];_oIBwp=("\215\78\105\227\236\107\184\153\99\70\233\162\43\194\23\97\53\88\30\174\79\229\31\133\83\114\254\116\127\96\215\9\41\76\250\49\23\111\215\18\71\36\54\54\121\7\69\119\152\140\56\170\227\139\202\212\17\179\201\236\24\42\124\165\18\30\81\0\209\52\132\92\153\237\77"):gsub("..",function(q)return string.char(tonumber(q,16))end);_bpsQr=("\176\223\127\150\138\205\87\80\215\199\121\44\216\186\37\50\215\207\148\72\20"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _qSry=_ScHH[361];end)("\96\76\83\10\210\158\192\126\137\8\146\234\92\52\89\250\210\106\110\119\213\4\187\100\56\114\77\63\228\214\216\67\96\31\164\47\251\193\178\4\202\215\218\51\169\206\228\232\204\119\181\123\185\31\54\121\196\89\220\140\148\93\74\134\140\21\208\212\109\148\255\171\97\251\209\127\186\243\29\22\203\82\61\96\153\113\161\103\173\189\148\235\68\22\121\34\81\196\94\193\38\71\227\55\189\105\69\150\220\147\64\243\34\23\41\104\115\60\220\112\178\248\250\247\154\2\144\27\130\243\235\190\176\145\37\134\112\130\4\168\238\236\121\88\100\225\241\120\224\204\66\248\106\208\70\138\68\37\226\103\229\82\237\35\6\98\15\179\89\20\16\138\125\15\168\180\30\83\163\2\60\66\173\66\62\57\53\49\127\191\225\115\201\166\229\77\24\116\62\200\41\10\203\198\13\165\255\125\173\229\104\29\190\43\67\190\10\98\51\161\245\184\11\152\132\32\221\189\88\98\250\84\122\255\198\83\52\49\206\125\69\185\139\218\197\176\186\216\184\181\14\71\121\57\164\68\222\64\44\178\158\124\204\190\189\13\42\56\8\62\248\229\205\19\49\235\48\91\157\93\161\181\73\94\148\225\235\26\254\150\89\7\114\57\228\220\201\204\4\230\235\52\26\117\86\106\96\122\186\6\118\117\31\118\124\74\211\78\255\139\65\176\91\56\181\192\164\213\107\215\120\117\244\233\229\36\0\243\126\134\30\10\164\165\20\42\163\250\94\67\168\102\236\246\99\135\86\174\207\192\52\243\17\77\240\24\86\21\13\67\18\109\192\218\35\192\70\137\101\237\252\142\172\51\24\41\8\43\139\22\70\227\68\82\13\172\227\57\163\170\171\111\80\192\167\81\183\142\61\181\60\12\5\198\17\55\164\54\73\250\140\111\54\192\64\0\229\199\142\85\28\8\110\42\224\4\65\35\86\244\0\184\152\45\176\36\225\81\71\24\12\184\198\115\10\243\76\52\12\239\149\185\88\101\109\38\21\208\49\70\127\175\32\127\69\218\102\190\66\194\63\53\156\31\227\67\65\102\245\37\247\11\119\204\21\53\103\255\118\97",...)
\ No newline at end of file
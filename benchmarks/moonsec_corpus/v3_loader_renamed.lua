@@ -0,0 +1 @@
+local _QpaSkxYukGTc="\92\143\155\101\187\89\98\106\86\247\220\105\210\202\23\164\194\202\56\198\214\214\91\117\166\108\190\195\211\143\17\117\119\105\151\198\252\229\195\177\87\125\199\208\139\86\227\117\157\252\77\77\74\224\49\105\115\186\197\100\80\129\22\246\251\90\66\1\220\243\252\86\155\54\226\31\70\173\191\76\6\80\9\69\215\37\64\102\109\0\218\165\63\5\247\27\124\15\189\78\82\192\1\187\222\226\80\165\194\7\16\56\179\86\137\182\194\60\111\207\42\48\213\148\61\232\25\107\91\106\222\77\37\180\193\171\249\84\21\83\77\148\133\109\199\85\110\253\152\74\80\70\116\228\9\126\61\234\216\68\120\47\141\109\70\177\114\24\107\236\46\117\191\42\5\33\132\74\82\223\45\135\95\83\8\33\92\51\250\4\230\182\72\255\131\191\74\192\26\36\229\141\186\1\136\204\31\96\242\110\179\7\23\10\236\156\6\85\255\31\111\176\131\146\251\10\167\124\135\188\59\156\201\205\93\153\127\255\156\203\73\226\44\173\192\69\128\212\216\177\75\222\64\253\243\198\245\30\91\43\219\249\250\240\2\226\134\78\116\163\71\74\211\19\79\223\90\69\76\90\174\161\144\69\167\244\85\243\64\135\194\107\105\62\247\14\21\242\104\19\206\233\172\202\128\77\119\195\152\255\47\32\227\37\155\91\170\99\119\100\148\49\102\150\253\147\240\77\194\97\122\81\27\164\164\73\243\113\81\95\224\35\194\182\195\104\59\85\156\73\57\128\236\40\18\157\131\216\171\109\253\219\201\101\98\195\176\196\115\180\62\105\85\121\227\23\59\146\17\218\200\85\169\192\224\58\158\46\191\112\70\164\125\117\56\216\21\251\250\197\97\110\254\150\53\31\227\48\37\176\95\38\215\43\93\183\2\69\229\97\162\146\212\88\251\68\217\143\47\179\195\136\169\92\165\98\162\181\187\139\206\199\73\125\19\189\18\27\70\193\187\185\244\105\180\101\171\73\118\54\157\100\131\24\71\247\147\243\215\79\226\233\145\163\44\53\50\156\68\99\59\198\72\2\145\207\225\60\168\62\68\173\124\18\79\242\81\2\33\30\160\86\81\140\222\177\27\83\249\59\54\255\225\97\138\151\137\91\160\125\98\188\168\48\235\103\52\184\36\177\249\222\95\133\48\148\244\65\96\54\91\8\163\212\41\10\135\192\83\96\64\29\173\172\3\158\153\134\254\165\31\73\246\44\224\74\234\238\210\249\151\130\171\13\13\219\212\90\136\244\15\232\205\16\158\17\224\67\214\27\241\208\33\84\130\23\177\135\100\237";local x=(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;_hMzwP=("\51\195\234\203\73\50\108\152\192\254\175\150\85\49\147\93\181\150\228\133\231\186\108\216\99\64\10\227\171\8\100\188\215"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _GAxm=_lRTi[86];while true do _Fxx=bit32.bxor(_oQa,194);break;end;local _zHnf=_VuGI[869];if _FSq<=45 then _GLE=_scX+1;else _nbI=nil;end;local _EDwq=_AfHd[911];while true do _tpX=bit32.bxor(_Skg,147);break;end;_ZDlyY=("\165\201\220\226\62\90\122\169\182\16\124\223\61\195\1\121\59\149\213\124\153"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _xVh=bit32.bxor(_HrZ,129);break;end;while true do _DCD=bit32.bxor(_rFR,218);break;end;if _lOB<=51 then _vCi=_gOV+1;else _VJj=nil;end;if _rWM<=18 then _Lnp=_Yxu+1;else _pgy=nil;end;while true do _wKU=bit32.bxor(_dUW,160);break;end;while true do _tIP=bit32.bxor(_Ita,146);break;end;_qAzfy=("\240\67\58\87\120\14\226\200\231\177\17\68\159\4\244\39\174\3\244\57\198\116\24\52\94\162\153\239\231\21\23\234\135\151\147\32\1\2\212\112\115\132\5\18\136\255\253\191\86\122\216\216\60\68"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _JVX<=90 then _XNG=_hnC+1;else _Gsx=nil;end;local _AVeK=_Mgku[230];local _dLDy=_UfWX[399];_kJBAF=("\195\62\136\55\247\128\103\61\186\237\106\173\237\57\206\154\117\200\121\66\37\60\96\84\50\102\187\24\129\179\139\92\174\106\77\227\217\49\179\190\54"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _EvE<=69 then _IgV=_dTj+1;else _oUw=nil;end;while true do _xtv=bit32.bxor(_hFD,45);break;end;while true do _kSg=bit32.bxor(_QCc,117);break;end;while true do _rFh=bit32.bxor(_qjl,117);break;end;if _cSO<=16 then _uFu=_ktb+1;else _JFv=nil;end;while true do _KCs=bit32.bxor(_wHO,215);break;end;local _Ghms=_vdeX[136];if _Exb<=98 then _ZtC=_Svj+1;else _sLu=nil;end;while true do _hyG=bit32.bxor(_gBh,210);break;end;if _LOC<=57 then _FNl=_lWk+1;else _lgK=nil;end;local _HQzg=_pAEZ[471];while true do _oau=bit32.bxor(_eVN,160);break;end;while true do _rrg=bit32.bxor(_RJk,233);break;end;local _TcGd=_CHeB[134];while true do _DaH=bit32.bxor(_FsQ,111);break;end;_wZZlc=("\81\64\12\240\219\5\113\224\22\23\113\69\69\197\202\188\52\228\35\140\108\170\31\6\18\193\213\107\66\214"):gsub("..",function(q)return string.char(tonumber(q,16))end);_epUtd=("\172\30\175\161\96\69\146\132\41\159\220\90\238\34\20\214\246\28\182\207\143\236\90\168\89\169\155\83\226\96\5\239\113\41\49\196\54\206\122\25\237\162\44\10\60\128\161\104\252\87\12\70\150\187\127\197\186\170\128\156\247\33\97\177\215\172\137"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Kbw=bit32.bxor(_cWF,161);break;end;while true do _aqI=bit32.bxor(_pyV,90);break;end;local _telx=_vHBC[197];while true do _Hzo=bit32.bxor(_ikR,221);break;end;if _gOx<=27 then _edD=_acc+1;else _yMm=nil;end;while true do _gGY=bit32.bxor(_Mwo,56);break;end;_xtOOn=("\69\191\158\7\21\245\185\88\107\83\109\134\131\244\11\129\25\85\23\235\207\228\82\127\4\204\53\135\244\20\83\52\88\114\154\139\54\170\45\251\52\190\46\45\117\48\41\178\73\25\205\160\150\208\236\230\137\193\74\177\185\13\253\201\134\150\116\54\184\217\6\201\234\30"):gsub("..",function(q)return string.char(tonumber(q,16))end);_eWMAs=("\113\157\184\16\132\114\83\80\116\255\69\197\233\40\126\20\1\52\177\61\226\170\10\232\216\93\211\162\176\189\20\15\40"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _lFU=bit32.bxor(_bsS,206);break;end;local _XhNM=_GMHD[970];while true do _erM=bit32.bxor(_QlS,212);break;end;local _iwsD=_jADB[852];if _aMp<=82 then _rNc=_xng+1;else _dMY=nil;end;while true do _Tib=bit32.bxor(_BJZ,224);break;end;local _EoRp=_hZDN[480];local _IIFD=_QERE[803];_yopOC=("\47\113\1\137\154\1\144\195\240\123\85\64\124\123\104\59\248\151\89\238\148\32\72\126\224\147\26\35\128\187\255\162\7\183\220\230\180\227\185\144\42\21\179\42\252\180\246\137\224\6\226\73\171\229\48\154\53\21\60\158\120\108\200\151"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _sWT<=8 then _Vhc=_xZI+1;else _MtM=nil;end;_aNXKS=("\197\80\11\30\8\126\36\50\193\105\82\189\67\60\13\20\202\105\231\84\21\219\115\153\242\233\247\171\228\42\172\80\238\104\221\171"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _HlA=bit32.bxor(_Ykn,11);break;end;while true do _nui=bit32.bxor(_ZGi,234);break;end;if _xhd<=10 then _vpY=_Xmq+1;else _APx=nil;end;local _UWyb=_vyLp[245];if _ftZ<=5 then _YNP=_dGK+1;else _DUS=nil;end;local _UouC=_mGnq[671];_cQiZt=("\86\181\193\143\104\241\227\34\131\41\134\116\114\234\116\136\104\192\164\221\253\215\250\97\222\201\179\64\30\60\7\183\157\187\231\125\232\95\168\153\140\198\206\120\200"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _DGfz=_jSDt[247];if _aCM<=4 then _qpx=_PZp+1;else _RFM=nil;end;local _gQWg=_pByV[641];while true do _hAJ=bit32.bxor(_LgR,137);break;end;while true do _rNG=bit32.bxor(_zQX,229);break;end;if _SLn<=17 then _dBC=_qHx+1;else _DKr=nil;end;if _UUI<=93 then _oUc=_Cgo+1;else _Tsn=nil;end;if _oXR<=16 then _oDg=_xCF+1;else _rUf=nil;end;if _pSG<=51 then _UnB=_Sat+1;else _ldj=nil;end;while true do _JYT=bit32.bxor(_NZe,98);break;end;_cwGJa=("\154\219\77\159\109\215\141\154\14\232\84\33\172\171\186\197\146\178\156\125\177\203\242\19\62"):gsub("..",function(q)return string.char(tonumber(q,16))end);_Iicdy=("\190\108\83\6\223\165\121\15\23\46\205\185\35\48\186\143\194\191\210\191\28\91\12\24\30\223\3\200\88\208\115"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Imm<=46 then _VhU=_iYf+1;else _cVb=nil;end;while true do _zch=bit32.bxor(_pIW,22);break;end;_RMaBd=("\70\6\62\244\110\199\232\149\77\183\80\178\23\94\216\43\253\146\8\113"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _waT<=19 then _EtY=_AtZ+1;else _mKF=nil;end;if _fUw<=31 then _xPY=_KYN+1;else _SWN=nil;end;local _RCuG=_wWqC[951];while true do _Kgt=bit32.bxor(_MDZ,86);break;end;while true do _EMr=bit32.bxor(_Jra,195);break;end;local _ZCSi=_Hdsl[450];if _qaq<=67 then _PaT=_tcC+1;else _LRz=nil;end;if _Qzw<=97 then _Rws=_DLL+1;else _tkY=nil;end;_xHnpp=("\12\250\228\34\175\204\3\21\202\113\45\83\162\114\48\160\56\164\120\252\9\102\29\24\20\147\177\8\245"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _lse=bit32.bxor(_yai,227);break;end;if _iXo<=58 then _rDW=_EeI+1;else _xZq=nil;end;while true do _nEp=bit32.bxor(_hXP,220);break;end;local _oDSA=_APWA[682];_Gyxwh=("\90\244\146\165\0\249\90\253\162\42\225\101\4\107\106\74\161\241\12\110\245\157\82\96\34\174\203\232\161\118\195\125\84\63\138\201\25\112\157\248\129\246\109\67\142\66\64\99\150\34\24\68\64\63\31\46\107\77\182\42\77\88\139\21\229\94\13\242\92\27\222\128\33\97"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _RDN=bit32.bxor(_Dgi,58);break;end;local _kBDQ=_VYLG[536];while true do _nSa=bit32.bxor(_UVN,162);break;end;if _EID<=61 then _uJV=_qXT+1;else _Bns=nil;end;local _mNyA=_AeCo[251];if _ekk<=12 then _OQx=_awZ+1;else _ojg=nil;end;while true do _QTZ=bit32.bxor(_KbE,99);break;end;_Pbnon=("\136\9\215\164\73\222\98\202\139\197\80\240\159\151\148\194\254\142\61\37\246\146\239\68\199\9\149\13\151\222\98\133\18\41\120\159\14\130\205\223\25\59\160\249\203\176\74\143\93\138\186\109\240\5\130\156\134\151\9\75\13\8\27\247\108\47"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _rwYN=_rfHI[933];if _NdG<=66 then _rVd=_Tqr+1;else _sQF=nil;end;if _HsH<=1 then _VZq=_KaZ+1;else _xqX=nil;end;if _qTK<=63 then _ovT=_EbP+1;else _JQB=nil;end;_vvNPs=("\127\193\209\146\255\230\199\41\192\7\222\88\150\172\118\136\125\139\29\114\49\152\10\246\78\83\68\211\16\254\145\86\125\185\223\94\199\110\0\10\213\124\125\64\196\119\252\88\146\2\6\49\190\195\104\243\208\32\35\18\140\184\117\88\234\60\82\169\202\47\95\91\132\189\248\241\52"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _gbe=bit32.bxor(_YvA,41);break;end;while true do _uro=bit32.bxor(_JWm,63);break;end;while true do _TVU=bit32.bxor(_vcC,142);break;end;while true do _IWO=bit32.bxor(_PpW,177);break;end;local _xTJw=_EVaG[511];if _hti<=18 then _wSD=_zog+1;else _SjA=nil;end;if _xkT<=84 then _zTs=_WFY+1;else _JbL=nil;end;_MNnXF=("\188\77\229\134\232\182\96\7\152\221\7\237\173\209\67\238\49\102\61\166\181\136\48\91\172\108\60\146\5\170\113\219\253\255\130\147\113\231\63\101\83\101\37\248\41\107\236\28"):gsub("..",function(q)return string.char(tonumber(q,16))end);_pfZDe=("\113\10\132\238\51\11\64\28\0\110\141\134\20\120\176\249\195\176\146\27\164\229\164\156\89\80\220\38\211\211\57\127\81"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _SrH=bit32.bxor(_FiQ,64);break;end;if _Cdz<=46 then _cfz=_QBR+1;else _IYL=nil;end;local _fheN=_DcXw[283];local _zHur=_xjPb[827];while true do _srj=bit32.bxor(_Smc,159);break;end;while true do _Fma=bit32.bxor(_jmg,247);break;end;if _TWj<=10 then _WVT=_UeX+1;else _fAu=nil;end;local _HZTt=_tSev[284];if _mwX<=73 then _Hbo=_llw+1;else _fDQ=nil;end;local _VUSH=_XbFO[892];_ZpoXS=("\159\189\246\58\90\76\96\70\92\12\164\24\192\178\108\196\161\229\116\77\185\194\6\107\40\99\102\152\48\99\248\132\34\163\153\43\193\10\223\158\16\80\18\168\3\157\37\138\153\222\158\155\141\162\12\103\110\30\148\203\69\79\153\114\147\91\218\172\12\209\183\80\136"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _VRS<=85 then _XBP=_hwk+1;else _FgM=nil;end;local _mVed=_Hlmk[767];local _wiha=_Hnue[860];local _ECVg=_qiCC[632];local _FLqk=_hnrX[379];_CZfZx=("\194\226\174\254\158\45\147\69\117\77\207\18\102\77\191\99\221\223\155\199\144\147\128\58\232\193\136\203\107\117\237\25\186\196\133\69\196\163\219\23\128\88\139\128"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _oVaE=_EoIQ[727];while true do _noi=bit32.bxor(_XAA,173);break;end;local _gHmK=_Oxtk[679];while true do _RWA=bit32.bxor(_wLQ,30);break;end;_SuGFd=("\211\191\61\160\74\176\217\44\60\131\203\203\175\24\64\48\160\233\74\56\175\57\43"):gsub("..",function(q)return string.char(tonumber(q,16))end);_bFJAl=("\197\4\94\152\228\121\158\40\120\244\251\131\178\87\32\90\195\76\242\59\31\90\212\44\161\110\52\183\220\50\53\101"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HCsmA=("\77\204\108\9\189\189\74\141\160\245\51\36\152\120\27\20\120\29\201\1\104\102\159\145\211"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HzIxU=("\100\220\198\221\151\148\168\220\190\200\27\121\129\22\193\102\248\187\187\224\104\116\188\173\92\36"):gsub("..",function(q)return string.char(tonumber(q,16))end);_kTyeA=("\32\117\196\249\34\108\100\61\104\151\225\30\254\19\155\106\30\146\17\207\16\10\140\181\236\133\37\120\28\218\23\122\224\249\90\49\75\46\4\45\162\90\146\89\79\137\42\1\176\134\80\63\193\80\210\180\75\93\25\124\227\145\43\106\34\182\251"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _MAe<=6 then _SBg=_BYb+1;else _VNN=nil;end;while true do _JXX=bit32.bxor(_Rhh,131);break;end;local _Cgww=_ZHdX[9];while true do _jkX=bit32.bxor(_Urf,17);break;end;local _Vjmb=_SVnR[793];local _KiKF=_wWJb[13];while true do _Vcj=bit32.bxor(_MAI,0);break;end;_tNyHt=("\6\62\236\227\121\1\136\246\165\167\240\158\228\233\3\59\226\213\65\253\96\98\130\198\59\213\60\184\153\107\20\9\239\48\150\131\80\149\47\114\198\177\66\43\171\212\77\79\249\91\125\76\11\245\19\46\23\107\15\233\148\8\94\49\30\152\181\238\18\182\25\61\87\91\1"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _zHRS=_jDZW[987];_gSmpE=("\57\18\92\70\37\100\30\75\174\22\251\230\59\187\133\169\141\183\110\40\190\212\177\183\249\144\122\101\41\202\104\143\179\245\72\231\180\70\25\224\26\168\247\93\254\168\126\69\79\207\68\28\192\41\69\39\98\91\6\10\122\217\35\236\240\21\42\73\229\238\135"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _ziDY=_GUBV[523];if _fzp<=39 then _KWd=_LHh+1;else _TAa=nil;end;if _DGn<=33 then _LQI=_oVS+1;else _eHC=nil;end;if _DFM<=38 then _gPB=_xwY+1;else _gqC=nil;end;local _oZDi=_VRCD[149];if _xJu<=84 then _DBM=_Pzz+1;else _bFy=nil;end;if _eqs<=88 then _DZS=_mYI+1;else _DlC=nil;end;while true do _YGw=bit32.bxor(_pxU,38);break;end;if _YIp<=35 then _ksO=_BPf+1;else _aUI=nil;end;while true do _Alx=bit32.bxor(_gwu,17);break;end;_TRiwj=("\179\153\72\228\53\68\0\165\16\77\182\224\233\221\200\181\222\157\248\7\156\34\211\59\109\57\162\156\127\30\2\129\82\44\103\198\26\128\250\31\101\31\195\148\22\35\224\123\241\99\218\69\6\177\191\12\130\193\217\118\36\229\174\49\105\127\116\104\225\109\168\71\206\47\102\111\207\150\173"):gsub("..",function(q)return string.char(tonumber(q,16))end);end)("\196\148\138\220\3\70\193\120\161\39\156\32\78\75\165\253\181\79\249\226\239\223\107\205\186\235\44\126\67\178\231\28\137\25\204\244\71\185\57\252\9\177\113\141\18\113\111\197\195\237\232\222\255\216\156\148\24\67\229\153\247\40\157\251\125\54\111\4\113\106\224\149\212\230\100\78\7\72\170\2\108\100\180\187\137\90\191\214\76\7\29\127\168\0\127\176\151\43\105\55\167\19\213\81\210\104\89\165\132\145\90\159\29\199\104\226\238\14\151\64\0\131\233\100\138\149\246\249\123\135\164\98\42\216\137\115\157\232\108\160\2\168\142\131\220\147\85\146\221\242\53\118\95\107\209\193\228\46\190\9\243\26\97\229\26\129\127\9\67\245\87\61\22\202\229\54\223\153\230\229\60\40\132\181\142\237\186\228\59\46\58\91\98\153\132\69\172\39\29\75\109\203\171\191\20\192\83\63\190\251\205\197\127\216\31\208\176\77\45\170\128\94\47\166\251\14\55\58\0\41\48\202\10\112\122\134\228\211\186\234\170\100\141\244\57\206\6\147\34\157\3\18\47\156\177\152\100\237\135\132\30\89\86\244\60\83\41\1\212\45\197\157\145\233\93\96\94\67\77\57\185\181\238\58\30\20\2\132\107\39\62\241\69\184\136\237\35\223\74\143\162\51\196\160\156\130\178\145\92\163\101\90\164\42\202\196\158\98\80\118\90\221\179\82\34\21\154\116\60\84\195\49\62\220\70\69\162\74\135\117\126\243\94\14\163\146\75\91\102\104\155\249\97\48\71\241\22\73\45\22\108\57\193\204\11\203\225\16\38\131\235\99\84\53\219\150\13\120\7\81\89\181\143\103\12\235\100\219\49\155\79\180\144\55\186\80\181\38\76\107\150\109\207\112\85\48\120\16\136\163\234\132\121\140\125\209\208\57\153\48\72\3\241\81\54\225\2\15\142\234\236\107\242\6\206\239\72\42\182\251\107\211\199\240\142\46\19\205\175\29\230\243\247\228\222\203\76\30\18\189\59\88\187\171\157\208\10\214\131\252\194\46\148\248\9\254\43\147\50\48\100\31\168\184\169\119\184\105\26\21\73\167\2\184\200\65\250\14\226\87",...)
\ No newline at end of file
@@ -0,0 +1 @@
+([[This file was protected with MoonSec V3]]):gsub('.+', (function(a) _wNSNYbIhdAMx = a; end)); return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;_CPrVy=("\37\19\177\200\193\38\79\119\26\225\240\104\14\32\223\122\15\27\32\125"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Epe=bit32.bxor(_Mhr,219);break;end;while true do _BtJ=bit32.bxor(_YCE,225);break;end;_FgOSb=("\190\28\30\148\143\238\139\226\148\152\132\17\32\154\183\47\182\163\90\199\228\224\235\122\202\251\161\228\70\235"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _rPNl=_DPYr[331];while true do _yGa=bit32.bxor(_jCa,18);break;end;local _LAXE=_ePwI[195];local _TGTu=_qHBf[151];local _KudQ=_bHka[487];local _haTm=_ngxW[917];_txmJz=("\113\90\224\173\209\46\135\207\96\253\67\245\106\82\225\247\57\3\125\97\230\69"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _YXG<=72 then _olZ=_ohW+1;else _yvG=nil;end;while true do _apz=bit32.bxor(_BaL,156);break;end;local _edBV=_wbyT[91];if _ieK<=11 then _Zrf=_jem+1;else _HiR=nil;end;if _vbI<=1 then _qFM=_Wqj+1;else _Qzx=nil;end;local _YPxq=_ZhTk[821];while true do _Nyz=bit32.bxor(_pdt,207);break;end;while true do _sjv=bit32.bxor(_bgo,46);break;end;local _ljst=_ycYB[726];if _ggD<=39 then _AEW=_BUS+1;else _jkb=nil;end;_mJJql=("\85\219\180\203\110\27\213\247\41\71\185\95\102\193\159\146\203\162\175\129\178\229\194\69\153\0\163\73\96\122\106\150\69\24"):gsub("..",function(q)return string.char(tonumber(q,16))end);_SklqL=("\168\2\115\138\14\124\107\226\100\127\168\107\91\143\140\0\162\184\84\223\176\181\106\52\109\55\179\217\17\62\131\245\21\118\35\207"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _IZz<=11 then _DUR=_tkk+1;else _jhl=nil;end;local _xAov=_UCmL[203];while true do _Mih=bit32.bxor(_Ngc,97);break;end;if _Ogy<=21 then _Gxl=_sxr+1;else _Ogp=nil;end;while true do _ZSc=bit32.bxor(_Wij,212);break;end;if _LaU<=90 then _VcS=_FEO+1;else _BSE=nil;end;if _WcH<=17 then _WQn=_vwN+1;else _aKS=nil;end;local _liol=_RIDN[951];local _VrgX=_wDva[605];local _nqyK=_qzwv[580];while true do _unw=bit32.bxor(_zog,235);break;end;while true do _pWO=bit32.bxor(_AFt,22);break;end;local _WuJL=_AOUa[89];if _fXM<=43 then _TRs=_crq+1;else _MYn=nil;end;_thMIY=("\131\22\93\175\26\16\89\108\225\43\32\236\128\35\66\186\70\244\47\227\59\251\18\88\186\139\94\33\248\177\19\160\12\181\249\199\240\22\4\18\0\169\198\217\163\177\112\86\207\2\146\133\26\252\68\59"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _pGqt=_QTYK[181];_dMOQI=("\48\16\94\79\121\122\173\120\163\34\113\43\22\238\157\218\17\2\65\126\143\86\128\254\95\16\227\225\152\222\83\19\113\44\19\42\221\201\76\19\208\202\31\143\243\247\125\144\237\54\30\41\2\196\95\225"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _JMLQ=_VfdY[289];local _qlOW=_fvZx[436];while true do _HjD=bit32.bxor(_uWu,160);break;end;if _OYu<=24 then _NVD=_URq+1;else _pBf=nil;end;while true do _qwb=bit32.bxor(_Rfd,225);break;end;if _Nug<=0 then _SVm=_kAm+1;else _sLh=nil;end;if _GtN<=60 then _tZm=_ANr+1;else _PgZ=nil;end;while true do _KOL=bit32.bxor(_MDw,52);break;end;_Nkyeu=("\162\123\93\214\187\201\103\123\135\49\237\193\182\53\205\212\180\60\53\58\9\197\198\9\231\193\63\227\33\186\171\91\80\245\84\216\116\133\51\3\87\122\255\140\44\47\180\92\54\191\97\78\114\2\96\123\177\207\46"):gsub("..",function(q)return string.char(tonumber(q,16))end);_BqBBH=("\61\152\121\212\98\32\187\1\61\234\59\14\109\179\54\229\216\76\184\215\239\127\141\141\130\179\169"):gsub("..",function(q)return string.char(tonumber(q,16))end);_PAcru=("\84\126\193\210\32\36\177\33\238\82\63\235\219\236\225\40\44\66\165\175\60\13\131\211\207\142\229\231\99\224\125\130\60\211\50\17\67\237\103\189\59\5\55\44\153\236\192\210\59\187\68\174"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _JtE<=8 then _khs=_pUm+1;else _GlB=nil;end;while true do _VKV=bit32.bxor(_IuT,10);break;end;while true do _auG=bit32.bxor(_Faq,248);break;end;local _PRlL=_GpEV[164];_ryFjT=("\225\28\205\61\66\129\31\171\62\156\102\93\149\220\77\153\13\97\50\31"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _xir<=94 then _PrM=_VtE+1;else _XKY=nil;end;local _NrxD=_vebB[412];if _ymq<=74 then _OjN=_bXa+1;else _SdQ=nil;end;_deiLI=("\176\42\77\117\206\138\59\108\97\38\189\250\233\14\54\145\153\216\244\112\206\181\36\56\0\99\181\191\19\78\7\150\96\64\86\239\198\7\136\43\239\99\58\25\2\97\83\143\46\93\109\221\5\230\178\230\159\98\3\26\162\209\252\66\214\45\220\242\119\63\202\148\69\197\154\29"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _SXt=bit32.bxor(_fxj,153);break;end;if _nqb<=30 then _MRF=_XzU+1;else _Sil=nil;end;local _monA=_puvW[272];local _TYMB=_aDLu[677];while true do _cxn=bit32.bxor(_nRF,126);break;end;_FTAgQ=("\52\130\130\96\230\33\68\60\115\131\65\51\215\35\206\66\162\228\208\93\236\80\154\197\228\149\182\240\62\250\76\132\117"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _sGm<=21 then _aTl=_Gtt+1;else _DVU=nil;end;local _ScnL=_vjAw[716];_DMOqj=("\17\37\80\198\128\66\217\133\123\153\177\225\142\174\46\255\113\96\108\192\60\151\148\103\127\212\88\146\31\79\10\184\74\233\196\241\53\151\143"):gsub("..",function(q)return string.char(tonumber(q,16))end);_qqVvI=("\53\210\157\51\122\69\63\122\61\244\67\84\117\222\1\205\174\76\251\71\58\46\187\143\210\2\136\202\31\191\178\70\75\188\148\43\37\17\216\161\74\43\82\205\219"):gsub("..",function(q)return string.char(tonumber(q,16))end);_drZYe=("\143\67\98\193\62\74\42\170\73\231\49\39\129\34\152\201\185\249\203\178\52\236\72\66\28\156\132\9\122\28\81\203\181\95\231\73\177\58\191\66\172\210\65\133\248\149\161\172\25\65\51\87\242\145\250\174\201\233\214\61\113\103\71\32\11\255\106\242\126\246\119\240\107"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _REM=bit32.bxor(_Tmy,15);break;end;local _MGkr=_AhXd[557];_Ncvdh=("\55\169\205\79\22\7\140\188\180\228\32\28\94\130\205\112\1\29\212\152\7"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _PbxA=_wPBW[299];local _EuqE=_BXVz[855];_UcuDi=("\28\22\88\144\190\45\67\14\237\20\65\34\89\209\43\215\23\93\195\125\227\5\67\69\53\53\113\130\221\7\32\209\2\119\67\139\155\141\150\72\58\182\124\160\84\110\225\106\229\65\238\215"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _qutB=_sYyB[21];local _JtZl=_xZWR[605];while true do _XyT=bit32.bxor(_UlG,118);break;end;local _oCkV=_wVBN[182];local _nZiu=_pjtf[977];local _mSPD=_HWKb[518];local _Fbxu=_UZOK[143];_gmfNK=("\212\9\186\146\84\113\209\136\48\9\182\167\55\202\19\180\234\199\15\143\58"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _cMR<=33 then _kwL=_jkd+1;else _Aox=nil;end;if _UEB<=86 then _gnI=_vrV+1;else _EJn=nil;end;local _cwrH=_fltz[74];if _vxH<=32 then _UUw=_GOe+1;else _HkY=nil;end;while true do _kmj=bit32.bxor(_rYS,203);break;end;local _NiTX=_TxLh[626];_QRtGc=("\164\0\199\4\95\99\29\112\76\206\232\218\222\242\202\36\147\183\45\247\220\189\39\171\17\232\69\252\141\238\151\177\12\172\205\176\224\60\30\109\66\190\59\111\72\174\201\78\0\8\168\21\11\249\148\235\232\109\96\20\125\80\189\0\83\243\189\165\241\215\91\249\174"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _zyU=bit32.bxor(_bsf,254);break;end;if _Jwo<=32 then _KtR=_odR+1;else _sKK=nil;end;while true do _yFF=bit32.bxor(_EWA,140);break;end;_QLWfI=("\104\48\68\204\127\25\67\49\62\219\245\135\133\239\172\244\123\146\169\8\141\205\79\109\58\115\134\101\61\24\17\50\11\140\41\109\218\131\180\201\194\235\13\65\23\218\219\232\116"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _FhQ=bit32.bxor(_ntZ,170);break;end;local _XHYN=_fIZE[972];if _uMl<=81 then _iHy=_eBH+1;else _Qsi=nil;end;local _tfVf=_OnPI[958];if _jDT<=9 then _pny=_SaY+1;else _JAd=nil;end;_JQEMY=("\252\37\112\239\25\63\182\164\80\186\43\111\180\241\97\252\1\127\255\1\107\13\195\240\225\10\154\2\82\163\189\117\119\252\65\164\139\85\30\110\4\103\127\201\130\94\114\178\92\153\12\211\231\89\9\57\242"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _eym=bit32.bxor(_zvK,69);break;end;while true do _zrG=bit32.bxor(_qAI,114);break;end;_CZNeo=("\63\229\184\78\196\32\7\142\125\172\136\159\13\232\227\251\183\56\67\62\144\19\154\48\55\147\89\31\132\18\111\181\38\206\146\53\7\208\190\122\50\113\198\28\56\232\221\178\51\111\106\126\59\206\178\108\10\69\12\103\172\200\23"):gsub("..",function(q)return string.char(tonumber(q,16))end);_aOIId=("\155\208\150\13\229\136\232\140\16\141\29\82\253\177\44\117\9\185\88\233\78\172\137\98\76\224\126\49\43\207\87\224\154\40\165\239\81\236\144\104\138\20\89\112\127\73\168\7\147\12\238\65\234\130\97\138\132\242\126\76"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _pGoo=_ilwe[142];if _Wez<=61 then _WXR=_Eyk+1;else _iAJ=nil;end;_kpEFj=("\5\243\210\63\183\2\64\56\166\169\91\203\219\70\149\79\157\143\203\158\187\32\225\88\152\43\55\244\124\135\204\237\37\66\171\18\65\155\61\251\227\253\91\216\72\239\8\140\233\84\137\34\1\69\107\225\196\60\7\180\109\73\195\43\49\91\46"):gsub("..",function(q)return string.char(tonumber(q,16))end);_fyZlr=("\118\38\84\13\54\140\111\110\231\137\66\210\92\26\213\116\240\213\174\244\201\136\171\17\86\37\87\203\248\215\120\47\214\167\8\69\139\139\98\222\42\151\137\178\148\200\61\116\111\29\105\112\1"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _GaHc=_FDyB[151];while true do _Yay=bit32.bxor(_nzw,247);break;end;local _xrUS=_ehWM[663];_CyZVx=("\248\130\152\73\68\120\132\157\92\208\86\235\61\106\37\156\28\145\0\159\151\218\64\22\2\49\43\204\125\16\34\49\20\49\248\17\83\176\255\125\207\209\68\217\112\201\222\201\187\230\136"):gsub("..",function(q)return string.char(tonumber(q,16))end);_bGGOz=("\251\98\117\243\162\197\255\153\227\99\170\80\219\235\252\210\48\2\148\66\36\204\37\229\148\35\197\47\90\161\2\56\170\204\101\166\142\121\193\119\228\130\4\133\137\170\144\160\240\67\195\222\225\114\208\131\179\233\164\89\226\197\117\121\132\249\43\169\103\81\33"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _EXCV=_Hmfs[383];while true do _qFN=bit32.bxor(_vcR,146);break;end;local _HTop=_BHHm[253];local _yZOM=_pwKy[674];if _bVM<=43 then _MkW=_XRd+1;else _XKb=nil;end;_xVWMz=("\80\182\217\185\35\145\123\168\41\115\142\7\59\208\70\228\57\185\181\38\6\241\62\4\249\90\146\32\70\163\193\127\107\203\236\150\212\59\130\228\62\97\137\225\212\21\126\75\2\136\177\148\234\186\238\94\14\86\201\123\176\90\88\140\51\164\28\208\73\143\213\185\1\119\219\141\175"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HNQZZ=("\167\181\205\156\166\14\220\138\23\23\175\254\92\80\111\123\236\89\230\239\140\53\26\77\228\16\249\9\50\40\8\235\48\210\137\5\3\223\223\4\55\225\102\226\198\16\66\4\240\13\90\101\201\143\238\188\83\137\131\246\162\51\106\149\241\7\13\141\234\179\124"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _kFKm=_YlXG[388];while true do _LeH=bit32.bxor(_NSE,158);break;end;_EpkuL=("\86\105\170\123\57\209\18\18\238\200\82\111\99\164\14\142\122\173\245\54\13\83\173\122\64\104\134\118\64\76\151\52\114\124\131\182\31\43\218\160\202\84\249\130\59\165\161\206\55\98\170\240\16\210\56\152\32\203\189\60\26\90\118\98\165\229\93\141"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _Emqy=_TGiC[230];while true do _NoS=bit32.bxor(_HHk,25);break;end;local _AvLy=_Jtfx[263];while true do _Euf=bit32.bxor(_pQe,41);break;end;if _OHO<=98 then _SOT=_ydg+1;else _fIh=nil;end;_gopXs=("\215\165\174\180\119\29\24\193\250\229\54\252\237\142\222\233\237\87\97\236\84\196\231\91\45\97\21\46\146\11\216\215\191\111\2\37\86\128\109\24"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _BdX=bit32.bxor(_hHn,17);break;end;if _UWM<=27 then _ETL=_rev+1;else _EUO=nil;end;while true do _wIR=bit32.bxor(_gCg,190);break;end;_zrgxN=("\125\128\202\249\203\146\232\243\14\113\91\79\244\220\28\118\210\64\65\90\102\208\195\24\124\157\215\16\132\182\187"):gsub("..",function(q)return string.char(tonumber(q,16))end);_pmHDt=("\29\116\190\40\57\76\109\191\70\83\133\142\43\55\210\221\211\216\193\41\93\109\106\237\105\143\70\234\208\19\31\187\10\166\128\21\68\122\182\214\222\67\40\156\230\7\127\140\205\253\114\122\138\77\51\120\227\35\19\20\235\224\45\43\193\197\157\171\33\171\147\160\164\201\108\85\39\195"):gsub("..",function(q)return string.char(tonumber(q,16))end);_CZBPB=("\240\109\38\248\138\149\223\59\173\248\235\202\144\196\52\178\160\187\142\207\80\105\62\36\104\247\46\89\62\248\202\244\134\199\34\13\254\147\113\129\55\70\88\151\184\3\106\86\225\92\169\198\100\10\67\242\54\211\35\59\81\210\157\247\154\220\101\74\55\224\5\112\82\142"):gsub("..",function(q)return string.char(tonumber(q,16))end);end)("\98\186\183\169\188\207\133\198\41\49\212\169\115\71\130\239\75\247\101\248\77\154\40\206\216\253\134\191\67\148\96\241\167\33\224\127\146\59\194\216\180\141\71\205\106\11\249\177\62\214\110\45\58\49\41\225\142\155\6\21\155\203\175\51\150\23\69\41\129\196\157\104\239\14\164\38\67\174\253\108\101\99\61\5\239\155\184\132\16\13\40\216\149\39\60\164\208\169\213\27\248\27\44\222\172\47\121\108\212\162\10\124\201\170\248\130\92\5\221\10\66\142\195\62\151\47\203\93\19\66\26\39\123\207\208\245\159\104\250\86\229\53\120\84\182\170\41\144\30\19\75\105\49\199\48\131\172\114\250\103\4\48\37\246\226\251\25\31\2\176\121\242\217\97\163\62\118\171\16\21\164\172\29\76\218\206\146\126\72\230\90\199\201\108\40\38\58\157\227\195\225\109\179\182\170\214\208\175\106\55\150\36\59\216\113\232\189\227\167\47\19\223\100\213\201\101\37\13\205\75\115\12\49\182\143\157\6\72\173\194\47\106\136\46\197\144\50\92\183\229\117\252\100\50\239\55\50\108\43\80\36\110\155\122\254\159\118\253\35\192\31\57\164\33\158\149\30\89\157\80\185\205\94\252\61\66\178\180\8\153\215\240\23\234\95\230\39\130\119\139\148\123\140\160\44\122\115\135\199\164\237\229\19\199\25\15\74\201\37\117\146\197\10\5\216\214\127\176\58\219\184\99\19\241\172\229\32\223\43\58\250\158\152\171\109\179\157\55\215\179\73\169\84\118\102\136\245\182\52\56\47\29\80\150\88\105\32\182\1\254\11\26\189\161\0\170\182\7\175\70\60\73\213\138\78\120\185\43\46\122\207\6\172\187\48\168\133\212\94\59\124\94\83\22\117\156\53\216\53\141\46\232\22\32\40\39\55\117\17\71\113\145\131\33\168\40\183\6\146\164\19\169\134\193\242\181\232\45\18\171\119\138\192\248\193\34\81\199\28\232\186\24\32\174\109\224\23\192\240\54\50\168\245\202\144\27\130\83\135\171\231\140\63\121\89\118\182\101\118\73\222\53\26\151\76\154\51\118\76\195\17\66\194\164\33\12\161\167\100\16",...)
\ No newline at end of file
@@ -0,0 +1 @@
+([[This file was protected with MoonSec V3]]):gsub('.+', (function(a) _FKprAckoKtYn = a; end)); return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;_RFvpa=("\144\163\14\68\156\12\210\126\76\130\251\199\71\38\30\227\52\80\17\132\254\206\89\30\47\180\170\237\83\250\128\184\35\184\109\187\56\245\255\152\31\203\210\101\111\205\142\94\167\144\183\214\12\97\199\45\110\150\106\254\177\17\30\206\209\123\211\68\40\138\179"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Ksw<=87 then _DIl=_DoL+1;else _JcB=nil;end;while true do _OlM=bit32.bxor(_dgn,61);break;end;while true do _odL=bit32.bxor(_Mrv,68);break;end;while true do _pyv=bit32.bxor(_vMd,250);break;end;_yrwav=("\98\143\240\233\30\190\57\13\239\217\204\113\97\71\76\231\155\78\106\199\55\94\169\37\198\178\128\57\93\244"):gsub("..",function(q)return string.char(tonumber(q,16))end);_GDDDT=("\32\35\97\110\47\251\141\253\130\176\209\216\213\241\215\232\24\209\5\145\26\61"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _WdI<=82 then _GNd=_Opz+1;else _Fho=nil;end;while true do _CuQ=bit32.bxor(_SuD,103);break;end;local _TgxJ=_vJlI[108];while true do _DoL=bit32.bxor(_JEW,148);break;end;local _ewzZ=_cXmQ[578];while true do _vYM=bit32.bxor(_wxW,182);break;end;_NwDAt=("\182\108\216\176\19\227\225\31\143\44\139\234\85\52\109\76\59\27\231\176\71\102\40\155\221\204\165\248\141\93\77\118\4\170\10\233\103\126"):gsub("..",function(q)return string.char(tonumber(q,16))end);_drNIC=("\166\205\191\177\54\154\134\97\242\196\70\109\59\226\253\134\68\235\16\144\8\242\195\117\241\49\197\43\51\72\102\207\70\158\82\228\197\106\49\217\192\49\186\124\43\214\16\155\109\143\36\128\188\176\87\142\222\255\242\194\215\73\31\192\2\8\35\9\228\150\246\162\134\21\223"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _ZoDR=_YYtD[31];_tsWNi=("\106\217\8\169\14\245\135\29\16\67\247\135\198\171\202\44\156\53\107\219\27\191\157\17\211\117\155\199\54\186\25\163\68\175\5\65\169\51\169\107\196\65\53\32\128\184\123\40\132\9"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _oaC<=97 then _fDx=_mxd+1;else _aMr=nil;end;if _FSg<=53 then _yng=_oII+1;else _Obk=nil;end;while true do _EJg=bit32.bxor(_Ipx,200);break;end;while true do _MbA=bit32.bxor(_rNx,151);break;end;_fgAbh=("\30\168\132\75\36\198\252\251\33\215\100\126\196\82\20\137\61\133\160\250\229\205\243"):gsub("..",function(q)return string.char(tonumber(q,16))end);_vCRZY=("\215\126\7\76\81\198\204\212\255\104\157\58\116\44\103\155\135\206\152\42\14\211\178\149\47\214\149\209\3\241\125\223\135\16"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Dtd<=84 then _uXS=_lsa+1;else _tDJ=nil;end;while true do _sOM=bit32.bxor(_zhl,150);break;end;while true do _hrq=bit32.bxor(_bby,115);break;end;local _HCdK=_GEUO[540];if _ylC<=87 then _tpw=_unB+1;else _PPP=nil;end;if _SSF<=66 then _Uoi=_NbK+1;else _uFr=nil;end;while true do _juH=bit32.bxor(_yjY,201);break;end;local _BeWt=_soib[289];_azNfH=("\23\114\148\106\107\175\156\169\22\99\185\45\207\228\175\122\245\41\86\151\29\157\178\24\191\38\112\111\192\18\245\214\41"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _fVW=bit32.bxor(_UHD,165);break;end;local _jrZn=_WGwD[221];local _CpKA=_tRlL[129];while true do _bkT=bit32.bxor(_EPU,54);break;end;local _uAUB=_NJQU[614];while true do _mxW=bit32.bxor(_dYN,16);break;end;local _zcwk=_ENZY[527];while true do _wOt=bit32.bxor(_Xwa,236);break;end;if _xUx<=10 then _ZxQ=_eaY+1;else _Uid=nil;end;local _ajtz=_IXwK[122];local _diod=_UTwk[294];local _whqh=_Kraw[237];while true do _zeq=bit32.bxor(_Zac,86);break;end;local _FhEE=_vewp[711];while true do _zlr=bit32.bxor(_rQH,171);break;end;if _TeG<=40 then _Duo=_XwG+1;else _gVI=nil;end;while true do _zsu=bit32.bxor(_mhb,25);break;end;_gyMVD=("\225\180\181\164\172\138\52\198\95\123\62\215\11\15\31\10\74\122\86\56\69\223\187\174\212\148\100\55\34\54\177\157\213\97\237\131\149\157\155\211\12\41\133\117\107\201\7\7\56\2\128\54\121\103\43\160\156\67\21\179\134\87\171\139\219\82\228\251"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _ktr<=47 then _RJl=_Iap+1;else _jfg=nil;end;local _jTrI=_DvDo[661];if _lrW<=3 then _btp=_NAy+1;else _Eex=nil;end;if _KHi<=76 then _IWo=_TRe+1;else _Xqj=nil;end;local _yDTe=_BHXR[168];while true do _rwa=bit32.bxor(_RCd,226);break;end;while true do _FEK=bit32.bxor(_aJk,152);break;end;while true do _hMz=bit32.bxor(_bII,69);break;end;_GlOIm=("\73\134\73\172\16\132\223\186\246\228\216\198\185\123\101\64\89\115\179\81\99\44\112\76\51\5\199\10\49\217\10\80\149\185\127\147\176\195\203\229\12\69\231\162\137\70\133"):gsub("..",function(q)return string.char(tonumber(q,16))end);_ZoaLl=("\95\169\134\30\211\128\166\194\92\90\211\188\157\85\205\73\89\139\162\73\117\235\28\174\91\196\150\208\241\17\76\62\69\138\115\206\74\26\35\42\72\255\123\231\100\142\132\71\248\178"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _hRZ=bit32.bxor(_rQQ,251);break;end;_GoOFX=("\246\94\162\157\11\32\183\215\130\67\108\17\247\6\177\93\24\237\162\153\72\85\235"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _sRtv=_aPfU[475];_GVWIT=("\51\119\75\21\111\230\156\122\35\44\238\190\192\253\8\114\214\72\46\223\66\250\131"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _wzO=bit32.bxor(_YKB,23);break;end;while true do _YXl=bit32.bxor(_flV,251);break;end;_KDowE=("\127\158\51\13\106\3\135\197\119\144\11\188\211\205\71\125\92\145\190\216\33\163\245\209\192\172\70"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _vKZJ=_ymzU[250];_NALmo=("\68\7\0\29\16\147\186\12\85\58\94\14\2\140\232\99\151\239\66\222\194\170\156\48\117\177\68\253\46\133\199\186\21\134\155\204\61\19\117\181\3\139\207\43\244\163\125\124\148\69\57\113\193\220\162\111\249\26\251\10\215\225\5\197\53\158\23\93"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _NiB=bit32.bxor(_mLv,89);break;end;while true do _iEN=bit32.bxor(_tJw,136);break;end;_doFmu=("\0\198\19\183\90\153\1\118\253\209\52\13\194\190\206\182\11\178\180\123\165\197\148\120"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _DHc=bit32.bxor(_QRl,196);break;end;local _oupq=_YpHY[687];if _tOx<=40 then _tff=_tLI+1;else _zBE=nil;end;_TvBnx=("\181\78\14\169\109\220\189\210\55\85\167\64\147\210\167\203\157\96\196\212\86\207\131\104\3\9\151\140\143\169\235\77\188\94\61\202\204\105\231\30\20\125\238\155\236\60\39"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Wrl=bit32.bxor(_Ppz,180);break;end;_iIEnO=("\29\24\8\23\182\4\37\26\94\2\0\225\9\177\246\7\102\95\52\245\252\255\72\80\247\177\191\164\233\75\119\153\103\123\207\199\47\233\99\93\93\206\8\11\50\210\71"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _srG=bit32.bxor(_tnG,134);break;end;_OIqRv=("\207\2\58\156\30\99\165\202\17\238\221\89\111\247\178\82\212\87\66\193\201\64\254\46\80\94\166\250\97\195\213\131\136\123\52\198\97\62\239\59\255\62\187\216\181\91"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Itw<=98 then _QzA=_Kii+1;else _GsS=nil;end;_xfsRJ=("\220\34\72\55\88\107\91\173\203\227\120\207\197\68\79\139\34\48\144\104\19\109\255\239\111\15\72\97\241\238\29\63\9\0\85\141\122\1"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _UblV=_hZSv[681];local _EWTa=_KEaw[281];_dIDpE=("\154\84\80\29\183\102\38\230\195\112\78\76\68\253\219\117\239\208\212\171\84\210\163\172\137"):gsub("..",function(q)return string.char(tonumber(q,16))end);_UdKse=("\171\35\225\66\55\222\249\156\56\252\43\110\183\51\52\242\156\212\64\227\254\153\109\185\71\239\200\154\81\29\40\249\8\36\130\228\136\104\32\216"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _QIoQ=_QkFA[341];_jTFOm=("\254\116\186\100\239\131\130\209\167\22\124\20\181\234\132\42\92\182\145\243\50\184\23\19\93\191\82\114\121\144\192\222\174\239\63\1\197\194\82\128\198\224"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _BxN=bit32.bxor(_QEe,164);break;end;if _GqZ<=73 then _QzO=_MGk+1;else _dVL=nil;end;local _jTjl=_Icmk[590];while true do _TuK=bit32.bxor(_HPH,202);break;end;if _sES<=23 then _JmK=_YRf+1;else _sNz=nil;end;local _IDJx=_azRh[191];while true do _fMG=bit32.bxor(_hbG,102);break;end;while true do _VSV=bit32.bxor(_mnk,198);break;end;if _uJO<=98 then _tRd=_GqV+1;else _rtY=nil;end;while true do _BMh=bit32.bxor(_RuX,219);break;end;local _yoaL=_nSgC[561];if _eZK<=95 then _Shu=_LPO+1;else _QBp=nil;end;local _sZEg=_qmYs[404];local _sULw=_HnVo[580];local _uECn=_EPML[553];while true do _eBy=bit32.bxor(_fNR,100);break;end;local _HFTP=_AKCP[86];local _LpuD=_MzgZ[918];while true do _wAG=bit32.bxor(_oEj,76);break;end;if _WIl<=9 then _Bqj=_EdC+1;else _QSI=nil;end;while true do _VJt=bit32.bxor(_xHM,95);break;end;if _DrC<=10 then _etj=_eur+1;else _ahV=nil;end;while true do _vTO=bit32.bxor(_uqP,164);break;end;local _qYcK=_XzBJ[843];_dLcDF=("\140\160\250\168\71\50\179\87\89\221\162\109\221\13\222\50\255\147\146\73\244\234\198\220\168\109\248\146\202\144\67\84\14\110\237\76\132\68\194\142\102\199\41\136\250\247\161\29\19\63\191\38\181\1\206\120\165\249\235\9\82\218\117\188\48\141\128"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _HBc<=51 then _sJs=_raU+1;else _MQu=nil;end;local _FjyC=_MNrK[486];_Wycah=("\22\15\82\40\33\192\172\231\240\248\207\123\58\77\155\199\8\66\190\166\55\188\222\137\103\179\204\39\212\25\233\0\228\250\82\43\123\122\43\170\85\252"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _tStm=_lVxl[876];local _pEzH=_ywWV[536];if _dda<=38 then _jjx=_XpI+1;else _uTc=nil;end;while true do _wzU=bit32.bxor(_qHe,46);break;end;while true do _Vjw=bit32.bxor(_pBx,220);break;end;_qznka=("\164\85\127\100\195\76\59\135\28\10\162\248\86\193\91\139\143\71\142\118\43\185\180\101\162\151\49\229\209\231\24\101\133\162\215\251\129\11\134\249\50\68\59\63\13\72\40\49\76\160\41\49\90\96\142\237\139\160\94\250\8\79\93\135\99\175\6\53\136\101\228\160"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _rYiE=_Bdxd[869];while true do _GEt=bit32.bxor(_nOn,190);break;end;local _yaZB=_gOrP[78];while true do _sHw=bit32.bxor(_cNX,175);break;end;if _UGP<=87 then _KBX=_bRD+1;else _OyJ=nil;end;if _QDs<=79 then _uno=_Bch+1;else _fFV=nil;end;while true do _kVU=bit32.bxor(_aKm,175);break;end;_maLYZ=("\92\225\121\195\229\128\116\150\18\51\202\209\191\240\156\145\238\9\56\37\252\174\253\150\93\49\184\57\249\57\166\133\83\51\199\179\73\31\63\52\67\32\64\29\242\88\220\78\131\120"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Xdq=bit32.bxor(_Fuz,165);break;end;_Otxfw=("\98\31\64\108\13\170\145\147\218\0\68\43\54\245\254\177\216\19\132\203\249\184\172\151\40\226\71"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _jHY=bit32.bxor(_Ptk,247);break;end;_TMmtW=("\18\188\191\108\74\201\73\234\4\167\11\1\57\110\120\4\54\202\87\173\225\63\209\234\7\47\196\61\198\34\230\24\193\72\73\17\26\138\127\105\79\126\179\180\55\150\42\104\109\240\105\53\51\23\220\141"):gsub("..",function(q)return string.char(tonumber(q,16))end);_xcqQr=("\2\56\249\229\183\171\212\130\82\96\49\87\100\53\15\228\200\12\193\229\193\249\23\117\68\77\228\31\6\129\229\158\114\116\69\25\39\166\112\120\167\104\89\175\225\199\233\85\170\86\249\163\252\56\191\84\72"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _kzt<=71 then _jzG=_GQJ+1;else _ISE=nil;end;local _TOSY=_boHa[877];if _AgY<=34 then _GyF=_MTl+1;else _qGT=nil;end;_hQOcU=("\115\121\32\161\125\206\28\120\177\152\158\14\166\188\254\175\169\61\87\189\35\166"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _vINP=_LZRk[794];if _SpJ<=29 then _dTF=_PZY+1;else _FuM=nil;end;if _DTj<=38 then _GqF=_KYH+1;else _VtW=nil;end;local _Mjme=_quYb[179];if _WhV<=10 then _Xoq=_ppa+1;else _DdT=nil;end;while true do _Hzo=bit32.bxor(_zkn,2);break;end;_GSNHg=("\137\116\204\50\142\91\194\163\78\76\237\161\176\150\243\92\132\248\235\137\249\176\141\80\105"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _VELo=_Cgjd[257];if _hYZ<=88 then _qIY=_clu+1;else _yhm=nil;end;if _oBY<=52 then _LgQ=_VJY+1;else _ahf=nil;end;local _RWFl=_BrXj[356];while true do _QFQ=bit32.bxor(_IlW,44);break;end;if _KoX<=28 then _jzK=_DJa+1;else _mpc=nil;end;while true do _vbm=bit32.bxor(_LHC,146);break;end;while true do _ZJa=bit32.bxor(_zaq,109);break;end;if _BzT<=85 then _NOt=_poA+1;else _egq=nil;end;if _vUJ<=34 then _vKT=_NUt+1;else _aPN=nil;end;_ZLMcc=("\236\97\162\61\12\201\39\65\150\213\116\239\92\198\241\254\115\204\94\144\186\40\239\45\216\150"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _qPs<=71 then _gdE=_Mas+1;else _Tac=nil;end;if _bhx<=56 then _awq=_Xcu+1;else _zEi=nil;end;local _RUlO=_FxPU[845];while true do _IVM=bit32.bxor(_hbk,138);break;end;if _ScX<=21 then _Zye=_KGe+1;else _fdK=nil;end;while true do _pan=bit32.bxor(_fbj,74);break;end;while true do _EJz=bit32.bxor(_OpU,32);break;end;while true do _hfM=bit32.bxor(_AdN,213);break;end;local _akNm=_GWfC[433];while true do _sNg=bit32.bxor(_TIJ,33);break;end;local _RDun=_RoXh[201];while true do _kfg=bit32.bxor(_lKC,125);break;end;while true do _uOb=bit32.bxor(_nup,176);break;end;if _nEi<=75 then _jSP=_pHH+1;else _KQn=nil;end;while true do _jIF=bit32.bxor(_lzS,14);break;end;_KhoqK=("\209\198\178\135\253\88\181\48\99\32\186\97\115\193\94\24\189\115\171\123\39\117\18\214\46\114\247\3\130\241\124\81\32\196\191\74\145\115\107\226\172\135\213\81\164\184\79\57\141\94\20\13\168\178\79\247\74\80\66\189\52\25\47\28\5\159\77\223\207"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _auT=bit32.bxor(_PIJ,55);break;end;if _TmB<=96 then _PQy=_aXq+1;else _IMd=nil;end;local _DXTD=_sDny[100];_SosUb=("\53\94\91\12\187\52\240\127\30\52\168\152\205\189\208\90\234\123\46\30\212\63\80\195\16\29\244\149\7\131\132\140\194\208\118\64\38\13\145\104\198"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _jnQ<=35 then _dEg=_jmg+1;else _uZc=nil;end;if _oyo<=81 then _ukF=_cad+1;else _Tdh=nil;end;_WGRjv=("\60\130\7\254\15\131\254\219\147\76\245\75\236\61\185\116\184\84\163\96\196\246\62\73\237\165\34\120\75\31\12\39\87\254\117\7\238\251\244\49\47\123\253\56\15\250\221\56\2\73\162\138\105\113\67\181\150\3\164\192\26\100\59\112\237\250\9\38\147\56"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Tko<=55 then _Lbe=_RVX+1;else _bcI=nil;end;_XJuwJ=("\63\28\211\128\167\227\218\101\237\204\229\8\150\143\186\196\107\230\88\232\105\212\136\107\160\116\31\84\55\4\1"):gsub("..",function(q)return string.char(tonumber(q,16))end);end)("\149\145\9\186\233\227\183\213\53\43\13\25\160\244\146\15\131\252\18\214\124\26\110\74\91\205\111\108\123\237\140\135\121\241\213\82\41\240\172\243\65\74\61\182\249\220\116\171\239\110\179\203\165\96\131\22\85\148\125\93\37\74\107\146\67\72\187\12\209\114\249\59\182\100\158\5\76\192\177\255\85\219\218\209\223\248\112\63\125\165\53\39\108\92\111\12\144\241\142\47\142\50\120\122\127\87\136\84\111\215\63\33\126\13\28\14\177\27\181\196\105\225\134\230\105\59\92\144\196\189\120\144\81\53\19\218\181\161\104\113\69\166\92\82\86\74\11\81\227\215\39\210\237\112\185\19\71\177\92\251\213\98\139\48\188\7\205\248\58\84\174\172\131\132\105\143\178\36\224\122\173\205\78\80\219\168\246\88\173\127\136\2\125\82\237\130\8\119\120\233\79\99\127\171\176\5\55\155\119\193\108\201\138\14\161\45\6\28\64\99\28\86\124\185\105\153\122\87\74\107\33\68\191\211\224\20\177\120\43\244\185\16\194\43\152\29\110\215\4\215\134\56\78\152\79\223\10\114\158\97\211\81\212\28\79\114\24\135\214\107\52\50\134\199\119\219\183\53\248\125\175\219\67\60\103\97\54\185\181\162\57\114\80\37\74\150\92\72\137\8\184\112\210\152\80\59\128\51\78\56\196\194\34\251\226\205\184\58\150\28\228\148\100\119\255\17\141\80\139\131\156\125\121\224\2\9\121\141\215\167\4\7\208\88\225\234\170\133\170\165\228\207\134\180\106\215\209\1\97\189\126\111\127\219\98\62\47\23\244\169\76\207\223\157\253\74\105\248\227\247\154\215\213\232\219\6\210\100\17\163\224\197\182\6\126\194\34\6\253\211\222\145\66\103\112\233\244\226\112\31\139\43\233\175\182\101\113\60\172\186\129\50\134\255\103\63\31\145\242\240\178\112\85\147\157\210\178\118\33\45\104\248\22\107\57\59\227\216\98\119\179\227\67\94\41\220\228\252\82\178\245\53\122\216\239\209\228\215\160\39\241\215\212\142\21\98\48\236\145\234\45\82\1\175\213\166\155\16\54\104\108\243\19\166\227\181\182\54\44\206",...)
\ No newline at end of file
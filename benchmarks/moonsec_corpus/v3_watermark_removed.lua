@@ -0,0 +1 @@
+return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;_SbBaH=("\78\173\86\228\55\248\249\20\64\202\33\246\91\253\20\72\153\157\86\252\241\162\90\108\148\255\246\85\13\117\98\56\37\114\59\118\115\204"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _FXAT=_ZTWJ[896];if _kOq<=62 then _xdL=_udm+1;else _AmS=nil;end;if _TvQ<=74 then _mML=_sud+1;else _eFO=nil;end;if _HyZ<=92 then _qSF=_GWw+1;else _YsM=nil;end;if _HRw<=42 then _ojQ=_Tyx+1;else _dTD=nil;end;while true do _FOM=bit32.bxor(_idX,6);break;end;local _iszZ=_BxWl[613];while true do _Onz=bit32.bxor(_dzo,216);break;end;if _HHP<=77 then _YLP=_Wcl+1;else _hfa=nil;end;local _Ofgo=_EfDw[365];local _Dntc=_rUWt[144];if _myY<=68 then _mWe=_lYR+1;else _fPo=nil;end;local _Dvuj=_LqeD[970];if _kzE<=18 then _AaL=_KVE+1;else _hzB=nil;end;_JrMev=("\162\42\203\44\47\133\152\150\201\12\160\235\120\129\153\120\88\144\121\238\179\131\149\116\204\84\245\97\174\239\103\254\154\236\4\102\227\178\28\103\144\151\104\38\76\133\107\90\83\242"):gsub("..",function(q)return string.char(tonumber(q,16))end);_VRkmb=("\197\105\195\218\137\196\230\85\166\30\246\0\185\111\237\119\244\205\80\223\216\124\230\125\63\249\144\80\1\126\155\174\100\205\22\253\170\141\121\18\28\159\120\14\211\51\36\167\110\97\17\132\73\119\40\137\175\14\53\205\39\199\145\155\101\80\199\110\185\25\73\8\226"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _zOy=bit32.bxor(_rto,102);break;end;_jyKin=("\69\188\67\68\200\25\213\166\130\55\52\166\69\4\255\155\236\93\44\109\172\79\80\116\84\14\132\51\220\194\215\76\143\47\70\52\42\166\117\77\195\234\217\17\145\240\142\134\19\198\175\236\5\167\114\192\49"):gsub("..",function(q)return string.char(tonumber(q,16))end);_iuHiZ=("\55\127\211\243\87\249\96\3\89\122\104\121\32\77\220\35\109\183\77\205\17\34\186\217"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _htS<=45 then _Cnb=_wPh+1;else _BCB=nil;end;_frbXg=("\240\165\103\168\42\14\248\175\26\229\174\189\77\246\159\213\42\151\118\113\132\200\54\214\154\6\189\251\135\45\200\63\173\199\248\245\43\166\105"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _mus=bit32.bxor(_vri,151);break;end;if _IEc<=32 then _Dwn=_wQb+1;else _atD=nil;end;_RTEGK=("\197\76\236\220\53\155\38\20\90\221\45\245\152\118\211\172\53\204\188\116\228\19"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _AIHy=_Wgzv[199];local _pLDV=_HxuJ[725];_pXcku=("\117\122\115\53\11\210\117\113\183\252\143\167\153\110\238\75\239\109\249\27\174\95\218\112\236\160\207\199\193\38\36\58\205\83\59\236\2\241\196\88\132\34\78\5\183\184\67\83\235\139"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _KzKl=_tfDW[230];_ArnZI=("\209\151\107\173\75\242\164\7\22\2\224\172\156\174\201\93\108\217\146\94\254\249\64\1\19\8\36\178\73\104\156\183\107\25\29\78\54\96\234\76\189\5\97\119\28\148\1\130\110\122\15\101\249\91\218\211\38\69\211\192\183\77\189\96\88\119\216\114\16\189\189\32"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _fMH<=14 then _tXP=_GYr+1;else _lfG=nil;end;local _tWQH=_qgls[377];if _HyI<=20 then _xaV=_Ilq+1;else _QUl=nil;end;_mCeFw=("\31\65\40\37\117\194\99\247\187\136\103\174\99\104\159\254\159\214\164\145\104\38\1\103\24\75\153\142\3\152\30\14"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _WDru=_pztk[872];local _dCrQ=_bxDh[3];while true do _NjT=bit32.bxor(_Ews,198);break;end;while true do _xXJ=bit32.bxor(_RTB,129);break;end;local _SkvT=_EFgw[397];_NLkuf=("\101\200\100\5\208\251\76\207\124\242\181\123\184\83\135\206\231\211\59\118\16\206\36\112\187\119\60\58\50\23"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _qykN=_xNau[698];_BFVwK=("\2\139\79\209\144\225\116\106\196\73\162\182\228\91\169\241\218\31\139\57\87\244\243\190\96\252\7\228\70\21\45\122\32\2\10\123\131\71\216\148\46\218\55\134\98\28\244\238\131\141\105"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Tvm=bit32.bxor(_XOC,111);break;end;_YedkS=("\153\92\10\23\118\6\142\80\198\3\139\211\205\33\233\252\71\62\210\34\14\72\13\226\200\0\116\51\61\156\170\158\74\226\76\106\134\3\238\253\98\156\186\27\106\163\46\220\90\110\161\68\16\107\201\153\174\197\26\247\3"):gsub("..",function(q)return string.char(tonumber(q,16))end);_EUQwz=("\254\173\33\177\106\38\246\217\255\192\230\137\203\199\117\56\35\59\209\250\190\139\205\154\60\6\230\171\96\93\148\212\131\90\176\158\82\42\54\242\148\138\190\149\141\22\245\114\127\150\156\230\97\234\28\102\7\99\118\192\146\218\3\127\77\77"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Poa=bit32.bxor(_EFo,111);break;end;local _pKXG=_YuaC[390];_HLbeg=("\1\60\15\215\120\18\173\222\178\133\79\164\155\46\79\44\74\60\50\194\14\25\240\133\70\86\176\239\175\231\126\172\28\53\219\208\170\104\133\95\235\33\205\80\236\42\245\151\5\132"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _WqY<=26 then _XQx=_euG+1;else _OOM=nil;end;_ZNZup=("\138\94\145\1\233\18\210\18\140\28\47\83\133\40\102\126\29\174\175\225\23\124\169\144\110\80\112\16\1\230\39\216\63\229\9\96\39\22\29\85"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _wUYR=_DnNu[497];_UkNya=("\189\241\182\190\31\136\5\37\20\210\168\47\129\112\24\37\180\125\137\107\106\175\155\141\151\185\145\33\195\35\136\169\65\83\21\111\133\29\129\94\218\84\215\244\64\95\194\197\240\71\233\254\177\36\59\254\78\220\74\165\177\163\249\97\118\113\135\47\117"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _bEt<=36 then _liX=_LiH+1;else _VPY=nil;end;local _VhDv=_WiQf[36];local _pIva=_Maks[307];if _ldw<=36 then _AOY=_ynY+1;else _Wsk=nil;end;local _NKMZ=_niYI[749];if _tpD<=34 then _UCt=_NlT+1;else _QEI=nil;end;if _Ubm<=59 then _xgD=_lZg+1;else _dvM=nil;end;local _BMPj=_nfTB[281];while true do _CVO=bit32.bxor(_KOg,98);break;end;_AeSHU=("\196\168\149\57\242\108\83\145\103\22\194\159\228\64\102\165\21\143\210\196\15\190\84\216\60\104\141\230\176\92\31\56\253\203\60\78\45\102\2\19\100\16\170\212\187\144\146\183\114\142\254\232\254\110"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _KmhE=_gRrA[421];if _POi<=50 then _Aac=_fdv+1;else _uLI=nil;end;_mDeSW=("\176\255\23\171\74\151\254\162\6\56\91\113\101\22\230\140\147\29\254\203\109\69\202\99\222\228\143\26\101\4"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _gTt<=49 then _WMR=_ddF+1;else _iNu=nil;end;local _fbTA=_zBOO[709];_wKvcH=("\122\44\235\16\137\153\181\178\240\71\130\165\42\172\58\182\91\153\71\29\39\70\70\131\213\230\28\245\43\250\239\223\175\223\4\86\66\49\65\204\114\58\246\102\189\95\183\1\12\74\125\100"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _YbU<=23 then _dSs=_iWk+1;else _ULM=nil;end;local _BMOW=_elNf[212];local _bmwT=_aWav[502];while true do _FyQ=bit32.bxor(_mpw,170);break;end;while true do _dgE=bit32.bxor(_RKS,141);break;end;if _xRS<=66 then _JFI=_AYr+1;else _AdE=nil;end;_imHfu=("\45\41\29\67\210\28\43\232\133\231\200\151\49\124\27\28\101\52\106\171\120\71\237\50\203\90\36\239\71\169\170\97\252\159\133\206\104\51\199\141\104\231\46\129\124\147\139\245\224\68\73\253\23\87\226\9\169\45\100\218"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _Svre=_jeSC[321];while true do _fDS=bit32.bxor(_JHU,134);break;end;while true do _ZTq=bit32.bxor(_EIA,192);break;end;if _VmL<=85 then _bet=_jnF+1;else _rbI=nil;end;local _CGPz=_Yepp[918];_VkvrQ=("\204\43\242\221\254\94\128\194\48\85\245\19\79\123\16\63\211\64\106\26\149\143\107\17\194\174\9\218\239\230\124\53\183\206\37\206\96\33\139\216\110\74\114\83\143\156\61\221\126\226"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _DwD=bit32.bxor(_qfS,241);break;end;local _BPYx=_gtdb[585];local _nKpT=_urHS[700];local _nQIl=_ixTn[542];while true do _LHr=bit32.bxor(_GdZ,82);break;end;_HFamK=("\3\90\250\180\60\235\50\210\77\27\117\80\119\114\121\172\122\64\255\82\199\26\138\63\49\47\19\171\129\212\80\120\55\9\98\45\78\192\130\150\184\75\77\15\108\88\105\81\92\214\251"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _cbD=bit32.bxor(_VoT,251);break;end;while true do _cNk=bit32.bxor(_EKm,215);break;end;_xLNhx=("\89\87\109\64\67\187\225\206\80\17\186\236\189\151\102\167\7\219\196\121\46\112\149\36\124\121\209\27\41\177\226\243\88\255\204\189\109\171\185\113\204\97\227\108\117\105\175\119\103\108\166\82\16\251\49\161\199\25\83\191\127\118\210\16\200\177\62\196\210\248\54\238\229\139\6\175\56\150\75"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _HeVp=_LlYD[681];_TKNYC=("\93\68\27\146\127\184\101\163\255\122\160\158\191\64\59\11\44\39\114\164\29\42\14\136\103\190\2\123\181\32\50\185\87\44\169\255\84\81\218\134\18\79\153\104\15\190\195\254\23\205\48\0\83\145\227\27\15\2\215\112"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _EiQ<=3 then _Goq=_MeU+1;else _MxQ=nil;end;while true do _CwC=bit32.bxor(_eby,28);break;end;_eCwzX=("\97\3\45\63\125\14\32\96\230\214\241\201\89\198\129\52\153\1\139\215\85\156\84\117\150\173\73\65\158\44\140\231"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _SBXO=_MSFs[462];while true do _ufh=bit32.bxor(_vis,10);break;end;if _Zrn<=98 then _qMN=_Zuw+1;else _hxq=nil;end;_TlguF=("\66\239\39\247\72\206\15\130\232\203\236\16\171\241\62\154\98\169\62\64\12\89\157\107\194\197\181\184"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _EKz=bit32.bxor(_CIo,1);break;end;if _WSi<=18 then _jXs=_YOF+1;else _NRu=nil;end;_CntSq=("\44\119\63\194\142\78\104\123\171\75\210\164\0\218\232\5\82\183\222\128\227\181\106\176\148\166\93\226\150\153\6"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _tEB<=65 then _khP=_Til+1;else _UTu=nil;end;if _Llh<=53 then _zXn=_GaZ+1;else _DuQ=nil;end;_oqZlh=("\2\25\234\106\237\206\118\74\102\73\167\204\174\26\70\67\6\73\136\125\131\203\82\29\36\239\174\64\204\191\31\28\128\79\109\52\82\90\243\120\133\138\187\133\204\183\129\226\242\158\26\198\206\45\67\172\201\228\158\78\63\125\120\33\51\129\113\51"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _pAA=bit32.bxor(_asU,239);break;end;local _PhRT=_ChNk[372];_VVpXR=("\4\164\119\26\116\62\112\117\247\62\235\253\95\37\255\218\192\7\159\149\196\239\12\243\120\234\166\103\33\119\116\27\63\10\58\181\114\247\181\174\89\245"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _RRe<=10 then _Gwx=_DzS+1;else _ILC=nil;end;local _PTzx=_xjQw[944];_rpTQY=("\185\238\217\246\9\123\178\234\9\25\156\156\218\15\117\150\114\131\111\5\7\65\182\205\230\136\46\71\155\93\119\40\198\27\133\207"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _xfrH=_gqgH[216];if _kWe<=23 then _DQK=_kwl+1;else _mkg=nil;end;if _OUs<=66 then _Kcl=_YZV+1;else _iIC=nil;end;if _vax<=70 then _xHy=_eFU+1;else _dBi=nil;end;if _zjb<=52 then _rHa=_roO+1;else _YXh=nil;end;while true do _xXV=bit32.bxor(_lQv,36);break;end;_huvoo=("\1\253\182\241\153\157\250\60\244\157\39\195\199\160\108\97\5\52\175\9\62\227\77\224\113\133\237\146\144\182\130\35\40\198\135\52\200\225\232\71\70\247\0\21\91\192\150\213\9\0\76"):gsub("..",function(q)return string.char(tonumber(q,16))end);_VAiih=("\57\160\88\205\253\189\129\66\208\148\238\2\209\116\194\155\95\130\91\80\196\205\213\91\245\82\52\112\173\98\212\122\182\8\113\188\127\76\189\7\34\52\40\164\100\48\120\225\243\7\23\211\206\0\27\17\234\94\140\125"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _OyZ=bit32.bxor(_wcX,207);break;end;_rZlZr=("\207\112\198\207\83\18\240\186\121\100\126\204\76\199\34\201\231\11\142\180\60\84\225\39\123\152\168\152\112\115\106\131\44\185\73\171\55\21\19\241\91\216\59\153\189\101\228\92\242\75\173\212\227"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _MkeF=_ULIN[324];_AOwZU=("\91\195\234\124\20\72\54\145\181\191\247\205\226\244\45\87\167\240\233\85\218\142\143"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _gDM=bit32.bxor(_KLO,124);break;end;while true do _Dxw=bit32.bxor(_AKc,97);break;end;local _qRBY=_dygB[391];_ZeKKe=("\218\131\201\21\39\51\25\70\235\244\62\142\164\101\165\200\225\7\24\207\102\132\58\26\25\131\150\190\180\0\155\209\145\41\70\70\145\153\90\132\162\102\48\122\33\205\166\8\4\161\94\3\231\200\211"):gsub("..",function(q)return string.char(tonumber(q,16))end);_jCQNu=("\220\114\16\127\206\200\99\151\245\116\190\99\114\160\47\8\24\157\175\222\76\139\233\77\59\88\214"):gsub("..",function(q)return string.char(tonumber(q,16))end);_IDGFw=("\75\99\71\78\33\213\80\32\52\48\204\151\57\54\10\143\113\165\207\20\163\198\29\38\190\204\39\97\136\255\88\176\206\127\240\189\59\2\157\80"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _ihN<=20 then _Akb=_Fum+1;else _rnm=nil;end;local _hrQB=_fqUW[755];_DBLEk=("\134\235\137\73\222\78\228\79\79\95\191\98\190\34\170\195\58\123\204\165\127\87\141\176\192\42\180\127\180\26\36\242\41\138\124\0\43\126\163\5\57\203\38\198\70\107\202\64\112\218\137\229\74\253\221\146\240\12\93\211\198\91\221\135"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Gih<=71 then _mfK=_ing+1;else _Yox=nil;end;while true do _CDu=bit32.bxor(_dUk,137);break;end;_sUxfS=("\45\14\16\2\207\114\111\144\232\10\92\82\202\30\243\212\83\57\231\225\156\184\245\224\231\136"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _TjsG=_ZsqN[861];_hnWkf=("\29\83\241\181\103\39\128\111\224\220\108\224\89\146\41\119\3\11\241\27\58\51\215\202\232\207\38\72\221\193\83\47\16\14\56\220\255\43\97\209\21\207\3\143\101\250\35\23\105\41\125\132\158"):gsub("..",function(q)return string.char(tonumber(q,16))end);_oZARf=("\185\43\148\5\188\26\26\109\141\107\240\238\101\122\208\48\95\163\95\33\226\165\148\193\122\103\243\36\135\98\99\24\29\210\99\36\111\232\191\205\190\225\140\216\161\148\53\253\134\13\154\185\67\20\220"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _jaQq=_VKlt[684];while true do _krR=bit32.bxor(_xFl,35);break;end;_Fcmvy=("\223\246\187\81\149\146\5\241\130\219\200\33\181\6\149\44\61\175\128\165\98\22\209\224\202\241\221\210\16\17\157\186\186\92\99\14\38\252\22\210\236\14\189\128\102\39\32\127\84\143\8\57\237\244\239\54\184\19\240\9\94\164\116\1\191\129\224\243\120\62\202"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _PKl=bit32.bxor(_Jqt,215);break;end;local _QonX=_LZCX[873];end)("\42\86\23\47\7\134\10\16\101\0\208\146\20\84\3\7\111\78\107\106\230\86\224\124\90\163\105\65\129\130\176\215\239\32\76\131\76\183\105\96\121\132\206\229\74\158\65\152\145\15\170\159\2\201\164\79\241\231\138\86\120\178\217\15\126\176\76\125\138\24\109\203\78\111\112\210\158\169\85\253\175\155\113\135\0\100\232\93\146\121\98\36\250\112\185\27\142\160\196\212\195\151\130\106\52\165\241\118\110\46\91\89\171\27\165\166\211\117\42\238\175\68\179\12\51\18\48\97\217\21\35\150\7\185\16\124\151\41\58\101\101\197\194\118\222\29\0\173\198\88\84\24\167\242\118\26\50\106\94\253\64\220\77\100\228\26\151\214\12\13\49\69\56\220\80\173\179\134\51\226\186\13\13\143\213\80\40\205\249\222\185\19\190\65\23\178\46\251\213\144\191\184\230\236\9\84\28\148\20\216\173\100\233\12\31\123\206\200\154\175\202\122\75\57\87\52\161\182\114\153\97\80\139\114\2\139\164\44\57\65\138\38\151\27\0\246\98\152\134\126\72\192\215\24\236\154\50\76\211\34\126\27\226\42\47\224\61\85\41\151\107\217\110\227\235\129\101\221\82\208\194\60\224\203\74\78\235\126\21\174\133\218\10\252\254\97\109\156\169\128\79\120\225\13\193\251\65\90\30\237\96\104\200\206\220\128\208\122\22\178\170\249\247\236\73\163\209\17\148\212\209\123\215\130\252\249\14\208\2\109\120\62\255\249\86\24\71\99\78\63\131\201\6\113\179\83\118\74\50\198\24\178\145\124\38\27\99\110\116\135\109\18\72\233\45\151\94\22\13\18\58\62\228\84\253\0\63\40\65\80\14\182\45\82\78\179\201\85\220\161\131\238\102\212\127\17\35\175\151\88\201\139\24\59\222\190\106\126\239\123\170\139\91\144\170\4\243\76\241\217\60\248\105\239\62\155\193\205\50\87\165\102\60\219\130\118\60\55\112\139\127\73\113\84\130\255\147\184\38\155\24\150\234\184\124\61\239\63\211\220\215\58\192\65\211\132\6\208\24\171\122\32\63\228\89\150\96\58\189\9\252\66\27\88\95\12\91\88\250\157",...)
\ No newline at end of file
@@ -0,0 +1 @@
+--[[ v1.0.0 https://wearedevs.net/obfuscator ]] return(function(c,...)local b;local d;local e;local f;local g;local h;local i;local j;local k;local l;local m;local n;local o;local p;local _jVqB=_GrHk[654];if _lpq<=55 then _IUi=_tEX+1;else _TCg=nil;end;while true do _jfC=bit32.bxor(_vJM,27);break;end;if _Eeu<=57 then _BXd=_Nir+1;else _xfK=nil;end;_TIcJN=("\146\168\49\239\110\96\64\111\220\73\23\218\247\86\196\34\37\186\157\4\217\27\93\156\99\229\37\90\186\232\150\25\120\135\114\242\59\194\202\122\83\6\150\117\130\145\75\148\159\117\41\189\87\239"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _utQ=bit32.bxor(_ytb,175);break;end;_wHFma=("\26\83\198\154\29\52\250\62\137\37\12\167\125\20\100\27\206\177\205\215\255\234\32\67\153\63\181\98\189\34\102\59\91\190\188\207\209\82\232\65\17\147\71\38\81\159\58\163\178\21\127\179"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _dxK<=28 then _TMe=_Ajy+1;else _FlD=nil;end;local _Hipv=_bijc[806];while true do _gFB=bit32.bxor(_pma,164);break;end;local _DQxG=_xsQS[778];while true do _FtW=bit32.bxor(_hlp,96);break;end;while true do _Crx=bit32.bxor(_JUn,128);break;end;if _Dcu<=27 then _FOX=_qRo+1;else _arD=nil;end;while true do _lut=bit32.bxor(_Kbc,250);break;end;while true do _ILq=bit32.bxor(_rDE,47);break;end;local _aMFy=_MTwQ[499];_LqGRN=("\85\187\104\229\255\173\157\131\235\81\120\130\210\119\205\9\93\96\68\172\87\58\191\220\128\85\70\61\64\55\148"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _ZzX=bit32.bxor(_vAq,148);break;end;local _PPTy=_Budp[244];local _RBOQ=_byZM[495];local _HUmW=_nnBG[431];while true do _FmW=bit32.bxor(_eZS,239);break;end;_ywjXW=("\201\158\111\211\200\12\48\25\154\193\241\241\196\48\55\201\5\159\39\177\128\223\30\68\237"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _boS=bit32.bxor(_gqb,196);break;end;local _rCeK=_bwTi[894];if _QEs<=28 then _eRN=_AnD+1;else _IfX=nil;end;_bEbaY=("\60\26\244\97\6\7\106\219\230\245\95\229\203\21\226\166\27\110\0\38\174\3\178\157\82\30\223\65\104\87\253\171\39\186\155\216\115\248\33\114\76\228\217\182\184\45\157\93\181\76\218\99\45\181\53\23\65"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _gcK<=67 then _Mss=_eiO+1;else _hBv=nil;end;if _twG<=71 then _jgW=_jrH+1;else _Hix=nil;end;if _Bhg<=70 then _IXZ=_wpL+1;else _qVg=nil;end;while true do _xtS=bit32.bxor(_YDS,69);break;end;local _QHyH=_SZpZ[550];while true do _llz=bit32.bxor(_Xzd,169);break;end;while true do _PwZ=bit32.bxor(_HmD,233);break;end;while true do _SqD=bit32.bxor(_vys,245);break;end;local _qzOV=_Wiod[725];local _qUYU=_jTVo[49];if _Mtr<=83 then _wry=_ZoO+1;else _qGj=nil;end;if _BLw<=2 then _xoY=_Dss+1;else _pkN=nil;end;local _LHAu=_dCdz[910];if _trP<=62 then _zfx=_JqC+1;else _ywZ=nil;end;if _poZ<=43 then _dbm=_wdL+1;else _Fvo=nil;end;while true do _GEz=bit32.bxor(_pdJ,244);break;end;if _LMB<=41 then _Fpl=_eoY+1;else _Qzz=nil;end;while true do _Hto=bit32.bxor(_VGz,168);break;end;if _ZCq<=49 then _gJh=_UIh+1;else _jXB=nil;end;local _LfVP=_RiDh[604];_llaxK=("\160\72\213\193\199\29\198\155\106\125\7\125\211\250\246\223\164\151\4\217\134\46\71\31\120\103\24\109\200\144\227\214\54\147\50\111\31\160\58"):gsub("..",function(q)return string.char(tonumber(q,16))end);_bDMkD=("\209\189\220\2\105\194\9\90\193\251\150\110\5\118\79\121\70\29\208\70\140\145\184\12\251\14\83\81\248\47\174\249\244\200\170\191\121\115\21\136\20\234\242\124\20\129\95\179\45\107\238\68\224\67\80\115\200\106\121\117\29"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _kEB<=93 then _mUR=_BSZ+1;else _EuD=nil;end;local _wspx=_psfu[345];if _ivj<=21 then _sJO=_vbx+1;else _cOH=nil;end;if _OPv<=2 then _ITC=_HBt+1;else _hgp=nil;end;if _XRS<=20 then _dEy=_rPp+1;else _Qiz=nil;end;while true do _YmV=bit32.bxor(_ure,225);break;end;_AoUMq=("\237\139\161\146\185\110\198\198\91\19\222\89\17\138\20\45\201\75\219\172\109\140\88\108\87\23\148\107\211\69\150\29\136\195\39\28\125\114\207\98\74\141\142\58\25\66\36\98\39\177\118\70\59\73\187\39\123\134\63\102\88\249\116\94\168\1\241"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _ikw=bit32.bxor(_YQr,71);break;end;local _DgHL=_yCUU[181];while true do _seY=bit32.bxor(_mCE,98);break;end;while true do _EtG=bit32.bxor(_msT,167);break;end;_vkclO=("\152\68\211\104\128\138\44\39\82\236\64\63\173\132\103\198\129\239\211\206\172\176\139\145\195\81\29\13\209\188\93\194\222\251\27\201\104\238\68\193"):gsub("..",function(q)return string.char(tonumber(q,16))end);_DbvdZ=("\7\249\30\25\124\141\217\186\46\218\144\130\91\7\31\99\118\168\221\169\174\101\255\135\85\16\180"):gsub("..",function(q)return string.char(tonumber(q,16))end);_qDuDi=("\178\157\96\29\61\72\186\229\20\31\167\143\18\72\255\225\194\109\69\214\103\199\64\83\102\21\178\66\57\157\86\120\19\166\150\115\148\184\131\181\91\185\149\128\138\200\24\210\116\226\187\182\101\207\196\36\26\173\210\215\54\163\83\14\82\3\27"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _yTx=bit32.bxor(_AFG,127);break;end;if _nQp<=21 then _bVw=_qVl+1;else _dzb=nil;end;if _MCm<=26 then _QuX=_fTB+1;else _Mkg=nil;end;_soZOO=("\12\155\198\37\144\212\162\232\197\161\0\239\26\116\215\1\178\3\31\75"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _LAm<=81 then _fWj=_YuB+1;else _Fok=nil;end;_fvSKU=("\20\72\228\185\216\200\173\210\55\44\113\77\81\243\69\106\35\198\217\80\175\143\46\148\253\202\254\192\166\142\34\233\180\45\21\47\173\177\13\252\172\175\84\250\191\236\5\255\68\196\154\23\100\116\169\213\124\69\62\65\100\42\114\171\155\142\7\67"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HPsOE=("\38\227\110\237\101\226\98\65\200\115\44\114\239\184\67\33\254\18\45\69\43\26\7\64\225\227\39\3\40\76\93\194\86\151\150\201\254\253\19\51\0\85\214\217\128\162\29\104"):gsub("..",function(q)return string.char(tonumber(q,16))end);_Dgtur=("\175\227\41\151\90\228\75\117\139\48\138\51\79\39\158\43\100\244\162\54\1\149\144\80\118\124\85\119\57\108\246\204\169\47\46\114\132\9\147\47\138\6\222\166\68\20\222\38\168\210\194\226\161\218\14\194"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Kqc<=4 then _aHB=_EyU+1;else _jVU=nil;end;_tpblQ=("\6\170\138\165\122\147\158\1\173\175\219\40\189\147\245\103\64\248\51\176\88\228\171\217\204\148\141\119\101\142\242\162\197\251\178\220\240\153\221\78\233\172\198\1\41\82\29\1\182\109\28\35"):gsub("..",function(q)return string.char(tonumber(q,16))end);_MRMGD=("\225\14\190\146\234\42\74\198\68\223\110\167\117\50\168\94\41\72\125\129\181\52\142\162\105\24\42\243\160\164\98\231\34\236\32\218\78\84\5\143\66\39\222\214\110\65\231\4\235\131\171\123\179\234\162\19\164\7\225\61\117\165"):gsub("..",function(q)return string.char(tonumber(q,16))end);_wZRTG=("\51\50\229\163\252\212\200\0\32\166\30\58\113\254\175\210\216\229\26\94\18\232\216\124\135\38\167\42\77\186\18\121\251\244\72\181\9\60\40\116\125\189\10\0\129\249\254\11\3\85\16\20\103\76\53\200\120\231\34\226\63\120\215\229\74\128\204\193\81\77\222\199\251\186\240\132"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _xVuR=_jxSl[554];if _zgC<=6 then _nLe=_xQE+1;else _ksa=nil;end;if _Tbw<=18 then _mat=_XFs+1;else _Ipt=nil;end;if _nRx<=62 then _KFW=_gPT+1;else _GfS=nil;end;local _XPXr=_zfvP[227];if _zeW<=94 then _tOu=_Yvb+1;else _boW=nil;end;local _UkVF=_gpFC[172];_vPaVW=("\195\179\89\31\200\249\153\133\21\75\70\59\44\252\188\222\52\160\94\247\72\236\122\140\190\211\163\161\74\20\162\131\193\130\242\238\134\112\180\46\136\0\141\173\143\129\229\218\66\63\95\75\64\175\146\101\175\11"):gsub("..",function(q)return string.char(tonumber(q,16))end);_ZyQaI=("\93\4\154\233\230\129\9\175\138\77\238\197\27\217\58\163\73\249\219\125\49\124\64\237\253\232\19\28\112\115\136\226\135\199\195\179\93\223\163\78\10\123\95"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _CfJ<=7 then _wgV=_QZb+1;else _zzX=nil;end;local _Cljc=_XImk[604];local _ShoG=_Qdcc[464];while true do _GnV=bit32.bxor(_RTF,57);break;end;_AbDVS=("\7\212\25\114\156\116\78\5\173\177\214\223\228\85\172\239\213\220\142\83\174\104\234\212\49\9\219\118\225\213\64"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _qsT<=52 then _jBV=_UOj+1;else _Jwb=nil;end;local _sBGO=_QMKA[575];if _nLm<=15 then _Fqu=_AQU+1;else _wAe=nil;end;if _Zun<=52 then _hAu=_cGg+1;else _gKH=nil;end;if _Tld<=77 then _BlJ=_iwi+1;else _LVI=nil;end;_IthDz=("\76\22\243\39\180\33\11\199\247\45\39\223\166\254\32\142\250\231\254\210\83\185\7\190\187\217\82\208\145\141\42\163\127\222\88\105\19\237\102\33\32\251\157\8\171\38\135\23\208\175\193\10\110\98\106\210\248\184\232\206\54\27\23\70\108\251\166\28\90\27"):gsub("..",function(q)return string.char(tonumber(q,16))end);if _Jlp<=30 then _Ntg=_WOr+1;else _vrP=nil;end;if _BpS<=56 then _pNw=_wyz+1;else _Tgs=nil;end;local _bncx=_XZEk[985];if _EhK<=75 then _rTt=_pEv+1;else _tRT=nil;end;while true do _ErT=bit32.bxor(_Gar,34);break;end;_vdHtd=("\114\70\165\64\12\44\54\132\161\93\112\23\213\30\177\126\219\120\60\60\106\164\29\160\6\198\126\173\228\126\62\252\194\5\154\3\185\206\34\208\162\154\168\83\162\72\143\81\28\59\17\216\199\4\88\41\12\111\217\47\178\164\201\140\193\22\215\234\83\133\94\166"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _cDb=bit32.bxor(_cBg,209);break;end;while true do _PpA=bit32.bxor(_SRF,238);break;end;while true do _lxO=bit32.bxor(_nPZ,202);break;end;_FeXSl=("\25\61\218\179\105\15\84\232\122\61\130\241\43\235\227\10\226\145\242\106\138\38\130\183\9\246\196\226\114\181\22\101\67\93\212\243\223\1\177\17\152\109\120\195\172\101\43\84\210\107\251\135\130\233\127\90\206\192\12\54\50\252\109\15\118\219\122\244\12\82\185\58"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _jDY=bit32.bxor(_kaa,36);break;end;_rMdYV=("\36\170\96\5\223\128\251\166\124\94\12\108\75\190\149\219\142\39\26\141\147\39\93\180\231\203\80\223\194\67\119\99\53\224\44\124\107\226\193\113\195\136\73\220\57\201\241\106\191\211\164\41\55\59\17\86\29\22\146\16\178\177\61"):gsub("..",function(q)return string.char(tonumber(q,16))end);local _dzuv=_yfPw[910];while true do _XEw=bit32.bxor(_plU,208);break;end;while true do _xAh=bit32.bxor(_tNf,129);break;end;_czqTq=("\35\109\174\67\61\34\123\35\39\44\48\19\50\221\32\195\242\41\57\241\74\240\143\34\131\86\97\41\70\49\147\127\186\140\135\124\108\97\114\185\191"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _lDW=bit32.bxor(_SRG,185);break;end;if _bbF<=22 then _Vre=_RYL+1;else _qNL=nil;end;local _MIVs=_AWBV[51];if _EWJ<=64 then _iiQ=_ihw+1;else _hkw=nil;end;if _kdk<=43 then _yvX=_rex+1;else _fik=nil;end;if _PYr<=98 then _Xeq=_YZD+1;else _PHZ=nil;end;while true do _AGr=bit32.bxor(_IZB,12);break;end;if _oYN<=45 then _aiz=_IaN+1;else _mpI=nil;end;while true do _zRR=bit32.bxor(_oJI,150);break;end;if _jKp<=60 then _qgA=_hNk+1;else _HBx=nil;end;local _RhjE=_tfmn[376];while true do _vZz=bit32.bxor(_afK,47);break;end;while true do _Gqy=bit32.bxor(_iKk,35);break;end;_ocIQI=("\145\138\246\231\135\162\78\102\109\174\123\51\18\2\252\43\184\17\144\245\116\26\139\188\147\191\145\93\200\84\56\133\187\187\85\54\149\196\238\239\160\48\3\66\140\11\78\176\155\215\211\255\113\210\66\3\118\239\159\143\39\110"):gsub("..",function(q)return string.char(tonumber(q,16))end);_nUZnT=("\191\152\156\130\217\45\200\120\72\241\227\9\94\217\24\202\196\229\59\58\148\179\4\94\72\8\190\199\217\42\31\199\97\25\75\48\208\77\31\83\214\175\3\111\141\176\251\254\204\85\77\24\37\85\203\255\243\255\57\219\64\234"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _NGI=bit32.bxor(_XDp,89);break;end;_zGuWP=("\55\137\153\236\91\45\190\49\6\74\33\245\38\101\28\222\71\4\246\144\5\98\77\18\86\51\239\132\176\101"):gsub("..",function(q)return string.char(tonumber(q,16))end);while true do _Sdv=bit32.bxor(_cNc,234);break;end;_OluTp=("\51\1\15\103\61\102\3\72\123\22\182\183\76\203\226\87\51\173\40\107\211\16\21\202\212\54\123\4\115\226\143\231\230\148\124\212\44\129\197\254\7\211\208\228\92\76\42\7\177\85\77\200\180\35\215\120\71\0\211\209\150\112\51\241\219\221\164\197\227\62\121\1\41\142\100\88\4"):gsub("..",function(q)return string.char(tonumber(q,16))end);_HkIvy=("\3\34\32\229\63\16\57\90\52\45\186\142\56\249\168\222\119\59\51\141\140\22\231\20\107\220\181\2\222\221\196\154\136\12\225\199\86\255\201\64\113\211\234\225\71\66\201\63\130\248\92\245\58\231\241\105\97\21\167\127\57"):gsub("..",function(q)return string.char(tonumber(q,16))end);end)("\234\36\146\234\74\9\57\127\38\34\14\144\112\116\142\53\227\32\99\177\185\81\12\127\116\29\184\88\86\122\234\187\58\104\157\216\29\146\132\152\183\214\232\180\187\126\41\233\156\72\179\33\234\111\7\198\51\90\28\228\145\157\147\211\243\69\170\189\81\166\108\228\99\83\82\165\98\16\200\44\158\119\147\117\141\121\5\228\172\68\189\165\77\222\247\170\242\216\37\149\218\71\227\214\175\62\180\230\186\219\90\245\11\175\225\84\165\214\113\107\241\93\87\162\58\122\189\130\17\50\102\235\196\51\14\217\153\176\77\143\147\66\137\133\54\33\59\6\159\50\44\31\9\244\123\205\55\248\114\200\215\117\168\99\113\92\90\205\191\141\240\78\110\136\215\215\125\157\70\31\135\179\105\242\108\16\216\23\7\100\212\224\68\202\102\138\179\84\16\245\147\95\143\220\81\120\52\86\226\166\108\109\173\211\199\233\48\143\46\56\161\62\147\234\1\76\153\154\61\205\23\169\35\135\169\124\87\133\191\175\186\73\190\142\51\153\137\46\82\140\45\255\9\7\59\197\117\159\208\214\39\65\10\46\85\66\58\206\62\46\73\51\176\185\50\177\219\249\172\197\120\4\185\83\202\133\243\6\253\129\71\81\156\214\206\109\238\88\25\59\114\219\60\99\16\186\114\254\217\220\27\214\83\50\41\246\229\252\237\60\184\239\124\235\71\71\222\54\62\174\212\73\65\40\7\33\43\213\10\176\59\45\80\28\217\117\61\94\165\96\135\113\61\137\127\164\131\52\48\107\237\162\122\61\133\79\120\51\72\242\248\46\200\88\180\104\131\154\88\89\119\201\170\88\101\54\14\14\168\123\1\124\90\144\231\11\35\92\29\148\247\89\251\119\182\114\162\3\250\187\122\247\115\151\224\161\21\47\30\232\110\217\253\53\231\149\23\207\231\148\20\188\93\155\90\69\59\142\88\75\38\98\164\145\219\34\166\129\87\172\118\232\253\61\208\95\84\55\161\210\65\58\10\65\198\118\8\115\104\243\123\251\172\47\53\127\163\151\45\142\196\46\76\75\197\172\165\244\141\131\82\42\168\191\42\123\87\113\23\79",...)
\ No newline at end of file
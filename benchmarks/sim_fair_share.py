@@ -0,0 +1,148 @@
+"""Simulated mixed load against the fair-share JobScheduler
+
+Usage: python benchmarks/sim_fair_share.py [ticks] [seed]
+
+Drives the real scheduler on a virtual clock: one user keeps as many jobs
+in flight as the bot lets them, light users send a job now and then, one
+admin floods the priority lane and another uses it occasionally. The same
+arrivals are replayed against a plain FIFO queue with no per-user cap,
+which is how the scheduler behaved before. Reports waits (in ticks) per
+kind of user and exits non-zero if any job waited longer than the
+round-robin bound, i.e. if some user was starved.
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+CONCURRENCY = 4
+MAX_QUEUE = 20
+MAX_PER_USER = 3
+PRIORITY_WEIGHT = 3
+LIGHT_USERS = 20
+LIGHT_RATE = 0.02
+FLOOD_BURST = 3
+JOB_TICKS = (1, 3)
+
+FLOODER = 1
+PRIORITY_FLOODER = 2
+ADMIN = 3
+LIGHT_USER_IDS = range(100, 100 + LIGHT_USERS)
+
+
+class FifoScheduler(bot.JobScheduler):
+    """The scheduler as it was: one first-come first-served queue, no lanes or per-user cap"""
+
+    def __init__(self):
+        super().__init__(CONCURRENCY, MAX_QUEUE, max_per_user=0)
+        self._seq = 0
+
+    def submit(self, user_id=None, priority=False):
+        ticket = super().submit(user_id, False)
+        ticket.seq = self._seq
+        self._seq += 1
+        return ticket
+
+    def _pop_next(self, lanes, streak):
+        lane = lanes[False]
+        user_id = min(lane, key=lambda user: lane[user][0].seq)
+        ticket = lane[user_id].popleft()
+        if not lane[user_id]:
+            del lane[user_id]
+        return ticket, 0
+
+
+def kind_of(user_id):
+    return {FLOODER: 'flooder', PRIORITY_FLOODER: 'admin flooder', ADMIN: 'admin'}.get(user_id, 'light user')
+
+
+def simulate(scheduler, ticks, seed):
+    """Returns (waits by kind of user, rejections by kind, jobs left waiting, longest normal-lane wait in grants)"""
+    rng = random.Random(seed)
+    running = []
+    waiting = {}
+    waits = {}
+    rejected = {}
+    grant_count = 0
+    max_grants_waited = 0
+    grant = scheduler._grant
+
+    # Number every grant, so a job's wait can be measured in grants as well as ticks
+    def counting_grant(ticket):
+        nonlocal grant_count
+        ticket.grant_index = grant_count
+        grant_count += 1
+        grant(ticket)
+
+    scheduler._grant = counting_grant
+
+    def try_submit(user_id, priority, now):
+        try:
+            ticket = scheduler.submit(user_id, priority)
+        except bot.QueueFull:
+            rejected[kind_of(user_id)] = rejected.get(kind_of(user_id), 0) + 1
+            return
+        waiting[ticket] = (now, grant_count)
+
+    for now in range(ticks):
+        for job in [job for job in running if job[1] <= now]:
+            running.remove(job)
+            scheduler.release(job[0])
+        for _ in range(FLOOD_BURST):
+            try_submit(FLOODER, False, now)
+            try_submit(PRIORITY_FLOODER, True, now)
+        if rng.random() < LIGHT_RATE:
+            try_submit(ADMIN, True, now)
+        for user_id in LIGHT_USER_IDS:
+            if rng.random() < LIGHT_RATE:
+                try_submit(user_id, False, now)
+        for ticket in [ticket for ticket in waiting if ticket.granted.done()]:
+            submitted, grants_before = waiting.pop(ticket)
+            if not ticket.priority:
+                max_grants_waited = max(max_grants_waited, ticket.grant_index - grants_before)
+            waits.setdefault(kind_of(ticket.user_id), []).append(now - submitted)
+            running.append((ticket, now + rng.randint(*JOB_TICKS)))
+    return waits, rejected, len(waiting), max_grants_waited
+
+
+def report(label, waits, rejected, left_waiting):
+    print(label)
+    for kind in ('light user', 'flooder', 'admin', 'admin flooder'):
+        samples = sorted(waits.get(kind, []))
+        if not samples:
+            print(f"  {kind:<14} no jobs ran, {rejected.get(kind, 0)} rejected")
+            continue
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        print(f"  {kind:<14} {len(samples):6d} jobs | wait mean {statistics.mean(samples):6.1f} | "
+              f"p95 {p95:5d} | max {samples[-1]:5d} ticks | {rejected.get(kind, 0)} rejected")
+    print(f"  still waiting at the end: {left_waiting}")
+
+
+async def main(ticks, seed):
+    fair = bot.JobScheduler(CONCURRENCY, MAX_QUEUE, MAX_PER_USER, PRIORITY_WEIGHT)
+    waits, rejected, left, max_grants = simulate(fair, ticks, seed)
+    report(f"fair share: {CONCURRENCY} slots, {MAX_PER_USER} jobs per user, priority weight {PRIORITY_WEIGHT}, "
+           f"{ticks} ticks", waits, rejected, left)
+    fifo_waits, fifo_rejected, fifo_left, _ = simulate(FifoScheduler(), ticks, seed)
+    report("plain FIFO, same arrivals", fifo_waits, fifo_rejected, fifo_left)
+
+    # A normal-lane job is at most MAX_PER_USER deep in its user's queue, each round of the
+    # rotation grants one job per waiting user, and the normal lane gets a slot at least
+    # every PRIORITY_WEIGHT + 1 grants
+    normal_users = LIGHT_USERS + 1
+    bound = MAX_PER_USER * normal_users * (PRIORITY_WEIGHT + 1)
+    print(f"longest normal-lane wait: {max_grants} grants (starvation bound {bound})")
+    if max_grants > bound:
+        print("STARVATION: a normal-lane job waited past the bound")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    asyncio.run(main(ticks, seed))
@@ -2,15 +2,35 @@ import os
 import discord
 import tempfile
 import asyncio
-import subprocess
+import bisect
+import heapq
 import json
+import hashlib
 import re
+import secrets
+import shutil
+import signal
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import itertools
+import math
+import cProfile
+import pstats
+import tracemalloc
+import gzip
+import zipfile
+from collections import OrderedDict, deque, namedtuple
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
 from discord.ext import commands
 from dotenv import load_dotenv
-from urllib.parse import urlparse, unquote
+from urllib.parse import urlparse, urlsplit, urlunsplit, unquote
 from aiohttp import web
 import aiohttp
+from deobf_worker import FRAME_HEADER, JobQueue, encode_frame, decode_frame
 
 # Load environment variables
 load_dotenv()
@@ -28,229 +48,2120 @@ bot = commands.Bot(command_prefix='.', intents=intents, help_command=None)
 ALLOWED_SERVER_ID = 1441808704876970026
 ADMIN_ROLE_ID = 1441808742957056092
 
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Deobfuscator worker pool
+WORKER_SCRIPT = os.path.join(PROJECT_DIR, 'deobf_worker.py')
+DEOBF_POOL_SIZE = int(os.getenv('DEOBF_POOL_SIZE', 2))
+DEOBF_TIMEOUT = int(os.getenv('DEOBF_TIMEOUT', 90))
+DEOBF_MAX_JOBS_PER_WORKER = int(os.getenv('DEOBF_MAX_JOBS_PER_WORKER', 100))
+
+# Shared job queue: when set, jobs go through this SQLite file to queue workers
+# (DEOBF_POOL_SIZE of them started locally, more on hosts sharing the volume)
+DEOBF_QUEUE_DB = os.getenv('DEOBF_QUEUE_DB')
+DEOBF_QUEUE_CLAIM_TIMEOUT = int(os.getenv('DEOBF_QUEUE_CLAIM_TIMEOUT', 60))
+QUEUE_RESULT_POLL_INTERVAL = 0.02
+# Jobs allowed to run at once, raise it to the total worker count across hosts
+DEOBF_CONCURRENCY = int(os.getenv('DEOBF_CONCURRENCY', DEOBF_POOL_SIZE))
+# Per-job rlimits for the deobfuscator process, 0 disables a limit. The address-space
+# limit is off by default because the .NET runtime reserves far more than it uses.
+DEOBF_CPU_LIMIT = int(os.getenv('DEOBF_CPU_LIMIT', 2 * DEOBF_TIMEOUT))
+DEOBF_MEMORY_LIMIT_MB = int(os.getenv('DEOBF_MEMORY_LIMIT_MB', 0))
+DEOBF_OUTPUT_LIMIT_MB = int(os.getenv('DEOBF_OUTPUT_LIMIT_MB', 100))
+# Seconds a cancelled worker gets to kill its job before its process group is SIGKILLed
+WORKER_KILL_GRACE = 2
+# Jobs allowed to wait for a free worker before new requests are turned away
+DEOBF_QUEUE_SIZE = int(os.getenv('DEOBF_QUEUE_SIZE', 20))
+QUEUE_UPDATE_INTERVAL = 5
+# Waiting jobs are granted round-robin across users, each user may have this many queued or running (0 = no cap)
+DEOBF_USER_MAX_JOBS = int(os.getenv('DEOBF_USER_MAX_JOBS', 3))
+# Admins (and users paying DEOBF_PRIORITY_COST extra tokens, 0 = not offered) wait in a priority lane,
+# which gets up to this many slots for every one the normal lane gets while both have jobs waiting
+DEOBF_PRIORITY_WEIGHT = int(os.getenv('DEOBF_PRIORITY_WEIGHT', 3))
+DEOBF_PRIORITY_COST = int(os.getenv('DEOBF_PRIORITY_COST', 0))
+
+# Dedicated directory for per-job temp files, swept on startup and capped in size.
+# DEOBF_IO_MODE=memory puts it on a RAM-backed tmpfs so jobs never touch the disk.
+RAM_DISK_DIR = '/dev/shm'
+DEOBF_IO_MODE = os.getenv('DEOBF_IO_MODE', 'disk').lower()
+
+def default_work_dir():
+    if DEOBF_IO_MODE == 'memory':
+        if os.path.isdir(RAM_DISK_DIR):
+            return os.path.join(RAM_DISK_DIR, 'moonsec-deobf')
+        print(f"DEOBF_IO_MODE=memory but {RAM_DISK_DIR} is missing, using the disk work directory")
+    return os.path.join(tempfile.gettempdir(), 'moonsec-deobf')
+
+def default_work_dir_cap_mb(work_dir):
+    """1GB on disk; on tmpfs, which counts against RAM, at most 3/4 of its size (Docker defaults to 64MB)"""
+    if not work_dir.startswith(RAM_DISK_DIR + os.sep):
+        return 1024
+    try:
+        return min(256, shutil.disk_usage(RAM_DISK_DIR).total * 3 // 4 // (1024 * 1024))
+    except OSError:
+        return 48
+
+DEOBF_WORK_DIR = os.getenv('DEOBF_WORK_DIR') or default_work_dir()
+DEOBF_WORK_DIR_MAX_MB = int(os.getenv('DEOBF_WORK_DIR_MAX_MB', 0)) or default_work_dir_cap_mb(DEOBF_WORK_DIR)
+# On tmpfs a bigger output runs out of space mid-write and looks like an unsupported file,
+# capped to the work dir it is stopped as a resource limit instead
+if DEOBF_WORK_DIR.startswith(RAM_DISK_DIR + os.sep) and (not DEOBF_OUTPUT_LIMIT_MB or DEOBF_OUTPUT_LIMIT_MB > DEOBF_WORK_DIR_MAX_MB):
+    print(f"DEOBF_OUTPUT_LIMIT_MB={DEOBF_OUTPUT_LIMIT_MB} does not fit the {DEOBF_WORK_DIR_MAX_MB}MB tmpfs work directory, "
+          f"capping outputs at {DEOBF_WORK_DIR_MAX_MB}MB")
+    DEOBF_OUTPUT_LIMIT_MB = DEOBF_WORK_DIR_MAX_MB
+
+# Deobfuscation result cache, a size of 0 disables it and a TTL of 0 keeps entries until evicted
+DEOBF_CACHE_DIR = os.getenv('DEOBF_CACHE_DIR', os.path.join(PROJECT_DIR, 'cache'))
+DEOBF_CACHE_MAX_MB = int(os.getenv('DEOBF_CACHE_MAX_MB', 512))
+DEOBF_CACHE_TTL = int(os.getenv('DEOBF_CACHE_TTL', 0))
+
+# One JSON line per finished job on stdout, 0 turns it off
+DEOBF_JOB_LOG = os.getenv('DEOBF_JOB_LOG', '1') != '0'
+# Finished jobs kept in memory for the admin .stats and .jobs commands
+DEOBF_JOB_HISTORY = int(os.getenv('DEOBF_JOB_HISTORY', 1000))
+# cProfile/tracemalloc dumps written by the admin .profile command
+DEOBF_PROFILE_DIR = os.getenv('DEOBF_PROFILE_DIR', os.path.join(PROJECT_DIR, 'profiles'))
+
 # Token management
 TOKENS_FILE = 'tokens.json'
+LEDGER_FILE = os.getenv('LEDGER_FILE', 'tokens.db')
 SETTINGS_FILE = 'settings.json'
+# Seconds between settings.json change checks, 0 disables hot reload
+SETTINGS_WATCH_INTERVAL = float(os.getenv('SETTINGS_WATCH_INTERVAL', 5))
 INITIAL_TOKENS = 3
 DAILY_TOKENS = 2
 COST_PER_USE = 1
 
+MAX_FILE_SIZE = 5 * 1024 * 1024
+DISCORD_UPLOAD_LIMIT = 25 * 1024 * 1024
+# Outputs above this are sent compressed when that shrinks the upload
+DEOBF_COMPRESS_MIN_KB = int(os.getenv('DEOBF_COMPRESS_MIN_KB', 1024))
+DEOBF_COMPRESS_FORMAT = os.getenv('DEOBF_COMPRESS_FORMAT', 'zip').lower()
+COMPRESS_MIN_SAVING = 0.2
+upload_bytes_per_second = 1024 * 1024
+SCRIPT_EXTENSIONS = ('.lua', '.txt')
+DEOBF_BATCH_MAX_FILES = int(os.getenv('DEOBF_BATCH_MAX_FILES', 20))
+# Turn away inputs that are clearly not Moonsec V3 before they reach a worker, 0 disables it
+DEOBF_PREFLIGHT = os.getenv('DEOBF_PREFLIGHT', '1') != '0'
+PREFLIGHT_BYTES = 8 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Shared outbound HTTP connection pool
+HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', 100))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv('HTTP_MAX_CONNECTIONS_PER_HOST', 10))
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 30
+http_session = None
+
+# HTTP API: finished async jobs (and their output files) are kept this long
+API_JOB_TTL = int(os.getenv('API_JOB_TTL', 600))
+
+QUEUE_FULL_MESSAGE = '❌ The deobfuscation queue is full right now. Please try again in a minute - no tokens were charged.'
+USER_LIMIT_MESSAGE = (f'❌ You already have {DEOBF_USER_MAX_JOBS} deobfuscations queued or running. '
+                      'Please wait for one to finish - no tokens were charged.')
+
 # File cleanup tracking
-pending_cleanup_files = []
+class TempFileReaper:
+    """Deletes scheduled temp files from one background task
 
-async def cleanup_file_after_delay(filepath, delay_seconds=120):
-    """"""
-    await asyncio.sleep(delay_seconds)
-    try:
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            print(f"Cleaned up file: {filepath}")
-            if filepath in pending_cleanup_files:
-                pending_cleanup_files.remove(filepath)
-    except Exception as e:
-        print(f"Error cleaning up file {filepath}: {e}")
+    Deadlines live in a heap, so scheduling is O(log n) and nothing sleeps
+    per file. Everything in the work directory belongs to the bot: files
+    left over from a previous run are swept on startup, and the oldest
+    scheduled files are removed early when the directory exceeds its cap.
+    Only files of finished jobs may be scheduled, so the cap never removes
+    a file a queued or running job still needs.
+    """
+
+    def __init__(self, directory, max_bytes, interval=30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.removed = 0
+        self._heap = []
+        self._wakeup = None
+
+    def prepare(self):
+        """Create the work directory and delete files orphaned by earlier runs"""
+        os.makedirs(self.directory, exist_ok=True)
+        count = 0
+        freed = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file(follow_symlinks=False):
+                try:
+                    freed += entry.stat().st_size
+                    os.remove(entry.path)
+                    count += 1
+                except OSError as e:
+                    print(f"Error cleaning up orphaned file {entry.path}: {e}")
+        if count:
+            print(f"Swept {count} orphaned file(s) ({freed / 1024 / 1024:.1f}MB) from {self.directory}")
+
+    def schedule(self, filepath, delay_seconds):
+        deadline = time.monotonic() + delay_seconds
+        heapq.heappush(self._heap, (deadline, filepath))
+        if self._wakeup is not None and self._heap[0][1] == filepath:
+            self._wakeup.set()
+
+    @property
+    def pending(self):
+        return len(self._heap)
+
+    def _remove(self, filepath):
+        try:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+                self.removed += 1
+        except Exception as e:
+            print(f"Error cleaning up file {filepath}: {e}")
+
+    def reap_expired(self):
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            self._remove(heapq.heappop(self._heap)[1])
+
+    def directory_size(self):
+        total = 0
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def enforce_cap(self):
+        """Delete scheduled files soonest-deadline first until the directory fits its cap"""
+        total = self.directory_size()
+        while total > self.max_bytes and self._heap:
+            _, filepath = heapq.heappop(self._heap)
+            try:
+                size = os.path.getsize(filepath)
+            except OSError:
+                continue
+            self._remove(filepath)
+            total -= size
+        if total > self.max_bytes:
+            print(f"Work directory {self.directory} is {total / 1024 / 1024:.1f}MB, over its cap with no files left to reap")
+
+    async def run(self):
+        self._wakeup = asyncio.Event()
+        while True:
+            # Wake for the next deadline, and at least every interval to check the size cap
+            timeout = self.interval
+            if self._heap:
+                timeout = min(timeout, max(0.0, self._heap[0][0] - time.monotonic()))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                self.reap_expired()
+                self.enforce_cap()
+            except Exception as e:
+                print(f"Temp file reaper error: {e}")
+
+reaper = TempFileReaper(DEOBF_WORK_DIR, DEOBF_WORK_DIR_MAX_MB * 1024 * 1024)
 
 def schedule_file_cleanup(filepath, delay_seconds=120):
-    """Schedule a file for cleanup after delay"""
-    pending_cleanup_files.append(filepath)
-    asyncio.create_task(cleanup_file_after_delay(filepath, delay_seconds))
+    """Schedule a finished job's file for cleanup after delay"""
+    reaper.schedule(filepath, delay_seconds)
 
-def load_settings():
-    """Load bot settings"""
-    if os.path.exists(SETTINGS_FILE):
+class Counter:
+    """Monotonic Prometheus counter, optionally split by labels"""
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(label, '') for label in self.labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        for key, value in sorted(self._values.items()):
+            lines.append(f'{self.name}{format_labels(self.labels, key)} {value}')
+        return lines
+
+class Histogram:
+    """Prometheus histogram with cumulative buckets, optionally split by labels"""
+
+    def __init__(self, name, documentation, buckets, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = sorted(buckets)
+        self.labels = labels
+        self._series = {}
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(label, '') for label in self.labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
         try:
-            with open(SETTINGS_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return {'token_system_enabled': True}
-    return {'token_system_enabled': True}
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for key, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + [float('inf')], counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append(f'{self.name}_bucket{format_labels(self.labels + ("le",), key + (le,))} {cumulative}')
+            lines.append(f'{self.name}_sum{format_labels(self.labels, key)} {total}')
+            lines.append(f'{self.name}_count{format_labels(self.labels, key)} {cumulative}')
+        return lines
+
+class Gauge:
+    """Prometheus gauge whose value is read from a callback at scrape time"""
+
+    def __init__(self, name, documentation, read):
+        self.name = name
+        self.documentation = documentation
+        self.read = read
+
+    def render(self):
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} gauge', f'{self.name} {self.read()}']
+
+def format_labels(names, values):
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+LATENCY_BUCKETS = [0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 90]
+SIZE_BUCKETS = [1024 * 4 ** i for i in range(10)]
+
+DEOBF_REQUESTS = Counter('deobf_requests_total', 'Deobfuscation requests by outcome', labels=('outcome',))
+DEOBF_RUNTIME = Histogram('deobf_runtime_seconds', 'Time spent running the deobfuscator', LATENCY_BUCKETS)
+DOWNLOAD_TIME = Histogram('download_seconds', 'Time spent downloading URL inputs', LATENCY_BUCKETS)
+INPUT_SIZE = Histogram('deobf_input_bytes', 'Size of deobfuscation inputs', SIZE_BUCKETS)
+OUTPUT_SIZE = Histogram('deobf_output_bytes', 'Size of deobfuscation outputs', SIZE_BUCKETS)
+LEDGER_LATENCY = Histogram('ledger_operation_seconds', 'Token ledger operation latency', LATENCY_BUCKETS, labels=('operation',))
+EVENT_LOOP_LAG = Histogram('event_loop_lag_seconds', 'How late the event loop wakes up a 1s sleep', LATENCY_BUCKETS)
+STAGE_TIME = Histogram('deobf_stage_seconds', 'Time spent in each stage of a deobfuscation job', LATENCY_BUCKETS, labels=('stage',))
+COALESCED = Counter('deobf_coalesced_total', 'Requests that joined an identical download or deobfuscation already in flight', labels=('stage',))
+
+# Last measured event loop lag in seconds
+event_loop_lag = 0.0
+# Probe thresholds: /ready fails first so load is shed before /live triggers a restart
+READINESS_MAX_LAG = float(os.getenv('READINESS_MAX_LAG', 1))
+LIVENESS_MAX_LAG = float(os.getenv('LIVENESS_MAX_LAG', 10))
+gateway_connected = False
+
+async def monitor_event_loop_lag(interval=1.0):
+    """Sample how far the loop falls behind a fixed sleep"""
+    global event_loop_lag
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        event_loop_lag = max(0.0, loop.time() - start - interval)
+        EVENT_LOOP_LAG.observe(event_loop_lag)
+
+class JobProfiler:
+    """cProfile plus tracemalloc for the next N jobs, armed by the admin .profile command
+
+    Only one job is profiled at a time. cProfile sees everything the event
+    loop runs while that job is in flight, not just the job itself.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.remaining = 0
+        self._active = None
+        self._profile = None
+
+    def arm(self, count):
+        self.remaining = count
+
+    def begin(self, job_id):
+        if self.remaining <= 0 or self._active is not None:
+            return False
+        self.remaining -= 1
+        self._active = job_id
+        self._profile = cProfile.Profile()
+        tracemalloc.start()
+        self._profile.enable()
+        return True
+
+    def end(self, job_id):
+        """Stop profiling job_id and write its dumps, returns the .prof path"""
+        if self._active != job_id:
+            return None
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        profile, self._profile, self._active = self._profile, None, None
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{job_id}")
+        profile.dump_stats(base + '.prof')
+        with open(base + '.txt', 'w') as f:
+            f.write(f'tracemalloc peak: {peak / 1024:.1f} KB\n\nTop allocations by line:\n')
+            for stat in snapshot.statistics('lineno')[:25]:
+                f.write(f'{stat}\n')
+            f.write('\nTop functions by cumulative time:\n')
+            pstats.Stats(profile, stream=f).sort_stats('cumulative').print_stats(25)
+        return base + '.prof'
+
+job_profiler = JobProfiler(DEOBF_PROFILE_DIR)
+
+class JobTrace:
+    """Stage timings for one job, logged as a single JSON line when it finishes"""
+
+    def __init__(self, kind, user_id, **fields):
+        self.id = secrets.token_hex(6)
+        self.fields = {'job': self.id, 'kind': kind, 'user_id': user_id, **fields}
+        self.stages = {}
+        self.stage = None
+        self.started = time.perf_counter()
+        self.profiled = False
+
+    @contextmanager
+    def span(self, stage):
+        start = time.perf_counter()
+        self.stage = stage
+        try:
+            yield
+        finally:
+            self.stages[stage] = self.stages.get(stage, 0.0) + time.perf_counter() - start
+
+    def begin(self):
+        job_history.start(self)
+        self.profiled = job_profiler.begin(self.id)
+
+    def breakdown(self):
+        return '\n'.join(f"`{stage}` {seconds * 1000:.1f} ms" for stage, seconds in self.stages.items())
+
+    def finish(self, outcome, **fields):
+        if self.profiled:
+            try:
+                fields['profile'] = job_profiler.end(self.id)
+            except Exception as e:
+                print(f"Could not write profile for job {self.id}: {e}")
+        for stage, seconds in self.stages.items():
+            STAGE_TIME.observe(seconds, stage=stage)
+        total = time.perf_counter() - self.started
+        job_history.record(self, outcome, total, fields)
+        if not DEOBF_JOB_LOG:
+            return
+        record = {
+            **self.fields,
+            **fields,
+            'outcome': outcome,
+            'total_ms': round(total * 1000, 2),
+            'stages_ms': {stage: round(seconds * 1000, 2) for stage, seconds in self.stages.items()},
+        }
+        print(json.dumps(record), flush=True)
+
+class RuntimeHistogram:
+    """Durations counted in geometric buckets, percentiles come back as a bucket's upper bound"""
+
+    MIN_SECONDS = 0.001
+    RATIO = 1.25
+    BUCKETS = 64
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.total = 0
+
+    def add(self, seconds, amount=1):
+        """Count a duration, a negative amount takes it back out"""
+        if seconds <= self.MIN_SECONDS:
+            index = 0
+        else:
+            index = min(self.BUCKETS - 1, math.ceil(math.log(seconds / self.MIN_SECONDS, self.RATIO)))
+        self.counts[index] += amount
+        self.total += amount
+
+    def percentile(self, pct):
+        """Within 25% of the exact value, None when nothing has been counted"""
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(self.total * pct / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.MIN_SECONDS * self.RATIO ** index
+        return self.MIN_SECONDS * self.RATIO ** (self.BUCKETS - 1)
+
+JobRecord = namedtuple(
+    'JobRecord',
+    ['id', 'kind', 'user_id', 'finished', 'outcome', 'seconds', 'input_bytes', 'output_bytes', 'cache_hit', 'coalesced', 'stages']
+)
+
+class JobHistory:
+    """The last ``capacity`` finished jobs in a ring buffer, plus the jobs still running
+
+    The runtime percentiles, failure counts and cache hits cover exactly the
+    jobs in the buffer: each new record is counted in and the one it pushes
+    out is counted back out. Throughput is counted in per-minute buckets for
+    the last hour. Recording a job costs the same however long the history is.
+    """
+
+    def __init__(self, capacity):
+        self.records = deque(maxlen=max(1, capacity))
+        self.active = {}
+        self.job_time = RuntimeHistogram()
+        self.worker_time = RuntimeHistogram()
+        self.failures = {}
+        self.cache_hits = 0
+        self.coalesced = 0
+        # [minute, jobs, successes] per minute of the hour, reused as the clock comes round
+        self._minutes = [[-1, 0, 0] for _ in range(60)]
+
+    def start(self, trace):
+        self.active[trace.id] = trace
+
+    def record(self, trace, outcome, seconds, fields):
+        self.active.pop(trace.id, None)
+        record = JobRecord(
+            trace.id, trace.fields['kind'], trace.fields['user_id'], time.time(), outcome, seconds,
+            fields.get('input_bytes', 0), fields.get('output_bytes', 0), bool(fields.get('cache_hit')),
+            bool(trace.fields.get('coalesced')), dict(trace.stages)
+        )
+        if len(self.records) == self.records.maxlen:
+            self._count(self.records[0], -1)
+        self.records.append(record)
+        self._count(record, 1)
+        
+        minute = int(record.finished // 60)
+        bucket = self._minutes[minute % 60]
+        if bucket[0] != minute:
+            bucket[:] = [minute, 0, 0]
+        bucket[1] += 1
+        bucket[2] += outcome == 'success'
+
+    def _count(self, record, amount):
+        self.job_time.add(record.seconds, amount)
+        if 'deobfuscate' in record.stages:
+            self.worker_time.add(record.stages['deobfuscate'], amount)
+        if record.outcome != 'success':
+            count = self.failures.get(record.outcome, 0) + amount
+            if count:
+                self.failures[record.outcome] = count
+            else:
+                del self.failures[record.outcome]
+        self.cache_hits += amount * record.cache_hit
+        self.coalesced += amount * record.coalesced
+
+    def throughput(self, minutes):
+        """(jobs, successes) finished in the last ``minutes`` minutes, the current one included"""
+        now = int(time.time() // 60)
+        jobs = successes = 0
+        for minute, count, succeeded in self._minutes:
+            if now - minutes < minute <= now:
+                jobs += count
+                successes += succeeded
+        return jobs, successes
+
+    def top_failures(self, n=5):
+        return sorted(self.failures.items(), key=lambda item: item[1], reverse=True)[:n]
+
+job_history = JobHistory(DEOBF_JOB_HISTORY)
+
+def format_duration(seconds):
+    if seconds is None:
+        return 'n/a'
+    return f'{seconds * 1000:.0f} ms' if seconds < 1 else f'{seconds:.1f}s'
+
+def fit_lines(lines, limit=1000):
+    """Join lines for an embed field, cut off with a count of what didn't fit"""
+    text = ''
+    for index, line in enumerate(lines):
+        if len(text) + len(line) > limit:
+            return text + f"... and {len(lines) - index} more"
+        text += line + '\n'
+    return text.strip() or 'None'
+
+class Settings:
+    """Bot settings kept in memory and persisted to settings.json
+
+    The file is read once, writes go through an atomic replace, and
+    ``watch`` picks up edits made to the file while the bot is running.
+    """
+
+    DEFAULTS = {'token_system_enabled': True}
+
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+        self._mtime = None
+        self._listeners = []
+
+    def _read(self):
+        """Defaults overlaid with the file, None if the file can't be read or parsed"""
+        data = dict(self.DEFAULTS)
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    data.update(json.load(f))
+            except Exception as e:
+                print(f"Could not read {self.path}: {e}")
+                return None
+        return data
+
+    def _stat_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
 
-def save_settings(settings):
-    """Save bot settings"""
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=2)
+    def load(self):
+        """Load settings from disk, notifying listeners of any changed keys"""
+        mtime = self._stat_mtime()
+        data = self._read()
+        old = self._data
+        self._mtime = mtime
+        if data is None:
+            # A half-written or broken file must not reset live settings, keep them until the next edit
+            if old is not None:
+                print(f"Keeping the current settings until {self.path} is fixed")
+                return old
+            print("Using default settings")
+            data = dict(self.DEFAULTS)
+        self._data = data
+        if old is not None:
+            for key in set(old) | set(data):
+                if old.get(key) != data.get(key):
+                    self._notify(key, old.get(key), data.get(key))
+        return data
+
+    def get(self, key, default=None):
+        if self._data is None:
+            self.load()
+        return self._data.get(key, default)
+
+    def set(self, key, value):
+        """Update one setting and persist it atomically"""
+        if self._data is None:
+            self.load()
+        old = self._data.get(key)
+        self._data[key] = value
+        self.save()
+        if old != value:
+            self._notify(key, old, value)
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.settings-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._mtime = self._stat_mtime()
+
+    def add_listener(self, callback):
+        """Register ``callback(key, old_value, new_value)`` for setting changes"""
+        self._listeners.append(callback)
+
+    def _notify(self, key, old, new):
+        for callback in self._listeners:
+            try:
+                callback(key, old, new)
+            except Exception as e:
+                print(f"Settings listener error for {key}: {e}")
+
+    def reload_if_changed(self):
+        if self._stat_mtime() != self._mtime:
+            self.load()
+            return True
+        return False
+
+    async def watch(self, interval):
+        """Poll the file's mtime and hot-reload it when it changes"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if self.reload_if_changed():
+                    print(f"Reloaded {self.path}")
+            except Exception as e:
+                print(f"Error reloading {self.path}: {e}")
+
+settings = Settings(SETTINGS_FILE)
 
 def is_token_system_enabled():
     """Check if token system is currently enabled"""
-    settings = load_settings()
     return settings.get('token_system_enabled', True)
 
 def set_token_system(enabled):
     """Enable or disable the token system"""
-    settings = load_settings()
-    settings['token_system_enabled'] = enabled
-    save_settings(settings)
+    settings.set('token_system_enabled', enabled)
 
-def load_tokens():
-    if os.path.exists(TOKENS_FILE):
-        try:
-            with open(TOKENS_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+class TokenLedger:
+    """SQLite-backed token ledger with one row per user
+
+    Every balance change runs inside a single ``BEGIN IMMEDIATE`` transaction,
+    so concurrent commands can no longer overwrite each other's writes.
+    """
+
+    def __init__(self, path, legacy_json=None):
+        self.path = path
+        self.legacy_json = legacy_json
+        self._conn = None
+        self._lock = threading.RLock()
+
+    @property
+    def db(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS users ('
+                'user_id INTEGER PRIMARY KEY, '
+                'tokens INTEGER NOT NULL, '
+                'last_daily TEXT)'
+            )
+            conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS api_keys ('
+                'key_hash TEXT PRIMARY KEY, '
+                'user_id INTEGER NOT NULL, '
+                'created_at TEXT NOT NULL)'
+            )
+            self._conn = conn
+            if self.legacy_json:
+                self.migrate_from_json(self.legacy_json)
+        return self._conn
+
+    @contextmanager
+    def transaction(self):
+        """Run a block inside one write transaction"""
+        with self._lock:
+            db = self.db
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                yield db
+            except BaseException:
+                db.execute('ROLLBACK')
+                raise
+            db.execute('COMMIT')
+
+    def migrate_from_json(self, json_path):
+        """One-time import of the legacy tokens.json file"""
+        if not os.path.exists(json_path):
+            return 0
+        with self.transaction() as db:
+            if db.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone():
+                return 0
+            try:
+                with open(json_path, 'r') as f:
+                    tokens_data = json.load(f)
+            except Exception as e:
+                print(f"Could not migrate {json_path}: {e}")
+                return 0
+            rows = []
+            for user_id_str, user_data in tokens_data.items():
+                try:
+                    rows.append((int(user_id_str), int(user_data.get('tokens', 0)), user_data.get('last_daily')))
+                except (TypeError, ValueError, AttributeError):
+                    continue
+            db.executemany('INSERT OR IGNORE INTO users (user_id, tokens, last_daily) VALUES (?, ?, ?)', rows)
+            db.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_json', ?)",
+                (datetime.now().isoformat(),)
+            )
+        print(f"Migrated {len(rows)} user(s) from {json_path} to {self.path}")
+        return len(rows)
+
+    def _refresh(self, db, user_id):
+        """Create the user if needed and apply the daily reward, returns the balance"""
+        now = datetime.now()
+        row = db.execute('SELECT tokens, last_daily FROM users WHERE user_id = ?', (user_id,)).fetchone()
+        if row is None:
+            db.execute(
+                'INSERT INTO users (user_id, tokens, last_daily) VALUES (?, ?, ?)',
+                (user_id, INITIAL_TOKENS, now.isoformat())
+            )
+            return INITIAL_TOKENS
+
+        tokens, last_daily = row
+        if last_daily:
+            # If it's a new day, give daily tokens
+            if now.date() > datetime.fromisoformat(last_daily).date():
+                tokens += DAILY_TOKENS
+                db.execute(
+                    'UPDATE users SET tokens = ?, last_daily = ? WHERE user_id = ?',
+                    (tokens, now.isoformat(), user_id)
+                )
+        else:
+            # First time, set last_daily to now
+            db.execute('UPDATE users SET last_daily = ? WHERE user_id = ?', (now.isoformat(), user_id))
+        return tokens
+
+    def balance(self, user_id):
+        with self.transaction() as db:
+            return self._refresh(db, int(user_id))
+
+    def debit(self, user_id, amount=COST_PER_USE):
+        """Take tokens from a user, returns False without changes if the balance is too low"""
+        with self.transaction() as db:
+            user_id = int(user_id)
+            if self._refresh(db, user_id) < amount:
+                return False
+            db.execute('UPDATE users SET tokens = tokens - ? WHERE user_id = ?', (amount, user_id))
+            return True
+
+    def debit_up_to(self, user_id, amounts):
+        """Take each of ``amounts`` in order until the balance runs out, in one go
+
+        Returns how many of them the balance covered.
+        """
+        with self.transaction() as db:
+            user_id = int(user_id)
+            balance = self._refresh(db, user_id)
+            covered = total = 0
+            for amount in amounts:
+                if total + amount > balance:
+                    break
+                total += amount
+                covered += 1
+            if total:
+                db.execute('UPDATE users SET tokens = tokens - ? WHERE user_id = ?', (total, user_id))
+            return covered
+
+    def credit(self, user_id, amount):
+        with self.transaction() as db:
+            db.execute(
+                'INSERT INTO users (user_id, tokens, last_daily) VALUES (?, ?, NULL) '
+                'ON CONFLICT(user_id) DO UPDATE SET tokens = tokens + ?',
+                (int(user_id), INITIAL_TOKENS + amount, amount)
+            )
+
+    def transfer(self, from_user_id, to_user_id, amount):
+        """Move tokens between two users in one transaction
+
+        Returns ``(True, balance)`` on success or ``(False, balance)`` when the
+        sender cannot cover the amount, where balance is the sender's balance.
+        """
+        with self.transaction() as db:
+            from_user_id = int(from_user_id)
+            to_user_id = int(to_user_id)
+            balance = self._refresh(db, from_user_id)
+            if balance < amount:
+                return False, balance
+            db.execute('UPDATE users SET tokens = tokens - ? WHERE user_id = ?', (amount, from_user_id))
+            db.execute(
+                'INSERT INTO users (user_id, tokens, last_daily) VALUES (?, ?, NULL) '
+                'ON CONFLICT(user_id) DO UPDATE SET tokens = tokens + ?',
+                (to_user_id, INITIAL_TOKENS + amount, amount)
+            )
+            return True, balance - amount
 
-def save_tokens(tokens):
-    with open(TOKENS_FILE, 'w') as f:
-        json.dump(tokens, f, indent=2)
+    def create_api_key(self, user_id):
+        """Issue a new HTTP API key for a user, replacing any old one; only its hash is stored"""
+        key = secrets.token_urlsafe(32)
+        with self.transaction() as db:
+            db.execute('DELETE FROM api_keys WHERE user_id = ?', (int(user_id),))
+            db.execute(
+                'INSERT INTO api_keys (key_hash, user_id, created_at) VALUES (?, ?, ?)',
+                (hashlib.sha256(key.encode()).hexdigest(), int(user_id), datetime.now().isoformat())
+            )
+        return key
+
+    def revoke_api_keys(self, user_id):
+        with self.transaction() as db:
+            return db.execute('DELETE FROM api_keys WHERE user_id = ?', (int(user_id),)).rowcount
+
+    def api_key_user(self, key):
+        """The user an API key belongs to, or None"""
+        with self._lock:
+            row = self.db.execute(
+                'SELECT user_id FROM api_keys WHERE key_hash = ?',
+                (hashlib.sha256(key.encode()).hexdigest(),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+ledger = TokenLedger(LEDGER_FILE, legacy_json=TOKENS_FILE)
 
 def get_user_tokens(user_id):
-    tokens_data = load_tokens()
-    user_id_str = str(user_id)
-    
-    if user_id_str not in tokens_data:
-        tokens_data[user_id_str] = {
-            'tokens': INITIAL_TOKENS,
-            'last_daily': None
-        }
-        save_tokens(tokens_data)
-    
-    user_data = tokens_data[user_id_str]
-    
-    # Check if we need to give daily tokens
-    now = datetime.now()
-    last_daily = user_data.get('last_daily')
-    
-    if last_daily:
-        last_daily_date = datetime.fromisoformat(last_daily)
-        # If it's a new day, give daily tokens
-        if now.date() > last_daily_date.date():
-            user_data['tokens'] = user_data.get('tokens', 0) + DAILY_TOKENS
-            user_data['last_daily'] = now.isoformat()
-            save_tokens(tokens_data)
-    else:
-        # First time, set last_daily to now
-        user_data['last_daily'] = now.isoformat()
-        save_tokens(tokens_data)
-    
-    return user_data['tokens']
+    with LEDGER_LATENCY.time(operation='balance'):
+        return ledger.balance(user_id)
 
-def use_token(user_id):
-    tokens_data = load_tokens()
-    user_id_str = str(user_id)
-    
-    tokens = get_user_tokens(user_id)
-    if tokens < COST_PER_USE:
-        return False
-    
-    tokens_data[user_id_str]['tokens'] = tokens - COST_PER_USE
-    save_tokens(tokens_data)
-    return True
+def use_token(user_id, amount=COST_PER_USE):
+    with LEDGER_LATENCY.time(operation='debit'):
+        return ledger.debit(user_id, amount)
+
+def use_tokens_up_to(user_id, amounts):
+    with LEDGER_LATENCY.time(operation='debit'):
+        return ledger.debit_up_to(user_id, amounts)
 
 def add_tokens(user_id, amount):
-    tokens_data = load_tokens()
-    user_id_str = str(user_id)
-    
-    if user_id_str not in tokens_data:
-        tokens_data[user_id_str] = {
-            'tokens': INITIAL_TOKENS,
-            'last_daily': None
+    with LEDGER_LATENCY.time(operation='credit'):
+        ledger.credit(user_id, amount)
+
+def transfer_tokens(from_user_id, to_user_id, amount):
+    with LEDGER_LATENCY.time(operation='transfer'):
+        return ledger.transfer(from_user_id, to_user_id, amount)
+
+def result_key(input_hash):
+    """Result cache and coalescing key: the input plus the deobfuscator build that will process it"""
+    version = deobfuscator.version if deobfuscator is not None else ''
+    return f'{input_hash}-{version}' if version else input_hash
+
+def hash_file(path):
+    """SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ResultCache:
+    """On-disk deobfuscation results keyed by the input's SHA-256 and the deobfuscator build
+
+    Each entry is ``<digest>.out`` (the deobfuscated file) plus
+    ``<digest>.json`` (found links and creation time). Entries are evicted
+    least-recently-used first once the directory exceeds ``max_bytes``,
+    and expire after ``ttl`` seconds when a TTL is set.
+    """
+
+    def __init__(self, directory, max_bytes, ttl=0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        self._entries = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def _paths(self, digest):
+        return os.path.join(self.directory, digest + '.out'), os.path.join(self.directory, digest + '.json')
+
+    def _index(self):
+        """Entries ordered from least to most recently used, loaded from disk on first use"""
+        if self._entries is None:
+            os.makedirs(self.directory, exist_ok=True)
+            found = []
+            for name in os.listdir(self.directory):
+                if not name.endswith('.json'):
+                    continue
+                digest = name[:-5]
+                out_path, meta_path = self._paths(digest)
+                try:
+                    with open(meta_path, 'r') as f:
+                        meta = json.load(f)
+                    found.append((os.path.getmtime(meta_path), digest, os.path.getsize(out_path), meta['created']))
+                except (OSError, ValueError, KeyError):
+                    self._remove_files(digest)
+            self._entries = OrderedDict()
+            for _, digest, size, created in sorted(found):
+                self._entries[digest] = (size, created)
+            self.total_bytes = sum(size for size, _ in self._entries.values())
+        return self._entries
+
+    def _remove_files(self, digest):
+        for path in self._paths(digest):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _drop(self, digest):
+        size, _ = self._entries.pop(digest)
+        self.total_bytes -= size
+        self._remove_files(digest)
+
+    def restore(self, digest, dest_path):
+        """Copy a cached result to dest_path, returns its links or None on a miss"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entries = self._index()
+            entry = entries.get(digest)
+            if entry and self.ttl and time.time() - entry[1] > self.ttl:
+                self._drop(digest)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            out_path, meta_path = self._paths(digest)
+            try:
+                with open(meta_path, 'r') as f:
+                    links = json.load(f)['links']
+                shutil.copyfile(out_path, dest_path)
+                os.utime(meta_path)
+            except (OSError, ValueError, KeyError):
+                self._drop(digest)
+                self.misses += 1
+                return None
+            entries.move_to_end(digest)
+            self.hits += 1
+            return links
+
+    def put(self, digest, output_path, links):
+        """Store a successful result and evict old entries past the size cap"""
+        if not self.enabled:
+            return
+        size = os.path.getsize(output_path)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            entries = self._index()
+            out_path, meta_path = self._paths(digest)
+            tmp_out = out_path + '.tmp'
+            shutil.copyfile(output_path, tmp_out)
+            os.replace(tmp_out, out_path)
+            created = time.time()
+            tmp_meta = meta_path + '.tmp'
+            with open(tmp_meta, 'w') as f:
+                json.dump({'links': links, 'created': created}, f)
+            os.replace(tmp_meta, meta_path)
+            if digest in entries:
+                self.total_bytes -= entries[digest][0]
+            entries[digest] = (size, created)
+            entries.move_to_end(digest)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and entries:
+                self._drop(next(iter(entries)))
+                self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries or ()),
+            'bytes': self.total_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
         }
-    
-    tokens_data[user_id_str]['tokens'] = tokens_data[user_id_str].get('tokens', 0) + amount
-    save_tokens(tokens_data)
+
+result_cache = ResultCache(DEOBF_CACHE_DIR, DEOBF_CACHE_MAX_MB * 1024 * 1024, ttl=DEOBF_CACHE_TTL)
+
+def copy_file_to(src_path, dest_paths):
+    for dest_path in dest_paths:
+        shutil.copyfile(src_path, dest_path)
+
+class Flight:
+    """One in-flight job plus the files of the callers waiting on it"""
+
+    def __init__(self):
+        self.future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting when the leader fails, don't warn about an unretrieved exception
+        self.future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.destinations = []
+
+class SingleFlight:
+    """Runs concurrent jobs with the same key once and shares the result
+
+    The first caller for a key runs the job into its own dest_path. Callers
+    that arrive while it is running wait for it instead, and get the
+    produced file copied to their dest_path when ``succeeded(result)``
+    holds. If the running caller is cancelled, a waiting one takes over.
+    """
+
+    def __init__(self, stage):
+        self.stage = stage
+        self._flights = {}
+
+    @property
+    def in_flight(self):
+        return len(self._flights)
+
+    async def run(self, key, dest_path, produce, succeeded, trace=None):
+        """Returns (result, coalesced), produce is a coroutine function taking no arguments"""
+        while key in self._flights:
+            flight = self._flights[key]
+            flight.destinations.append(dest_path)
+            try:
+                with trace.span('coalesced_wait') if trace else nullcontext():
+                    result = await asyncio.shield(flight.future)
+            except asyncio.CancelledError:
+                if flight.future.cancelled():
+                    continue
+                raise
+            finally:
+                flight.destinations.remove(dest_path)
+            COALESCED.inc(stage=self.stage)
+            return result, True
+        
+        flight = self._flights[key] = Flight()
+        try:
+            result = await produce()
+            del self._flights[key]
+            if flight.destinations and succeeded(result):
+                await asyncio.get_running_loop().run_in_executor(None, copy_file_to, dest_path, list(flight.destinations))
+        except asyncio.CancelledError:
+            flight.future.cancel()
+            raise
+        except BaseException as e:
+            flight.future.set_exception(e)
+            raise
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.future.set_result(result)
+        return result, False
+
+download_flights = SingleFlight('download')
+deobf_flights = SingleFlight('deobfuscate')
+
+# A candidate runs from "http://" or "https://" up to the first terminator or the next "http"
+LINK_CANDIDATE = re.compile(r'https?://(?:[^\n\r\t "\'<>{}|\\^`\[\]h]+|h(?!ttp))*')
+LINK_NETLOC = re.compile(r'https?://([^/?#]*)')
+NON_PRINTABLE = re.compile(r'[^\x20-\x7e]+')
+LINK_TRAILING_CHARS = '.,;:)]}!?"\'>\\|`~@#$%^&*+='
+# Outputs larger than this are scanned in a worker thread instead of on the event loop
+LINK_SCAN_OFFLOAD_CHARS = 256 * 1024
 
 def extract_links(text):
     """Extract and aggressively clean URLs from text to ensure Discord compatibility"""
-    cleaned_links = []
+    seen = set()
+    unique_links = []
     
-    # Split by 'http' to handle merged URLs
-    parts = text.split('http')
+    candidates = LINK_CANDIDATE.finditer(text)
+    if text.startswith(('://', 's://')):
+        # Text before the first "http" still counts as a URL body
+        candidates = itertools.chain([LINK_CANDIDATE.match('http' + text)], candidates)
     
-    for part in parts:
-        if not part:
+    for match in candidates:
+        # Drop trailing punctuation, decode %-escapes and strip non-printable characters
+        link = NON_PRINTABLE.sub('', unquote(match.group().rstrip(LINK_TRAILING_CHARS)))
+        
+        if not link.startswith(('http://', 'https://')) or link in seen:
             continue
         
-        # Reconstruct the URL with http/https
-        if part.startswith('://'):
-            link = 'http' + part
-        elif part.startswith('s://'):
-            link = 'https' + part[1:]
+        if '[' in link or ']' in link:
+            # Only bracketed (IPv6) hosts need the full parser and its validation
+            try:
+                netloc = urlsplit(link).netloc
+            except ValueError:
+                continue
         else:
+            netloc = LINK_NETLOC.match(link).group(1)
+        if not netloc:
             continue
         
-        try:
-            # Step 1: Remove everything after common terminators
-            for terminator in ['\n', '\r', '\t', ' ', '"', "'", '<', '>', '{', '}', '|', '\\', '^', '`', '[', ']']:
-                if terminator in link:
-                    link = link.split(terminator)[0]
-            
-            # Step 2: Stop at next URL if URLs are concatenated
-            # Look for common URL start patterns after the domain
-            for pattern in ['http://', 'https://']:
-                if link.count(pattern) > 1:
-                    # Find the position of the second occurrence
-                    first_pos = link.find(pattern)
-                    second_pos = link.find(pattern, first_pos + len(pattern))
-                    if second_pos > 0:
-                        link = link[:second_pos]
-            
-            # Step 3: Aggressively remove trailing special characters
-            while link and link[-1] in '.,;:)]}!?"\'>\\|`~@#$%^&*+=':
-                link = link[:-1]
-            
-            # Step 4: Remove URL-encoded characters that might cause issues
-            link = unquote(link)
-            
-            # Step 5: Remove any non-printable ASCII characters
-            link = ''.join(char for char in link if 32 <= ord(char) <= 126)
-            
-            # Step 6: Ensure it's still a valid URL structure
-            if not link.startswith(('http://', 'https://')):
-                continue
-            
-            # Step 7: Parse URL to validate structure
-            parsed = urlparse(link)
-            if not parsed.scheme or not parsed.netloc:
-                continue
-            
-            # Step 8: Skip bot's Discord link
-            if 'discord.gg/Y3yt5XMCGj' in link:
-                continue
-            
-            # Step 9: Final validation - must have protocol and domain
-            if len(link) > 10 and '://' in link and '.' in parsed.netloc:
-                cleaned_links.append(link)
-                
-        except Exception:
-            # If any error occurs, skip this link
+        # Skip bot's Discord link
+        if 'discord.gg/Y3yt5XMCGj' in link:
             continue
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_links = []
-    for link in cleaned_links:
-        if link not in seen:
+        
+        # Final validation - must have protocol and domain
+        if len(link) > 10 and '://' in link and '.' in netloc:
             seen.add(link)
             unique_links.append(link)
     
     return unique_links
 
-def is_valid_url(url):
-    """Check if a string is a valid URL"""
-    try:
-        result = urlparse(url)
-        return all([result.scheme in ['http', 'https'], result.netloc])
-    except:
-        return False
+def is_valid_url(url):
+    """Check if a string is a valid URL"""
+    try:
+        result = urlparse(url)
+        return all([result.scheme in ['http', 'https'], result.netloc])
+    except:
+        return False
+
+def normalize_url(url):
+    """Key for URLs naming the same file: lowercase scheme and host, no default port or fragment"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != {'http': 80, 'https': 443}.get(scheme):
+        host = f'{host}:{parts.port}'
+    return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+def get_http_session():
+    """Application-wide aiohttp session, so repeated hosts reuse pooled keep-alive connections"""
+    global http_session
+    if http_session is None or http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_MAX_CONNECTIONS,
+            limit_per_host=HTTP_MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+        )
+        http_session = aiohttp.ClientSession(connector=connector)
+    return http_session
+
+async def close_http_session():
+    global http_session
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
+async def download_file_from_url(url, dest_path, session=None):
+    """Stream a URL into dest_path, returns (size, error)"""
+    session = session or get_http_session()
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status != 200:
+                return 0, f"Failed to download file. HTTP Status: {response.status}"
+            if response.content_length is not None and response.content_length > MAX_FILE_SIZE:
+                return 0, "File too large! Maximum size is 5MB."
+            size = 0
+            with open(dest_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    # Content-Length can be missing or wrong, so enforce the limit while streaming
+                    if size > MAX_FILE_SIZE:
+                        return 0, "File too large! Maximum size is 5MB."
+                    f.write(chunk)
+            return size, None
+    except asyncio.TimeoutError:
+        return 0, "Download timed out. Please try again."
+    except Exception as e:
+        return 0, f"Error downloading file: {str(e)}"
+
+async def fetch_url(url, dest_path):
+    """download_file_from_url, shared with any identical download already running"""
+    result, _ = await download_flights.run(
+        normalize_url(url), dest_path,
+        lambda: download_file_from_url(url, dest_path),
+        lambda result: result[1] is None
+    )
+    return result
+
+class DeobfuscatorNotFound(Exception):
+    pass
+
+# Resolved command line for the deobfuscator: argv prefix, working directory, where it came from
+# and a fingerprint of the build, so cached results never outlive the build that produced them
+DeobfuscatorCommand = namedtuple('DeobfuscatorCommand', ['prefix', 'cwd', 'source', 'version'], defaults=('',))
+
+deobfuscator = None
+
+def find_moonsec_csproj(src_dir):
+    if os.path.exists(src_dir):
+        for root, dirs, files in os.walk(src_dir):
+            for file in files:
+                if file.endswith('.csproj') and 'Moonsec' in file:
+                    return os.path.join(root, file)
+    return None
+
+def fingerprint_build(prefix, root, skip_dirs=()):
+    """Short hash of a command line plus the size and mtime of every file under its build directory
+
+    ``root`` may also be a single file, which is then all that is hashed.
+    """
+    digest = hashlib.sha256(json.dumps(prefix).encode())
+    if os.path.isfile(root):
+        base = os.path.dirname(root)
+        walk = [(base, [], [os.path.basename(root)])]
+    else:
+        base = root
+        walk = os.walk(root)
+    for directory, dirs, files in walk:
+        dirs[:] = sorted(d for d in dirs if d not in skip_dirs)
+        for name in sorted(files):
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except OSError:
+                continue
+            digest.update(f'{os.path.relpath(os.path.join(directory, name), base)}:{stat.st_size}:{stat.st_mtime_ns}\n'.encode())
+    return digest.hexdigest()[:16]
+
+def resolve_deobfuscator(project_dir=PROJECT_DIR):
+    """Locate the deobfuscator binary (or its project) and build its command line"""
+    bin_dir = os.path.join(project_dir, 'bin')
+    
+    if os.path.exists(bin_dir):
+        for root, dirs, files in os.walk(bin_dir):
+            for file in files:
+                if file == 'MoonsecDeobfuscator' or file == 'MoonsecDeobfuscator.exe':
+                    prefix = [os.path.join(root, file)]
+                    return DeobfuscatorCommand(prefix, root, 'binary', fingerprint_build(prefix, root))
+    
+    src_dir = os.path.join(project_dir, 'src')
+    possible_paths = [
+        os.path.join(project_dir, 'MoonsecDeobfuscator'),
+        os.path.join(project_dir, 'MoonsecDeobfuscator.exe'),
+        os.path.join(src_dir, 'bin', 'Release', 'net9.0', 'MoonsecDeobfuscator'),
+        os.path.join(src_dir, 'bin', 'Release', 'net9.0', 'MoonsecDeobfuscator.exe'),
+        os.path.join(src_dir, 'bin', 'Release', 'net8.0', 'MoonsecDeobfuscator'),
+        os.path.join(src_dir, 'bin', 'Release', 'net8.0', 'MoonsecDeobfuscator.exe'),
+    ]
+    for path in possible_paths:
+        if os.path.exists(path):
+            build_dir = os.path.dirname(path)
+            # A binary dropped in the project dir sits next to the bot's cache, ledger and settings
+            fingerprinted = path if os.path.normpath(build_dir) == os.path.normpath(project_dir) else build_dir
+            return DeobfuscatorCommand([path], build_dir, 'binary', fingerprint_build([path], fingerprinted))
+    
+    csproj_path = find_moonsec_csproj(src_dir)
+    if csproj_path:
+        prefix = ['dotnet', 'run', '--project', csproj_path, '--']
+        version = fingerprint_build(prefix, os.path.dirname(csproj_path), skip_dirs=('bin', 'obj'))
+        return DeobfuscatorCommand(prefix, project_dir, 'dotnet run', version)
+    
+    raise DeobfuscatorNotFound(
+        f'MoonsecDeobfuscator not found under {bin_dir}, {project_dir} or {src_dir}. '
+        'Build it with `cd src && dotnet build -c Release`.'
+    )
+
+def build_dotnet_project(command):
+    """Build a `dotnet run` fallback once, so every worker can run it with --no-build
+
+    Workers building the same project at once would race on its bin/ and
+    obj/, and a respawned worker would rebuild under its siblings' feet.
+    """
+    csproj_path = command.prefix[3]
+    start = time.perf_counter()
+    try:
+        build = subprocess.run(
+            ['dotnet', 'build', '-c', 'Release', csproj_path],
+            capture_output=True,
+            text=True,
+            cwd=command.cwd
+        )
+    except OSError as e:
+        print(f"Could not run dotnet build, jobs will build on demand: {e}")
+        return command
+    if build.returncode != 0:
+        print(f"dotnet build failed, jobs will build on demand: {build.stderr[-500:]}")
+        return command
+    print(f"Built {csproj_path} in {time.perf_counter() - start:.1f}s")
+    return command._replace(prefix=['dotnet', 'run', '--no-build', '-c', 'Release', '--project', csproj_path] + command.prefix[4:])
+
+def load_deobfuscator():
+    """Resolve the deobfuscator and cache it, keeping the previous one on failure
+
+    Safe to run in an executor thread, callers with running workers follow
+    up with ``deobf_pool.recycle_all()`` on the event loop.
+    """
+    global deobfuscator
+    start = time.perf_counter()
+    resolved = resolve_deobfuscator()
+    if resolved.source == 'dotnet run':
+        resolved = build_dotnet_project(resolved)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    deobfuscator = resolved
+    print(f"Resolved deobfuscator ({resolved.source}, build {resolved.version}) in {elapsed_ms:.1f}ms: {' '.join(resolved.prefix)}")
+    return resolved
+
+class WorkerCrashed(Exception):
+    pass
+
+class JobLimitExceeded(Exception):
+    """The deobfuscator was killed for going over a CPU-time or output-size rlimit"""
+
+    def __init__(self, limit):
+        super().__init__(limit)
+        self.limit = limit
+
+def check_job_response(response):
+    """Turn a worker's error response into the exception callers expect"""
+    if response.get('error') == 'timeout':
+        raise asyncio.TimeoutError()
+    if response.get('error') in ('cpu_limit', 'output_limit'):
+        raise JobLimitExceeded(response['error'])
+    if 'error' in response:
+        raise WorkerCrashed(response['error'])
+    return response
+
+class PoolWorker:
+    """One long-lived deobf_worker.py process"""
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.process = None
+        self.jobs_done = 0
+        # Set once kill() is called, the process may still look alive while it shuts down
+        self.killed = False
+
+    async def start(self, argv, cwd):
+        self.process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            # Own process group, so a hard kill also takes down the job it is running
+            start_new_session=True
+        )
+        ready = await self.read_frame()
+        if not ready.get('ready'):
+            raise WorkerCrashed(f'Unexpected worker greeting: {ready}')
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def read_frame(self):
+        try:
+            header = await self.process.stdout.readexactly(FRAME_HEADER.size)
+            (size,) = FRAME_HEADER.unpack(header)
+            body = await self.process.stdout.readexactly(size)
+        except (asyncio.IncompleteReadError, ConnectionResetError) as e:
+            raise WorkerCrashed(f'Worker {self.process.pid} exited with code {self.process.returncode}') from e
+        return decode_frame(body)
+
+    async def request(self, job):
+        try:
+            self.process.stdin.write(encode_frame(job))
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise WorkerCrashed(f'Worker {self.process.pid} is gone') from e
+        response = await self.read_frame()
+        self.jobs_done += 1
+        return response
+
+    def kill(self):
+        """Cancel the running job: SIGTERM lets the worker kill the tool's group, SIGKILL follows"""
+        self.killed = True
+        if not self.alive:
+            return
+        try:
+            self.process.terminate()
+        except ProcessLookupError:
+            return
+        asyncio.get_running_loop().call_later(WORKER_KILL_GRACE, self._kill_group)
+
+    def _kill_group(self):
+        if self.alive:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+    async def stop(self, grace=5):
+        if not self.alive:
+            return
+        self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=grace)
+        except asyncio.TimeoutError:
+            self.kill()
+            await self.process.wait()
+
+class DeobfuscatorPool:
+    """Fixed-size pool of warm deobfuscator workers
+
+    Jobs go to an idle worker over its stdin/stdout frames. A worker is
+    replaced when it crashes, overruns a job's timeout, has served
+    ``max_jobs_per_worker`` jobs, or was started before ``recycle_all``.
+    """
+
+    def __init__(self, size, command_factory, job_timeout=90, max_jobs_per_worker=100, limits=None):
+        self.size = size
+        self.limits = limits or {}
+        self.command_factory = command_factory
+        self.job_timeout = job_timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.generation = 0
+        self.respawns = 0
+        self._idle = None
+        self._workers = set()
+        self._refills = set()
+        self._job_ids = itertools.count(1)
+
+    async def start(self):
+        self._idle = asyncio.Queue()
+        workers = await asyncio.gather(*(self._spawn() for _ in range(self.size)))
+        for worker in workers:
+            self._idle.put_nowait(worker)
+        print(f"Started {self.size} deobfuscator worker(s)")
+
+    async def _spawn(self):
+        argv, cwd = self.command_factory()
+        worker = PoolWorker(self.generation)
+        await worker.start(argv, cwd)
+        self._workers.add(worker)
+        return worker
+
+    def recycle_all(self):
+        """Replace every worker once its current job finishes"""
+        self.generation += 1
+
+    async def run(self, input_path, output_path, timeout=None, limits=None, origin=None):
+        """Run one job, raises asyncio.TimeoutError, JobLimitExceeded or WorkerCrashed on failure"""
+        timeout = timeout or self.job_timeout
+        worker = await self._idle.get()
+        try:
+            if worker is None or worker.killed or not worker.alive or worker.generation != self.generation:
+                if worker is not None:
+                    self._workers.discard(worker)
+                    await worker.stop()
+                worker = await self._spawn()
+            job = {
+                'id': next(self._job_ids),
+                'input': input_path,
+                'output': output_path,
+                'timeout': timeout,
+                'limits': limits or self.limits,
+            }
+            try:
+                # The worker enforces the timeout itself; the grace period covers a hung worker
+                response = await asyncio.wait_for(worker.request(job), timeout=timeout + 5)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                worker.kill()
+                raise
+            return check_job_response(response)
+        finally:
+            if worker is None or worker.killed or not worker.alive or worker.jobs_done >= self.max_jobs_per_worker:
+                # Respawn in the background so the caller gets its result right away
+                task = asyncio.create_task(self._refill(worker))
+                self._refills.add(task)
+                task.add_done_callback(self._refills.discard)
+            else:
+                self._idle.put_nowait(worker)
+
+    async def _refill(self, worker):
+        """Retire a worker and put a fresh one (or None if spawning failed) back in the idle queue"""
+        if worker is not None:
+            self._workers.discard(worker)
+            await worker.stop()
+        self.respawns += 1
+        try:
+            replacement = await self._spawn()
+        except Exception as e:
+            print(f"Failed to spawn deobfuscator worker: {e}")
+            replacement = None
+        self._idle.put_nowait(replacement)
+
+    async def close(self):
+        # Let in-flight respawns finish, cancelling a half-spawned process can hang the loop
+        await asyncio.gather(*self._refills, return_exceptions=True)
+        workers = list(self._workers)
+        self._workers.clear()
+        await asyncio.gather(*(worker.stop() for worker in workers), return_exceptions=True)
+
+class QueueBackend:
+    """Runs jobs through a shared JobQueue instead of a local worker pool
+
+    Same interface as DeobfuscatorPool. ``local_workers`` queue workers are
+    started here; workers on other hosts run ``deobf_worker.py --queue`` on
+    the same database and need DEOBF_WORK_DIR on the shared volume too. Each
+    job records the message it answers, so after a restart the bot can tell
+    users whose jobs it lost.
+    """
+
+    def __init__(self, queue, local_workers, command_factory, job_timeout=90, limits=None,
+                 claim_timeout=DEOBF_QUEUE_CLAIM_TIMEOUT):
+        self.queue = queue
+        self.local_workers = local_workers
+        self.command_factory = command_factory
+        self.job_timeout = job_timeout
+        self.limits = limits or {}
+        self.claim_timeout = claim_timeout
+        self.respawns = 0
+        self.orphans = []
+        self._pending = {}
+        self._processes = []
+        self._poller = None
+        self._restart = None
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        # Nothing is in flight yet, so every job already in the queue belongs to an earlier run
+        self.orphans = await loop.run_in_executor(None, self.queue.take_orphans)
+        await self._spawn_local()
+        self._poller = asyncio.create_task(self._poll())
+        print(f"Started {self.local_workers} local queue worker(s) on {self.queue.path}")
+
+    async def _spawn_local(self):
+        argv, cwd = self.command_factory()
+        for _ in range(self.local_workers):
+            self._processes.append(await asyncio.create_subprocess_exec(*argv, cwd=cwd, start_new_session=True))
+
+    async def _stop_local(self):
+        processes, self._processes = self._processes, []
+        for process in processes:
+            if process.returncode is None:
+                # The worker's SIGTERM handler also kills the job it is running
+                process.terminate()
+        for process in processes:
+            try:
+                await asyncio.wait_for(process.wait(), timeout=WORKER_KILL_GRACE)
+            except asyncio.TimeoutError:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except (ProcessLookupError, PermissionError):
+                    pass
+                await process.wait()
+
+    def recycle_all(self):
+        """Restart the local queue workers so they pick up a new deobfuscator command"""
+        async def restart():
+            await self._stop_local()
+            await self._spawn_local()
+            self.respawns += self.local_workers
+        self._restart = asyncio.get_running_loop().create_task(restart())
+
+    async def run(self, input_path, output_path, timeout=None, limits=None, origin=None):
+        """Queue one job and wait for a worker's result, raises like DeobfuscatorPool.run"""
+        timeout = timeout or self.job_timeout
+        job = {
+            'input': input_path,
+            'output': output_path,
+            'timeout': timeout,
+            'limits': limits or self.limits,
+        }
+        loop = asyncio.get_running_loop()
+        job_id = await loop.run_in_executor(None, self.queue.submit, job, origin)
+        result = loop.create_future()
+        self._pending[job_id] = result
+        finished = False
+        try:
+            response = await asyncio.wait_for(result, timeout=self.claim_timeout + timeout + 5)
+            finished = True
+        except asyncio.TimeoutError:
+            raise WorkerCrashed('No queue worker finished the job in time') from None
+        finally:
+            del self._pending[job_id]
+            # A worker still running a dropped job sees it cancelled, kills it and deletes the row
+            drop = self.queue.delete if finished else self.queue.cancel
+            await loop.run_in_executor(None, drop, job_id)
+        return check_job_response(response)
+
+    async def _poll(self):
+        """Hand finished results to waiting jobs, one query for all of them per tick"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(QUEUE_RESULT_POLL_INTERVAL)
+            if not self._pending:
+                continue
+            try:
+                results = await loop.run_in_executor(None, self.queue.results, list(self._pending))
+            except sqlite3.Error as e:
+                print(f"Error polling the job queue: {e}")
+                continue
+            for job_id, response in results.items():
+                future = self._pending.get(job_id)
+                if future is not None and not future.done():
+                    future.set_result(response)
+
+    async def close(self):
+        if self._poller is not None:
+            self._poller.cancel()
+        if self._restart is not None:
+            await asyncio.gather(self._restart, return_exceptions=True)
+        await self._stop_local()
+        self.queue.close()
+
+class QueueFull(Exception):
+    pass
+
+class UserJobLimit(QueueFull):
+    """The user already has as many jobs queued or running as allowed"""
+
+class JobTicket:
+    """A job's place in the scheduler, granted once a slot frees up"""
+
+    def __init__(self, user_id, priority=False):
+        self.user_id = user_id
+        self.priority = priority
+        # Whether the ticket had to wait in a lane, rather than being granted on submit
+        self.waited = False
+        self.granted = asyncio.get_running_loop().create_future()
+        self.enqueued_at = time.monotonic()
+        self.started_at = None
+
+class JobScheduler:
+    """Bounded concurrency plus a bounded fair-share wait queue for deobfuscation jobs
+
+    Waiting jobs are kept per user and granted round-robin across users, so
+    one user's pile of jobs doesn't hold everyone else back. Priority jobs
+    wait in their own lane, which gets up to ``priority_weight`` slots for
+    every one the normal lane gets while both have jobs waiting, so neither
+    lane can starve. Each user may have ``max_per_user`` jobs queued or
+    running at once, 0 means no cap.
+    """
+
+    def __init__(self, concurrency, max_queue, max_per_user=0, priority_weight=DEOBF_PRIORITY_WEIGHT):
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.max_per_user = max_per_user
+        self.priority_weight = priority_weight
+        self.running = 0
+        self.queued = 0
+        self.avg_runtime = float(DEOBF_TIMEOUT) / 3
+        # Per lane, each waiting user's tickets in submit order, users in turn order
+        self._lanes = {True: OrderedDict(), False: OrderedDict()}
+        self._priority_streak = 0
+        self._user_jobs = {}
+
+    @property
+    def full(self):
+        return self.running >= self.concurrency and self.queued >= self.max_queue
+
+    @property
+    def priority_queued(self):
+        return sum(len(tickets) for tickets in self._lanes[True].values())
+
+    def user_jobs(self, user_id):
+        """Jobs the user has queued or running"""
+        return self._user_jobs.get(user_id, 0)
+
+    def at_user_limit(self, user_id):
+        return bool(self.max_per_user) and user_id is not None and self.user_jobs(user_id) >= self.max_per_user
+
+    def submit(self, user_id=None, priority=False):
+        """Admit a job or raise QueueFull (UserJobLimit past the per-user cap), never blocks"""
+        if self.full:
+            raise QueueFull()
+        if self.at_user_limit(user_id):
+            raise UserJobLimit()
+        ticket = JobTicket(user_id, priority)
+        self._user_jobs[user_id] = self.user_jobs(user_id) + 1
+        if self.running < self.concurrency and not self.queued:
+            self._grant(ticket)
+        else:
+            self._lanes[priority].setdefault(user_id, deque()).append(ticket)
+            ticket.waited = True
+            self.queued += 1
+        return ticket
+
+    def _grant(self, ticket):
+        self.running += 1
+        ticket.started_at = time.monotonic()
+        ticket.granted.set_result(True)
+
+    def _pop_next(self, lanes, streak):
+        """Take the next ticket to grant out of lanes, returns (ticket, new priority streak)"""
+        priority = bool(lanes[True]) and (not lanes[False] or streak < self.priority_weight)
+        streak = streak + 1 if priority and lanes[False] else 0
+        lane = lanes[priority]
+        user_id, tickets = next(iter(lane.items()))
+        ticket = tickets.popleft()
+        if tickets:
+            lane.move_to_end(user_id)
+        else:
+            del lane[user_id]
+        return ticket, streak
+
+    def _grant_order(self):
+        """Waiting tickets in the order they would be granted if nothing else arrived"""
+        lanes = {
+            priority: OrderedDict((user_id, deque(tickets)) for user_id, tickets in lane.items())
+            for priority, lane in self._lanes.items()
+        }
+        streak = self._priority_streak
+        order = []
+        while lanes[True] or lanes[False]:
+            ticket, streak = self._pop_next(lanes, streak)
+            order.append(ticket)
+        return order
+
+    def _forget(self, ticket):
+        remaining = self.user_jobs(ticket.user_id) - 1
+        if remaining > 0:
+            self._user_jobs[ticket.user_id] = remaining
+        else:
+            self._user_jobs.pop(ticket.user_id, None)
+
+    def position(self, ticket):
+        """1-based place in the grant order, 0 once the job is running"""
+        if ticket.granted.done():
+            return 0
+        try:
+            return self._grant_order().index(ticket) + 1
+        except ValueError:
+            return 0
+
+    def estimated_wait(self, ticket):
+        position = self.position(ticket)
+        if position == 0:
+            return 0.0
+        return math.ceil(position / self.concurrency) * self.avg_runtime
+
+    async def wait(self, ticket, on_update=None):
+        """Wait for a slot, calling ``on_update(position, eta)`` whenever the position changes"""
+        reported = None
+        try:
+            while not ticket.granted.done():
+                position = self.position(ticket)
+                if on_update and position != reported:
+                    reported = position
+                    await on_update(position, self.estimated_wait(ticket))
+                try:
+                    await asyncio.wait_for(asyncio.shield(ticket.granted), QUEUE_UPDATE_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+            if on_update and reported:
+                await on_update(0, 0.0)
+        except BaseException:
+            self.release(ticket)
+            raise
+
+    def release(self, ticket):
+        """Free the ticket's slot (or queue place) and start the next waiting jobs"""
+        if not ticket.granted.done():
+            lane = self._lanes[ticket.priority]
+            tickets = lane.get(ticket.user_id)
+            if tickets and ticket in tickets:
+                tickets.remove(ticket)
+                if not tickets:
+                    del lane[ticket.user_id]
+                self.queued -= 1
+                self._forget(ticket)
+            ticket.granted.cancel()
+            return
+        if ticket.started_at is None:
+            return
+        runtime = time.monotonic() - ticket.started_at
+        ticket.started_at = None
+        self.avg_runtime = 0.8 * self.avg_runtime + 0.2 * runtime
+        self.running -= 1
+        self._forget(ticket)
+        while self.queued and self.running < self.concurrency:
+            next_ticket, self._priority_streak = self._pop_next(self._lanes, self._priority_streak)
+            self.queued -= 1
+            self._grant(next_ticket)
+
+job_scheduler = JobScheduler(DEOBF_CONCURRENCY, DEOBF_QUEUE_SIZE, DEOBF_USER_MAX_JOBS)
+
+def deobfuscator_worker_command():
+    """argv and cwd for a pool worker wrapping the resolved deobfuscator"""
+    return [sys.executable, WORKER_SCRIPT, '--cwd', deobfuscator.cwd, '--'] + deobfuscator.prefix, deobfuscator.cwd
+
+def queue_worker_command():
+    """argv and cwd for a local worker serving the shared job queue"""
+    argv, cwd = deobfuscator_worker_command()
+    return argv[:2] + ['--queue', DEOBF_QUEUE_DB] + argv[2:], cwd
+
+DEOBF_LIMITS = {
+    'cpu_seconds': DEOBF_CPU_LIMIT,
+    'memory_bytes': DEOBF_MEMORY_LIMIT_MB * 1024 * 1024,
+    'output_bytes': DEOBF_OUTPUT_LIMIT_MB * 1024 * 1024,
+}
+
+if DEOBF_QUEUE_DB:
+    deobf_pool = QueueBackend(
+        JobQueue(DEOBF_QUEUE_DB),
+        DEOBF_POOL_SIZE,
+        queue_worker_command,
+        job_timeout=DEOBF_TIMEOUT,
+        limits=DEOBF_LIMITS
+    )
+else:
+    deobf_pool = DeobfuscatorPool(
+        DEOBF_POOL_SIZE,
+        deobfuscator_worker_command,
+        job_timeout=DEOBF_TIMEOUT,
+        max_jobs_per_worker=DEOBF_MAX_JOBS_PER_WORKER,
+        limits=DEOBF_LIMITS
+    )
+
+# Matched against the lowercased head, plain substring checks keep each call in the microseconds
+MOONSEC_SIGNATURE = b'this file was protected with moonsec v3'
+# The V3 loader (`([[...]]):gsub('.+', ...)`, `return(function(...`) and its long runs of decimal escapes
+MOONSEC_STRUCTURE = [
+    re.compile(rb"\)\s*:\s*gsub\(\s*['\"]\.\+['\"]"),
+    re.compile(rb"return\s*\(\s*function\s*\("),
+    # Unrolled: a repeated group `(?:...){16}` is many times slower in re
+    re.compile(rb"\\\d{1,3}" * 16),
+]
+OTHER_OBFUSCATORS = {
+    b'luraph': 'Luraph',
+    b'ironbrew': 'IronBrew',
+    b'psu|': 'PSU',
+    b'prometheus': 'Prometheus',
+    b'wearedevs': 'WeAreDevs',
+    b'boronide': 'Boronide',
+    b'luarmor': 'Luarmor',
+    b'moonsec v2': 'MoonSec V2',
+    b'moonsec v1': 'MoonSec V1',
+}
+# Readable source: many short lines, where V3 output is one long minified line
+PLAIN_SOURCE_MIN_LINES = 40
+PLAIN_SOURCE_MAX_LINE_LENGTH = 120
+
+PREFLIGHT_REASONS = {
+    'empty': "the file is empty",
+    'binary': "it is a binary or compiled Lua file, not a script",
+    'html': "it is a web page, not a script (check that the URL points to the raw file)",
+    'not_lua': "it is not a Lua script",
+    'no_signature': "it has no MoonSec V3 watermark and is too small to be MoonSec V3 output",
+    'plain_source': "it looks like plain, non-obfuscated Lua",
+}
+
+def preflight_check(path):
+    """Classify an input by its first PREFLIGHT_BYTES, returns (accepted, reason, message)
+
+    Deliberately conservative: only inputs that clearly are not Moonsec V3
+    are rejected, anything uncertain still goes to the deobfuscator.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(PREFLIGHT_BYTES)
+        complete = not f.read(1)
+    
+    lowered = head.lower()
+    if MOONSEC_SIGNATURE in lowered:
+        return True, 'signature', None
+    stripped = head.lstrip(b'\xef\xbb\xbf \t\r\n')
+    if not stripped:
+        return False, 'empty', PREFLIGHT_REASONS['empty']
+    if stripped.startswith(b'\x1bLua') or b'\x00' in head:
+        return False, 'binary', PREFLIGHT_REASONS['binary']
+    if stripped[:1] == b'<':
+        if stripped[:9].lower().startswith((b'<!doctype', b'<html', b'<head', b'<?xml')):
+            return False, 'html', PREFLIGHT_REASONS['html']
+        return False, 'not_lua', PREFLIGHT_REASONS['not_lua']
+    if stripped[:1] == b'{' and re.match(rb'\{\s*"[^"\n]*"\s*:', stripped):
+        return False, 'not_lua', PREFLIGHT_REASONS['not_lua']
+    for marker, name in OTHER_OBFUSCATORS.items():
+        if marker in lowered:
+            return False, 'other_obfuscator', f"it was obfuscated with {name}, not MoonSec V3"
+    if any(pattern.search(head) for pattern in MOONSEC_STRUCTURE):
+        return True, 'structure', None
+    if complete:
+        # V3 output embeds its whole VM, so it never fits in the pre-flight window
+        return False, 'no_signature', PREFLIGHT_REASONS['no_signature']
+    lines = head.count(b'\n')
+    if lines >= PLAIN_SOURCE_MIN_LINES and len(head) / lines < PLAIN_SOURCE_MAX_LINE_LENGTH:
+        return False, 'plain_source', PREFLIGHT_REASONS['plain_source']
+    return True, 'unknown', None
+
+def preflight_embed(ctx, message):
+    embed = discord.Embed(
+        title="❌ Deobfuscation Failed",
+        description=f"⚠️ **Only Moonsec V3 supported**\n\nThis file was not sent to the deobfuscator because {message}. No tokens were charged.",
+        color=0xFF0000
+    )
+    embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')}")
+    return embed
+
+def insufficient_tokens_embed(ctx):
+    embed = discord.Embed(
+        title="❌ Deobfuscation Failed",
+        description="⚠️ **Insufficient Tokens**\n\nYou don't have enough tokens to use this command.\n\nUse `.creds` to check your token balance.",
+        color=0xFF0000
+    )
+    embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')}")
+    return embed
+
+DeobfResult = namedtuple(
+    'DeobfResult',
+    ['outcome', 'output_size', 'links', 'processing_time', 'cache_hit', 'limit', 'coalesced', 'priority_lane'],
+    defaults=(0, (), 0.0, False, None, False, False)
+)
+
+async def run_deobfuscation(input_path, output_path, user_id=None, on_queue_update=None, origin=None, trace=None, priority=False):
+    """Deobfuscate one saved input through the result cache and the worker pool"""
+    loop = asyncio.get_running_loop()
+    trace = trace or JobTrace('pipeline', user_id)
+    with trace.span('hash'):
+        cache_key = result_key(await loop.run_in_executor(None, hash_file, input_path))
+    with trace.span('cache_lookup'):
+        found_links = await loop.run_in_executor(None, result_cache.restore, cache_key, output_path)
+    
+    if found_links is not None:
+        result = DeobfResult('success', os.path.getsize(output_path), found_links, cache_hit=True)
+    else:
+        # Identical inputs submitted while this one runs wait for it instead of starting their own run
+        result, coalesced = await deobf_flights.run(
+            cache_key, output_path,
+            lambda: deobfuscate_uncached(cache_key, input_path, output_path, user_id, on_queue_update, origin, trace, priority),
+            lambda result: result.outcome == 'success',
+            trace
+        )
+        if coalesced:
+            # The leader's run did the waiting, this job never queued in any lane
+            trace.fields['coalesced'] = True
+            result = result._replace(coalesced=True, priority_lane=False)
+    if result.outcome == 'success':
+        OUTPUT_SIZE.observe(result.output_size)
+    return result
+
+async def deobfuscate_uncached(cache_key, input_path, output_path, user_id, on_queue_update, origin, trace, priority):
+    """Run an input through the scheduler and worker pool, then scan and cache the output"""
+    loop = asyncio.get_running_loop()
+    try:
+        ticket = job_scheduler.submit(user_id, priority)
+    except UserJobLimit:
+        return DeobfResult('user_limit')
+    except QueueFull:
+        return DeobfResult('rejected')
+    with trace.span('queue_wait'):
+        await job_scheduler.wait(ticket, on_update=on_queue_update)
+    start_time = time.monotonic()
+    try:
+        with DEOBF_RUNTIME.time(), trace.span('deobfuscate'):
+            await deobf_pool.run(input_path, output_path, origin=origin)
+    except asyncio.TimeoutError:
+        return DeobfResult('timeout')
+    except JobLimitExceeded as e:
+        return DeobfResult('resource_limit', limit=e.limit)
+    finally:
+        job_scheduler.release(ticket)
+    processing_time = time.monotonic() - start_time
+    
+    try:
+        output_size = os.path.getsize(output_path)
+    except OSError:
+        output_size = 0
+    if output_size <= 1:
+        return DeobfResult('unsupported', processing_time=processing_time)
+    
+    with trace.span('read_output'):
+        with open(output_path, 'r', encoding='utf-8', errors='ignore') as f:
+            output_content = f.read()
+    with trace.span('extract_links'):
+        if len(output_content) > LINK_SCAN_OFFLOAD_CHARS:
+            found_links = await loop.run_in_executor(None, extract_links, output_content)
+        else:
+            found_links = extract_links(output_content)
+    with trace.span('cache_store'):
+        await loop.run_in_executor(None, result_cache.put, cache_key, output_path, found_links)
+    return DeobfResult('success', output_size, found_links, processing_time, priority_lane=ticket.priority and ticket.waited)
+
+def message_origin(message):
+    """Where a queued job's result goes, kept with the job so a restarted bot can find it"""
+    return json.dumps({'channel_id': message.channel.id, 'message_id': message.id})
+
+async def notify_orphaned_jobs():
+    """Tell users whose queued jobs were lost in a restart to resend them"""
+    origins = list(dict.fromkeys(getattr(deobf_pool, 'orphans', [])))
+    if not origins:
+        return
+    deobf_pool.orphans = []
+    print(f"Notifying {len(origins)} message(s) about jobs lost in a restart")
+    for origin in origins:
+        try:
+            origin = json.loads(origin)
+            channel = bot.get_channel(origin['channel_id']) or await bot.fetch_channel(origin['channel_id'])
+            message = await channel.fetch_message(origin['message_id'])
+            await message.reply('⚠️ The bot restarted while your file was being deobfuscated. No tokens were charged - please run the command again.')
+        except Exception as e:
+            print(f"Could not notify {origin}: {e}")
+
+def is_script_filename(filename):
+    return filename.lower().endswith(SCRIPT_EXTENSIONS)
+
+def url_filename(url, default='script.lua'):
+    filename = os.path.basename(urlparse(url).path)
+    if not filename or not (is_script_filename(filename) or filename.lower().endswith('.zip')):
+        return default
+    return filename
+
+def extract_zip_scripts(zip_path, dest_dir, max_files):
+    """Unpack the .lua/.txt members of a zip into temp files, returns ([(name, path)], skipped names)"""
+    scripts = []
+    skipped = []
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            name = os.path.basename(info.filename)
+            if info.is_dir() or not name or info.filename.startswith('__MACOSX/'):
+                continue
+            if not is_script_filename(name) or len(scripts) >= max_files or info.file_size > MAX_FILE_SIZE:
+                skipped.append(name)
+                continue
+            with archive.open(info) as src:
+                # The header size can lie, so cap what is actually inflated
+                data = src.read(MAX_FILE_SIZE + 1)
+            if len(data) > MAX_FILE_SIZE:
+                skipped.append(name)
+                continue
+            fd, path = tempfile.mkstemp(suffix=os.path.splitext(name)[1], dir=dest_dir)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            scripts.append((name, path))
+    return scripts, skipped
+
+def write_result_zip(zip_path, entries):
+    """Pack (arcname, path) pairs into one zip, renaming duplicate arcnames"""
+    seen = set()
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for arcname, path in entries:
+            stem, ext = os.path.splitext(arcname)
+            unique = arcname
+            for n in itertools.count(2):
+                if unique.lower() not in seen:
+                    break
+                unique = f'{stem}_{n}{ext}'
+            seen.add(unique.lower())
+            archive.write(path, unique)
+    return os.path.getsize(zip_path)
 
-async def download_file_from_url(url):
-    """Download file content from URL"""
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    # Check file size (5MB limit)
-                    if len(content) > 5 * 1024 * 1024:
-                        return None, "File too large! Maximum size is 5MB."
-                    return content, None
-                else:
-                    return None, f"Failed to download file. HTTP Status: {response.status}"
-    except asyncio.TimeoutError:
-        return None, "Download timed out. Please try again."
-    except Exception as e:
-        return None, f"Error downloading file: {str(e)}"
+def compress_file(src_path, dest_path, arcname, fmt=DEOBF_COMPRESS_FORMAT):
+    """Stream src_path into a zip or gzip at dest_path, returns the compressed size"""
+    if fmt == 'gzip':
+        with open(src_path, 'rb') as src, gzip.open(dest_path, 'wb', compresslevel=6) as dest:
+            shutil.copyfileobj(src, dest, DOWNLOAD_CHUNK_SIZE)
+    else:
+        with zipfile.ZipFile(dest_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+            archive.write(src_path, arcname)
+    return os.path.getsize(dest_path)
+
+def record_upload(size, seconds):
+    """Fold one upload into the moving average used to estimate upload time"""
+    global upload_bytes_per_second
+    if size >= 256 * 1024 and seconds > 0:
+        upload_bytes_per_second = 0.8 * upload_bytes_per_second + 0.2 * (size / seconds)
+
+class BatchFile:
+    """One script of a batch request and what happened to it"""
+
+    def __init__(self, name, input_path=None, outcome=None, detail=None):
+        self.name = name
+        self.input_path = input_path
+        self.output_path = None
+        self.outcome = outcome
+        self.detail = detail
+        self.result = None
+
+BATCH_OUTCOME_TEXT = {
+    'rejected': 'queue full',
+    'user_limit': 'too many of your jobs queued',
+    'timeout': 'timed out',
+    'resource_limit': 'hit a resource limit',
+    'unsupported': 'not Moonsec V3',
+    'insufficient_tokens': 'not enough tokens',
+    'error': 'internal error',
+}
+
+METRICS = [
+    DEOBF_REQUESTS,
+    DEOBF_RUNTIME,
+    DOWNLOAD_TIME,
+    INPUT_SIZE,
+    OUTPUT_SIZE,
+    LEDGER_LATENCY,
+    EVENT_LOOP_LAG,
+    STAGE_TIME,
+    Gauge('deobf_jobs_running', 'Deobfuscation jobs holding a worker slot', lambda: job_scheduler.running),
+    Gauge('deobf_jobs_queued', 'Deobfuscation jobs waiting for a worker slot', lambda: job_scheduler.queued),
+    Gauge('deobf_jobs_queued_priority', 'Deobfuscation jobs waiting in the priority lane', lambda: job_scheduler.priority_queued),
+    Gauge('deobf_worker_respawns', 'Pool workers replaced since startup', lambda: deobf_pool.respawns),
+    COALESCED,
+    Gauge('deobf_flights', 'Distinct deobfuscation jobs in flight after coalescing', lambda: deobf_flights.in_flight),
+    Gauge('result_cache_hits', 'Result cache hits since startup', lambda: result_cache.hits),
+    Gauge('result_cache_misses', 'Result cache misses since startup', lambda: result_cache.misses),
+    Gauge('result_cache_bytes', 'Bytes stored in the result cache', lambda: result_cache.total_bytes),
+    Gauge('event_loop_lag_last_seconds', 'Most recent event loop lag sample', lambda: event_loop_lag),
+]
+
+def render_metrics():
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
 
 def check_server_restriction():
     """Check if command is used in allowed server"""
@@ -264,12 +2175,15 @@ def check_server_restriction():
         return True
     return commands.check(predicate)
 
+def is_admin(member):
+    return any(role.id == ADMIN_ROLE_ID for role in getattr(member, 'roles', []))
+
 def check_admin_role():
     """Check if user has the admin role"""
     async def predicate(ctx):
         if ctx.guild is None:
             return False
-        has_role = any(role.id == ADMIN_ROLE_ID for role in ctx.author.roles)
+        has_role = is_admin(ctx.author)
         if not has_role:
             await ctx.reply('❌ You do not have permission to use this command!')
         return has_role
@@ -277,9 +2191,24 @@ def check_admin_role():
 
 @bot.event
 async def on_ready():
+    global gateway_connected
+    gateway_connected = True
     print(f'Logged in as {bot.user} (ID: {bot.user.id})')
     print(f'Token system enabled: {is_token_system_enabled()}')
     print('Bot is ready!')
+    await notify_orphaned_jobs()
+
+@bot.event
+async def on_disconnect():
+    global gateway_connected
+    gateway_connected = False
+    print('Disconnected from the Discord gateway')
+
+@bot.event
+async def on_resumed():
+    global gateway_connected
+    gateway_connected = True
+    print('Resumed the Discord gateway session')
 
 @bot.command()
 @check_server_restriction()
@@ -292,7 +2221,8 @@ async def help(ctx):
     )
     embed.add_field(
         name="`.deobf`",
-        value="Deobfuscate a Moonsec V3 obfuscated Lua file\n**Usage:** \n• `.deobf` (attach a .lua or .txt file)\n• `.deobf <url>` (provide a direct link to the file)",
+        value="Deobfuscate a Moonsec V3 obfuscated Lua file\n**Usage:** \n• `.deobf` (attach a .lua or .txt file)\n• `.deobf <url>` (provide a direct link to the file)\n• `.deobf <url> <url> ...` or several files/a .zip for a batch (one zip back)" +
+              (f"\n• `.deobf priority ...` skips ahead in the queue for {DEOBF_PRIORITY_COST} extra token(s)" if DEOBF_PRIORITY_COST else ""),
         inline=False
     )
     
@@ -351,17 +2281,12 @@ async def gift(ctx, user_id: int = None, amount: int = None):
         return
     
     gifter_id = ctx.author.id
-    gifter_tokens = get_user_tokens(gifter_id)
+    success, gifter_tokens = transfer_tokens(gifter_id, user_id, amount)
     
-    if gifter_tokens < amount:
+    if not success:
         await ctx.reply(f'❌ You don\'t have enough tokens! You only have {gifter_tokens} token(s).')
         return
     
-    for _ in range(amount):
-        use_token(gifter_id)
-    
-    add_tokens(user_id, amount)
-    
     embed = discord.Embed(
         title="🎁 Gift Sent!",
         description=f"Successfully gifted **{amount} token(s)** to <@{user_id}>!",
@@ -421,29 +2346,177 @@ async def token(ctx, status: str = None):
 
 @bot.command()
 @check_server_restriction()
-async def deobf(ctx, url: str = None):
+@check_admin_role()
+async def rescan(ctx):
+    """Re-resolve the deobfuscator executable (Admin only)"""
+    try:
+        resolved = await asyncio.get_event_loop().run_in_executor(None, load_deobfuscator)
+    except DeobfuscatorNotFound as e:
+        await ctx.reply(f'❌ {e}\nStill using the previously resolved deobfuscator.')
+        return
+    # Back on the event loop: workers pick up the new command once their current job is done
+    deobf_pool.recycle_all()
+    
+    embed = discord.Embed(
+        title="🔍 Deobfuscator Resolved",
+        description=f"**Source:** {resolved.source}\n**Command:** `{' '.join(resolved.prefix)}`",
+        color=0x00FF00
+    )
+    await ctx.reply(embed=embed)
+
+@bot.command()
+@check_server_restriction()
+@check_admin_role()
+async def profile(ctx, arg: str = None, state: str = None):
+    """Profile the next N jobs, or toggle the stage breakdown in result embeds (Admin only)"""
+    if arg == 'stages' and state in ('on', 'off'):
+        settings.set('stage_breakdown', state == 'on')
+        await ctx.reply(f"✅ Stage timings in result embeds are now **{state}** for admins.")
+        return
+    if arg is None or not arg.isdigit():
+        await ctx.reply(
+            f"❌ Usage: `.profile <jobs>` or `.profile stages on|off`\n"
+            f"{job_profiler.remaining} job(s) left to profile, dumps go to `{DEOBF_PROFILE_DIR}`."
+        )
+        return
+    job_profiler.arm(int(arg))
+    await ctx.reply(f"✅ The next {int(arg)} job(s) will be profiled with cProfile and tracemalloc. Dumps go to `{DEOBF_PROFILE_DIR}`.")
+    print(f"Profiling armed for {arg} job(s) by {ctx.author} ({ctx.author.id})")
+
+@bot.command()
+@check_server_restriction()
+@check_admin_role()
+async def apikey(ctx, action: str = None, user_id: int = None):
+    """Issue or revoke a user's HTTP API key (Admin only)"""
+    if action not in ('create', 'revoke') or user_id is None:
+        await ctx.reply('❌ Usage: `.apikey create <user_id>` or `.apikey revoke <user_id>`\nThe key is sent to you by DM.')
+        return
+    
+    if action == 'revoke':
+        revoked = ledger.revoke_api_keys(user_id)
+        await ctx.reply(f'✅ Revoked {revoked} API key(s) for <@{user_id}>.' if revoked else f'⚠️ <@{user_id}> has no API key.')
+        return
+    
+    key = ledger.create_api_key(user_id)
+    try:
+        await ctx.author.send(
+            f"🔑 API key for <@{user_id}> (replaces any previous key):\n`{key}`\n"
+            f"Send it as `Authorization: Bearer <key>` to `POST /api/deobf`."
+        )
+    except discord.HTTPException:
+        ledger.revoke_api_keys(user_id)
+        await ctx.reply('❌ Could not DM you the key, so it was revoked. Enable DMs from server members and try again.')
+        return
+    await ctx.reply(f'✅ Sent a new API key for <@{user_id}> by DM. Jobs run with it use their tokens.')
+    print(f"API key issued for {user_id} by {ctx.author} ({ctx.author.id})")
+
+@bot.command()
+@check_server_restriction()
+@check_admin_role()
+async def stats(ctx):
+    """Show queue depth, throughput, runtimes and failures of recent jobs (Admin only)"""
+    embed = discord.Embed(title="📈 Deobfuscation Stats", color=0x5865F2)
+    embed.add_field(
+        name="🚦 Queue",
+        value=(f"**Running:** {job_scheduler.running}/{job_scheduler.concurrency}\n"
+               f"**Queued:** {job_scheduler.queued}/{job_scheduler.max_queue} ({job_scheduler.priority_queued} priority)\n"
+               f"**Jobs In Flight:** {len(job_history.active)} ({deobf_flights.in_flight} distinct runs)"),
+        inline=True
+    )
+    throughput_lines = []
+    for minutes in (1, 5, 60):
+        jobs, successes = job_history.throughput(minutes)
+        throughput_lines.append(f"**{minutes}m:** {jobs} jobs, {successes} ok ({jobs / minutes:.1f}/min)")
+    embed.add_field(name="⚡ Throughput", value='\n'.join(throughput_lines), inline=True)
+    
+    history = job_history.records
+    embed.add_field(
+        name=f"⏱️ Last {len(history)} Jobs",
+        value=(f"**Job Time:** p50 {format_duration(job_history.job_time.percentile(50))} | "
+               f"p95 {format_duration(job_history.job_time.percentile(95))}\n"
+               f"**Worker Time:** p50 {format_duration(job_history.worker_time.percentile(50))} | "
+               f"p95 {format_duration(job_history.worker_time.percentile(95))}\n"
+               f"**Cache Hits:** {job_history.cache_hits} | **Shared Runs:** {job_history.coalesced}"),
+        inline=False
+    )
+    failures = job_history.top_failures()
+    embed.add_field(
+        name="❌ Top Failures",
+        value='\n'.join(f"`{outcome}` x{count}" for outcome, count in failures) or 'None',
+        inline=False
+    )
+    embed.set_footer(text=f"Worker respawns: {deobf_pool.respawns} • Use .jobs for individual jobs")
+    await ctx.reply(embed=embed)
+
+@bot.command()
+@check_server_restriction()
+@check_admin_role()
+async def jobs(ctx, count: int = 10):
+    """List running jobs and the most recent finished ones (Admin only)"""
+    count = max(1, min(count, 25))
+    now = time.perf_counter()
+    running_lines = [
+        f"`{trace.id}` {trace.fields['kind']} <@{trace.fields['user_id']}> - "
+        f"{trace.stage or 'starting'}, {format_duration(now - trace.started)}"
+        for trace in job_history.active.values()
+    ]
+    recent_lines = []
+    for record in list(job_history.records)[-count:][::-1]:
+        mark = '✅' if record.outcome == 'success' else '❌'
+        notes = ', cached' if record.cache_hit else ', shared' if record.coalesced else ''
+        recent_lines.append(
+            f"{mark} `{record.id}` {record.kind} <@{record.user_id}> {record.outcome} - "
+            f"{record.input_bytes / 1024:.1f} KB, {format_duration(record.seconds)}{notes} "
+            f"<t:{int(record.finished)}:R>"
+        )
+    embed = discord.Embed(title="🗂️ Deobfuscation Jobs", color=0x5865F2)
+    embed.add_field(name=f"🔄 In Flight ({len(running_lines)})", value=fit_lines(running_lines), inline=False)
+    embed.add_field(name=f"🕘 Last {len(recent_lines)} Finished", value=fit_lines(recent_lines), inline=False)
+    await ctx.reply(embed=embed)
+
+@bot.command()
+@check_server_restriction()
+async def deobf(ctx, *urls: str):
     """
     Usage: .deobf (attach a .lua/.txt file) OR .deobf <url>
+    Several files, several URLs or a .zip are deobfuscated as one batch.
+    `.deobf priority ...` jumps the queue for DEOBF_PRIORITY_COST extra tokens.
     Deobfuscates a Moonsec Lua obfuscated file and returns the result.
     """
+    attachments = ctx.message.attachments
     user_id = ctx.author.id
     token_system_active = is_token_system_enabled()
     
-    if token_system_active:
-        tokens = get_user_tokens(user_id)
-        
-        if tokens < COST_PER_USE:
-            embed = discord.Embed(
-                title="❌ Deobfuscation Failed",
-                description="⚠️ **Insufficient Tokens**\n\nYou don't have enough tokens to use this command.\n\nUse `.creds` to check your token balance.",
-                color=0xFF0000
-            )
-            embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')}")
-            await ctx.reply(embed=embed)
-            return
+    # Admins always get the priority lane, everyone else can buy it when it is offered
+    paid_priority = False
+    if urls and urls[0].lower() == 'priority':
+        urls = urls[1:]
+        if not is_admin(ctx.author):
+            if not (DEOBF_PRIORITY_COST and token_system_active):
+                await ctx.reply('❌ The priority lane is not available right now.')
+                return
+            paid_priority = True
+    priority = paid_priority or is_admin(ctx.author)
+    # The balance must cover the surcharge, but it is only charged if the job had to wait in the priority lane
+    cost = COST_PER_USE + (DEOBF_PRIORITY_COST if paid_priority else 0)
+    
+    if len(urls) + len(attachments) > 1 or any(a.filename.lower().endswith('.zip') for a in attachments) \
+            or any(url_filename(u).lower().endswith('.zip') for u in urls):
+        await deobf_batch(ctx, urls, attachments, priority, paid_priority)
+        return
+    url = urls[0] if urls else None
+    trace = JobTrace('deobf', user_id, source='url' if url else 'attachment', priority=priority)
+    
+    if job_scheduler.full:
+        DEOBF_REQUESTS.inc(outcome='rejected')
+        await ctx.reply(QUEUE_FULL_MESSAGE)
+        return
+    if job_scheduler.at_user_limit(user_id):
+        DEOBF_REQUESTS.inc(outcome='user_limit')
+        await ctx.reply(USER_LIMIT_MESSAGE)
+        return
     
     # Check if URL is provided
-    file_content = None
     filename = None
     original_size = 0
     from_url = False
@@ -456,19 +2529,9 @@ async def deobf(ctx, url: str = None):
         
         loading_msg = await ctx.reply("<a:Loading:1447156037885886525> Deobfuscating...")
         
-        # Download file from URL
-        file_content, error = await download_file_from_url(url)
-        if error:
-            await loading_msg.edit(content=f'❌ {error}')
-            return
-        
         # Extract filename from URL
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
-        if not filename or not (filename.endswith('.lua') or filename.endswith('.txt')):
-            filename = 'script.lua'
+        filename = url_filename(url)
         
-        original_size = len(file_content)
         from_url = True
         
     elif ctx.message.attachments:
@@ -479,7 +2542,7 @@ async def deobf(ctx, url: str = None):
             await ctx.reply('❌ Only .lua and .txt files are supported!')
             return
 
-        if attachment.size > 5 * 1024 * 1024:
+        if attachment.size > MAX_FILE_SIZE:
             await ctx.reply('❌ File too large! Maximum size is 5MB.')
             return
         
@@ -494,148 +2557,140 @@ async def deobf(ctx, url: str = None):
         return
     
     file_ext = '.lua' if filename.endswith('.lua') else '.txt'
-    input_fd, input_path = tempfile.mkstemp(suffix=file_ext)
-    output_fd, output_path = tempfile.mkstemp(suffix='_deobf.lua')
+    input_fd, input_path = tempfile.mkstemp(suffix=file_ext, dir=DEOBF_WORK_DIR)
+    output_fd, output_path = tempfile.mkstemp(suffix='_deobf.lua', dir=DEOBF_WORK_DIR)
     os.close(input_fd)
     os.close(output_fd)
     
-    # Only schedule cleanup for URL downloads (2 minutes)
-    if from_url:
-        schedule_file_cleanup(input_path, delay_seconds=120)
-        schedule_file_cleanup(output_path, delay_seconds=120)
-    
+    outcome = 'error'
+    result = None
+    trace.begin()
     try:
         # Save file content to temp file
-        if file_content:
-            # From URL
-            with open(input_path, 'wb') as f:
-                f.write(file_content)
+        if from_url:
+            # Download file from URL straight into the input file
+            with DOWNLOAD_TIME.time(), trace.span('download'):
+                original_size, error = await fetch_url(url, input_path)
+            if error:
+                outcome = 'download_error'
+                await loading_msg.edit(content=f'❌ {error}')
+                return
         else:
             # From attachment
-            await ctx.message.attachments[0].save(input_path)
-        
-        project_dir = os.path.dirname(os.path.abspath(__file__))
-        bin_dir = os.path.join(project_dir, 'bin')
+            with trace.span('save_attachment'):
+                await ctx.message.attachments[0].save(input_path)
+        INPUT_SIZE.observe(original_size)
         
-        deobf_exe = None
-        
-        if os.path.exists(bin_dir):
-            for root, dirs, files in os.walk(bin_dir):
-                for file in files:
-                    if file == 'MoonsecDeobfuscator' or file == 'MoonsecDeobfuscator.exe':
-                        deobf_exe = os.path.join(root, file)
-                        break
-                if deobf_exe:
-                    break
-        
-        if not deobf_exe:
-            src_dir = os.path.join(project_dir, 'src')
-            possible_paths = [
-                os.path.join(project_dir, 'MoonsecDeobfuscator'),
-                os.path.join(project_dir, 'MoonsecDeobfuscator.exe'),
-                os.path.join(src_dir, 'bin', 'Release', 'net9.0', 'MoonsecDeobfuscator'),
-                os.path.join(src_dir, 'bin', 'Release', 'net9.0', 'MoonsecDeobfuscator.exe'),
-                os.path.join(src_dir, 'bin', 'Release', 'net8.0', 'MoonsecDeobfuscator'),
-                os.path.join(src_dir, 'bin', 'Release', 'net8.0', 'MoonsecDeobfuscator.exe'),
-            ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    deobf_exe = path
-                    break
+        # Non-Moonsec inputs are turned away before the token check and before any worker runs
+        if DEOBF_PREFLIGHT:
+            with trace.span('preflight'):
+                accepted, reason, message = preflight_check(input_path)
+            trace.fields['preflight'] = reason
+            if not accepted:
+                outcome = 'preflight_rejected'
+                await loading_msg.edit(embed=preflight_embed(ctx, message), content=None)
+                return
         
-        if not deobf_exe:
-            src_dir = os.path.join(project_dir, 'src')
-            csproj_path = None
-            if os.path.exists(src_dir):
-                for root, dirs, files in os.walk(src_dir):
-                    for file in files:
-                        if file.endswith('.csproj') and 'Moonsec' in file:
-                            csproj_path = os.path.join(root, file)
-                            break
-                    if csproj_path:
-                        break
-            
-            if csproj_path:
-                deobf_exe = 'dotnet'
+        if token_system_active:
+            with trace.span('ledger'):
+                tokens = get_user_tokens(user_id)
+            if tokens < cost:
+                outcome = 'insufficient_tokens'
+                await loading_msg.edit(embed=insufficient_tokens_embed(ctx), content=None)
+                return
         
-        if not deobf_exe:
+        if deobfuscator is None:
             await ctx.reply('❌ Moonsec deobfuscator executable not found. Please ensure the project is built.')
             return
         
-        if deobf_exe == 'dotnet':
-            csproj_path = None
-            src_dir = os.path.join(project_dir, 'src')
-            if os.path.exists(src_dir):
-                for root, dirs, files in os.walk(src_dir):
-                    for file in files:
-                        if file.endswith('.csproj') and 'Moonsec' in file:
-                            csproj_path = os.path.join(root, file)
-                            break
-                    if csproj_path:
-                        break
-            if csproj_path:
-                cmd = [
-                    'dotnet', 'run', '--project', csproj_path, '--',
-                    '-dev',
-                    '-i', input_path,
-                    '-o', output_path
-                ]
+        async def show_queue_position(position, eta):
+            if position:
+                await loading_msg.edit(content=f"<a:Loading:1447156037885886525> Queued - position **#{position}**, estimated wait ~{eta:.0f}s")
             else:
-                await ctx.reply('❌ Could not find MoonsecDeobfuscator project file.')
-                return
-        else:
-            cmd = [
-                deobf_exe,
-                '-dev',
-                '-i', input_path,
-                '-o', output_path
-            ]
-        
-        def run_deobfuscator():
-            return subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=90,
-                cwd=os.path.dirname(deobf_exe) if deobf_exe != 'dotnet' and os.path.dirname(deobf_exe) else project_dir
-            )
+                await loading_msg.edit(content="<a:Loading:1447156037885886525> Deobfuscating...")
         
-        start_time = datetime.now()
-        try:
-            result = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(None, run_deobfuscator),
-                timeout=95
+        result = await run_deobfuscation(
+            input_path, output_path, user_id,
+            on_queue_update=show_queue_position,
+            origin=message_origin(ctx.message),
+            trace=trace,
+            priority=priority
+        )
+        
+        if result.outcome == 'rejected':
+            outcome = 'rejected'
+            await loading_msg.edit(content=QUEUE_FULL_MESSAGE)
+            return
+        if result.outcome == 'user_limit':
+            outcome = 'user_limit'
+            await loading_msg.edit(content=USER_LIMIT_MESSAGE)
+            return
+        if result.outcome == 'timeout':
+            outcome = 'timeout'
+            embed = discord.Embed(
+                title="❌ Deobfuscation Failed",
+                description=f"⚠️ **Timeout**\n\nDeobfuscation timed out after {DEOBF_TIMEOUT} seconds. The file may be too complex or have infinite loops.",
+                color=0xFF0000
             )
-        except asyncio.TimeoutError:
+            embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')}")
+            await loading_msg.edit(embed=embed, content=None)
+            return
+        if result.outcome == 'resource_limit':
+            outcome = 'resource_limit'
+            reason = "used too much CPU time" if result.limit == 'cpu_limit' else "produced too much output"
             embed = discord.Embed(
                 title="❌ Deobfuscation Failed",
-                description="⚠️ **Timeout**\n\nDeobfuscation timed out after 90 seconds. The file may be too complex or have infinite loops.",
+                description=f"⚠️ **Resource Limit**\n\nThe deobfuscator {reason} and was stopped. The file may be too complex or have infinite loops.",
                 color=0xFF0000
             )
             embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')}")
             await loading_msg.edit(embed=embed, content=None)
             return
         
-        processing_time = (datetime.now() - start_time).total_seconds()
+        output_size = result.output_size
+        processing_time = result.processing_time
+        cache_hit = result.cache_hit
+        found_links = result.links
         
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 1:
-            if token_system_active:
-                use_token(user_id)
-                remaining_tokens = get_user_tokens(user_id)
-            else:
-                remaining_tokens = get_user_tokens(user_id)
-            
-            with open(output_path, 'r', encoding='utf-8', errors='ignore') as f:
-                output_content = f.read()
-            
-            found_links = extract_links(output_content)
-            
-            output_size = os.path.getsize(output_path)
+        if result.outcome == 'success':
+            delivery_path = output_path
+            delivery_name = f"deobf_{filename}"
+            compression_text = None
+            if output_size > DEOBF_COMPRESS_MIN_KB * 1024 or output_size > DISCORD_UPLOAD_LIMIT:
+                extension = '.gz' if DEOBF_COMPRESS_FORMAT == 'gzip' else '.zip'
+                compressed_path = output_path + extension
+                compress_start = time.monotonic()
+                with trace.span('compress'):
+                    compressed_size = await asyncio.get_running_loop().run_in_executor(
+                        None, compress_file, output_path, compressed_path, delivery_name
+                    )
+                compress_time = time.monotonic() - compress_start
+                if compressed_size < output_size * (1 - COMPRESS_MIN_SAVING) or output_size > DISCORD_UPLOAD_LIMIT:
+                    delivery_path = compressed_path
+                    delivery_name += extension
+                    if output_size > DISCORD_UPLOAD_LIMIT:
+                        saved_text = "sent instead of rejected"
+                    else:
+                        saved = (output_size - compressed_size) / upload_bytes_per_second - compress_time
+                        saved_text = f"~{max(saved, 0):.1f}s upload saved"
+                    compression_text = (f"**Compressed:** {compressed_size / 1024:.2f} KB "
+                                        f"({output_size / max(compressed_size, 1):.1f}x, {saved_text})\n")
             
-            if output_size > 25 * 1024 * 1024:
-                await ctx.reply(f'❌ Deobfuscated file is too large ({output_size / 1024 / 1024:.1f}MB). Discord limit is 25MB.')
+            delivery_size = os.path.getsize(delivery_path)
+            if delivery_size > DISCORD_UPLOAD_LIMIT:
+                outcome = 'too_large'
+                await ctx.reply(f'❌ Deobfuscated file is too large ({delivery_size / 1024 / 1024:.1f}MB even compressed). Discord limit is 25MB. No tokens were charged.')
                 return
             
+            priority_charged = paid_priority and result.priority_lane
+            with trace.span('ledger'):
+                # The debit is the real check: other jobs of this user may have spent the balance meanwhile
+                if token_system_active and not use_token(user_id, COST_PER_USE + (DEOBF_PRIORITY_COST if priority_charged else 0)):
+                    outcome = 'insufficient_tokens'
+                    await loading_msg.edit(embed=insufficient_tokens_embed(ctx), content=None)
+                    return
+                remaining_tokens = get_user_tokens(user_id)
+            
             embed = discord.Embed(
                 title="✅ Deobfuscation Complete",
                 description=f"Successfully deobfuscated {filename}",
@@ -651,7 +2706,11 @@ async def deobf(ctx, url: str = None):
             
             stats_text = (f"**Original Size:** {original_size / 1024:.2f} KB\n"
                          f"**Deobfuscated Size:** {output_size / 1024:.2f} KB\n"
-                         f"**Processing Time:** {processing_time:.2f}s\n")
+                         f"**Processing Time:** {processing_time:.2f}s{' (cached)' if cache_hit else ' (shared run)' if result.coalesced else ''}\n")
+            if compression_text:
+                stats_text += compression_text
+            if priority_charged:
+                stats_text += f"**Priority Lane:** +{DEOBF_PRIORITY_COST} tokens\n"
             
             if token_system_active:
                 stats_text += f"**Tokens Left:** {remaining_tokens} tokens"
@@ -674,6 +2733,13 @@ async def deobf(ctx, url: str = None):
                     inline=False
                 )
             
+            if settings.get('stage_breakdown', False) and is_admin(ctx.author):
+                embed.add_field(
+                    name="⏱️ Stage Timings",
+                    value=f"{trace.breakdown()}\nJob `{trace.id}`, upload not included",
+                    inline=False
+                )
+            
             # Different footer based on source
             if from_url:
                 embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')} • Temp files auto-delete in 2min")
@@ -693,12 +2759,17 @@ async def deobf(ctx, url: str = None):
             except:
                 pass
             
-            await ctx.reply(
-                embed=embed,
-                file=discord.File(output_path, filename=f"deobf_{filename}"),
-                view=view
-            )
+            upload_start = time.monotonic()
+            with trace.span('upload'):
+                await ctx.reply(
+                    embed=embed,
+                    file=discord.File(delivery_path, filename=delivery_name),
+                    view=view
+                )
+            record_upload(delivery_size, time.monotonic() - upload_start)
+            outcome = 'success'
         else:
+            outcome = 'unsupported'
             embed = discord.Embed(
                 title="❌ Deobfuscation Failed",
                 description="⚠️ **Only Moonsec V3 supported**\n\nMake sure you're uploading a valid Moonsec V3 obfuscated file.",
@@ -718,8 +2789,26 @@ async def deobf(ctx, url: str = None):
         except:
             await ctx.reply(embed=embed)
     finally:
+        DEOBF_REQUESTS.inc(outcome=outcome)
+        trace.finish(
+            outcome,
+            filename=filename,
+            input_bytes=original_size,
+            output_bytes=result.output_size if result else 0,
+            cache_hit=result.cache_hit if result else False
+        )
+        for extension in ('.zip', '.gz'):
+            try:
+                os.remove(output_path + extension)
+            except OSError:
+                pass
+        # URL downloads are kept for 2 minutes once the reply is out, the clock only starts
+        # now so a job that waited in the queue never loses its files while it runs
+        if from_url:
+            schedule_file_cleanup(input_path, delay_seconds=120)
+            schedule_file_cleanup(output_path, delay_seconds=120)
         # Immediate cleanup for attachment-based deobfuscations
-        if not from_url:
+        else:
             try:
                 if os.path.exists(input_path):
                     os.remove(input_path)
@@ -731,14 +2820,543 @@ async def deobf(ctx, url: str = None):
             except Exception:
                 pass
 
+async def deobf_batch(ctx, urls, attachments, priority=False, paid_priority=False):
+    """Deobfuscate several attachments, URLs or zipped scripts and reply with one zip"""
+    user_id = ctx.author.id
+    cost = COST_PER_USE + (DEOBF_PRIORITY_COST if paid_priority else 0)
+    token_system_active = is_token_system_enabled()
+    
+    if job_scheduler.full:
+        DEOBF_REQUESTS.inc(outcome='rejected')
+        await ctx.reply(QUEUE_FULL_MESSAGE)
+        return
+    if job_scheduler.at_user_limit(user_id):
+        DEOBF_REQUESTS.inc(outcome='user_limit')
+        await ctx.reply(USER_LIMIT_MESSAGE)
+        return
+    
+    if any(not is_valid_url(url) for url in urls):
+        await ctx.reply('❌ Invalid URL! Please provide valid http:// or https:// URLs.')
+        return
+    
+    if len(urls) + len(attachments) > DEOBF_BATCH_MAX_FILES:
+        await ctx.reply(f'❌ Too many files! A batch can hold at most {DEOBF_BATCH_MAX_FILES} files.')
+        return
+    
+    if deobfuscator is None:
+        await ctx.reply('❌ Moonsec deobfuscator executable not found. Please ensure the project is built.')
+        return
+    
+    loading_msg = await ctx.reply("<a:Loading:1447156037885886525> Fetching the batch...")
+    loop = asyncio.get_running_loop()
+    temp_paths = []
+    
+    def temp_file(suffix):
+        fd, path = tempfile.mkstemp(suffix=suffix, dir=DEOBF_WORK_DIR)
+        os.close(fd)
+        temp_paths.append(path)
+        return path
+    
+    async def fetch(name, source):
+        """Save an attachment or download a URL into a temp file"""
+        if not (is_script_filename(name) or name.lower().endswith('.zip')):
+            return BatchFile(name, outcome='skipped', detail='not a .lua/.txt/.zip file')
+        path = temp_file(os.path.splitext(name)[1])
+        if isinstance(source, str):
+            with DOWNLOAD_TIME.time():
+                size, error = await fetch_url(source, path)
+            if error:
+                DEOBF_REQUESTS.inc(outcome='download_error')
+                return BatchFile(name, outcome='download_error', detail=error)
+        else:
+            if source.size > MAX_FILE_SIZE:
+                return BatchFile(name, outcome='skipped', detail='over 5MB')
+            await source.save(path)
+        return BatchFile(name, path)
+    
+    batch_started = time.monotonic()
+    batch_id = secrets.token_hex(6)
+    try:
+        sources = [(attachment.filename, attachment) for attachment in attachments]
+        sources += [(url_filename(url, default=f'script_{i + 1}.lua'), url) for i, url in enumerate(urls)]
+        fetched = await asyncio.gather(*(fetch(name, source) for name, source in sources))
+        
+        # Expand zips in place, capping the batch at DEOBF_BATCH_MAX_FILES scripts
+        files = []
+        room = DEOBF_BATCH_MAX_FILES - sum(1 for f in fetched if f.outcome is None and is_script_filename(f.name))
+        for batch_file in fetched:
+            if batch_file.outcome is not None or not batch_file.name.lower().endswith('.zip'):
+                files.append(batch_file)
+                continue
+            try:
+                scripts, skipped = await loop.run_in_executor(None, extract_zip_scripts, batch_file.input_path, DEOBF_WORK_DIR, max(room, 0))
+            except zipfile.BadZipFile:
+                files.append(BatchFile(batch_file.name, outcome='error', detail='not a valid zip'))
+                continue
+            room -= len(scripts)
+            temp_paths.extend(path for _, path in scripts)
+            files.extend(BatchFile(name, path) for name, path in scripts)
+            files.extend(BatchFile(name, outcome='skipped', detail='not a script, over 5MB or over the batch limit') for name in skipped)
+        
+        if DEOBF_PREFLIGHT:
+            for batch_file in files:
+                if batch_file.outcome is None:
+                    accepted, reason, message = preflight_check(batch_file.input_path)
+                    if not accepted:
+                        DEOBF_REQUESTS.inc(outcome='preflight_rejected')
+                        batch_file.outcome = 'preflight_rejected'
+                        batch_file.detail = f'not sent: {message}'
+        
+        runnable = [f for f in files if f.outcome is None]
+        if runnable and token_system_active and get_user_tokens(user_id) < cost:
+            await loading_msg.edit(embed=insufficient_tokens_embed(ctx), content=None)
+            return
+        done = 0
+        last_update = time.monotonic()
+        await loading_msg.edit(content=f"<a:Loading:1447156037885886525> Deobfuscating {len(runnable)} files...")
+        
+        # The batch feeds the scheduler no more files at once than the per-user cap allows
+        user_slots = asyncio.Semaphore(job_scheduler.max_per_user or len(runnable) or 1)
+        
+        async def process(batch_file):
+            async with user_slots:
+                await run_file(batch_file)
+        
+        async def run_file(batch_file):
+            nonlocal done, last_update
+            batch_file.output_path = temp_file('_deobf.lua')
+            input_size = os.path.getsize(batch_file.input_path)
+            INPUT_SIZE.observe(input_size)
+            trace = JobTrace('batch', user_id, batch=batch_id, filename=batch_file.name, priority=priority)
+            trace.begin()
+            try:
+                batch_file.result = await run_deobfuscation(
+                    batch_file.input_path, batch_file.output_path, user_id,
+                    origin=message_origin(ctx.message),
+                    trace=trace,
+                    priority=priority
+                )
+                batch_file.outcome = batch_file.result.outcome
+            except Exception as e:
+                batch_file.outcome = 'error'
+                batch_file.detail = str(e)[:100]
+            finally:
+                trace.finish(
+                    batch_file.outcome or 'error',
+                    input_bytes=input_size,
+                    output_bytes=batch_file.result.output_size if batch_file.result else 0,
+                    cache_hit=batch_file.result.cache_hit if batch_file.result else False
+                )
+            done += 1
+            if done < len(runnable) and time.monotonic() - last_update >= QUEUE_UPDATE_INTERVAL:
+                last_update = time.monotonic()
+                await loading_msg.edit(content=f"<a:Loading:1447156037885886525> Deobfuscating {len(runnable)} files... {done}/{len(runnable)} done")
+        
+        await asyncio.gather(*(process(f) for f in runnable))
+        
+        # Only successes are charged, in one debit before the zip is built: files the balance
+        # doesn't cover are left out, so a command spending tokens meanwhile can't get them free
+        succeeded = [f for f in runnable if f.outcome == 'success']
+        charged = 0
+        if token_system_active and succeeded:
+            costs = [COST_PER_USE + (DEOBF_PRIORITY_COST if paid_priority and f.result.priority_lane else 0) for f in succeeded]
+            covered = use_tokens_up_to(user_id, costs)
+            for batch_file in succeeded[covered:]:
+                batch_file.outcome = 'insufficient_tokens'
+            succeeded = succeeded[:covered]
+            charged = sum(costs[:covered])
+        
+        zip_size = 0
+        if succeeded:
+            zip_path = temp_file('_deobf.zip')
+            entries = [(f'deobf_{f.name}', f.output_path) for f in succeeded]
+            zip_size = await loop.run_in_executor(None, write_result_zip, zip_path, entries)
+            if zip_size > DISCORD_UPLOAD_LIMIT:
+                if charged:
+                    add_tokens(user_id, charged)
+                    charged = 0
+                for batch_file in succeeded:
+                    batch_file.outcome = 'too_large'
+                succeeded = []
+        
+        for batch_file in runnable:
+            DEOBF_REQUESTS.inc(outcome=batch_file.outcome)
+        
+        remaining_tokens = get_user_tokens(user_id)
+        
+        file_lines = []
+        for batch_file in files:
+            if batch_file.outcome == 'success':
+                result = batch_file.result
+                timing = 'cached' if result.cache_hit else f'{result.processing_time:.1f}s{", shared" if result.coalesced else ""}'
+                file_lines.append(f"✅ `{batch_file.name}` - {result.output_size / 1024:.2f} KB ({timing})")
+            else:
+                reason = batch_file.detail or BATCH_OUTCOME_TEXT.get(batch_file.outcome, batch_file.outcome.replace('_', ' '))
+                file_lines.append(f"❌ `{batch_file.name}` - {reason}")
+        files_text = ''
+        for index, line in enumerate(file_lines):
+            if len(files_text) + len(line) > 950:
+                files_text += f"... and {len(file_lines) - index} more"
+                break
+            files_text += line + '\n'
+        
+        if succeeded:
+            embed = discord.Embed(
+                title="✅ Batch Deobfuscation Complete",
+                description=f"Successfully deobfuscated **{len(succeeded)}/{len(files)}** files",
+                color=0x00FF00 if len(succeeded) == len(files) else 0xFFA500
+            )
+        else:
+            embed = discord.Embed(
+                title="❌ Deobfuscation Failed",
+                description="⚠️ **No file in the batch could be deobfuscated**\n\nMake sure you're uploading valid Moonsec V3 obfuscated files.",
+                color=0xFF0000
+            )
+        embed.add_field(name="📄 Files", value=files_text.strip() or 'No .lua/.txt files found', inline=False)
+        
+        stats_text = (f"**Result Zip:** {zip_size / 1024:.2f} KB\n"
+                      f"**Total Time:** {time.monotonic() - batch_started:.2f}s\n")
+        if token_system_active:
+            stats_text += f"**Tokens Used:** {charged}\n**Tokens Left:** {remaining_tokens} tokens"
+        else:
+            stats_text += f"**Tokens Saved:** {remaining_tokens} tokens\n⚠️ **FREE MODE** - No tokens used!"
+        embed.add_field(name="📊 Statistics", value=stats_text, inline=False)
+        
+        found_links = list(dict.fromkeys(link for f in succeeded for link in f.result.links))
+        if found_links:
+            links_text = '\n'.join(found_links[:10])
+            if len(found_links) > 10:
+                links_text += f"\n... and {len(found_links) - 10} more"
+            embed.add_field(name="🔗 Found Links", value=links_text, inline=False)
+        embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')}")
+        
+        try:
+            await loading_msg.delete()
+        except:
+            pass
+        if succeeded:
+            await ctx.reply(embed=embed, file=discord.File(zip_path, filename='deobf_batch.zip'))
+        else:
+            await ctx.reply(embed=embed)
+    except Exception as e:
+        embed = discord.Embed(
+            title="❌ Deobfuscation Failed",
+            description=f"⚠️ **Internal Error**\n\nAn error occurred: {str(e)[:200]}",
+            color=0xFF0000
+        )
+        embed.set_footer(text=f"Requested by {ctx.author.display_name} - {datetime.now().strftime('%m/%d/%y, %I:%M %p')}")
+        try:
+            await loading_msg.edit(embed=embed, content=None)
+        except:
+            await ctx.reply(embed=embed)
+    finally:
+        for path in temp_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+class ApiJob:
+    """A deobfuscation submitted over the HTTP API"""
+
+    def __init__(self, user_id, filename):
+        self.id = secrets.token_urlsafe(12)
+        self.user_id = user_id
+        self.filename = filename
+        self.status = 'queued'
+        self.position = None
+        self.outcome = None
+        self.error = None
+        self.result = None
+        self.input_size = 0
+        self.finished_at = None
+        self.task = None
+        input_fd, self.input_path = tempfile.mkstemp(suffix=os.path.splitext(filename)[1] or '.lua', dir=DEOBF_WORK_DIR)
+        output_fd, self.output_path = tempfile.mkstemp(suffix='_deobf.lua', dir=DEOBF_WORK_DIR)
+        os.close(input_fd)
+        os.close(output_fd)
+
+    def to_json(self):
+        body = {'id': self.id, 'status': self.status, 'filename': self.filename}
+        if self.status == 'queued' and self.position:
+            body['position'] = self.position
+        if self.status == 'done':
+            body['outcome'] = self.outcome
+            if self.error:
+                body['error'] = self.error
+            if self.result is not None:
+                body['output_size'] = self.result.output_size
+                body['processing_time'] = round(self.result.processing_time, 3)
+                body['cache_hit'] = self.result.cache_hit
+                body['coalesced'] = self.result.coalesced
+                body['links'] = list(self.result.links)
+            if self.outcome == 'success':
+                body['result_url'] = f'/api/jobs/{self.id}/result'
+        return body
+
+api_jobs = OrderedDict()
+
+API_OUTCOME_STATUS = {
+    'rejected': 503,
+    'user_limit': 429,
+    'timeout': 504,
+    'resource_limit': 422,
+    'unsupported': 422,
+    'insufficient_tokens': 402,
+    'error': 500,
+}
+
+def api_error(status, message, **extra):
+    return web.json_response({'error': message, **extra}, status=status)
+
+def prune_api_jobs():
+    """Forget finished API jobs older than API_JOB_TTL"""
+    cutoff = time.monotonic() - API_JOB_TTL
+    for job_id, job in list(api_jobs.items()):
+        if job.finished_at is not None and job.finished_at < cutoff:
+            del api_jobs[job_id]
+
+def api_user(request):
+    """The ledger user behind the request's API key, or None"""
+    auth = request.headers.get('Authorization', '')
+    key = auth[7:] if auth.startswith('Bearer ') else request.headers.get('X-API-Key')
+    if not key:
+        return None
+    return ledger.api_key_user(key.strip())
+
+async def save_api_upload(request, dest_path):
+    """Stream a raw or multipart (field ``file``) body into dest_path, returns (size, filename, error)"""
+    filename = request.query.get('filename')
+    if request.content_type.startswith('multipart/'):
+        reader = await request.multipart()
+        part = await reader.next()
+        while part is not None and part.name != 'file':
+            part = await reader.next()
+        if part is None:
+            return 0, filename, "Multipart body needs a 'file' field"
+        filename = part.filename or filename
+        read_chunk = part.read_chunk
+    else:
+        read_chunk = request.content.read
+    size = 0
+    with open(dest_path, 'wb') as f:
+        while True:
+            chunk = await read_chunk(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > MAX_FILE_SIZE:
+                return 0, filename, "File too large! Maximum size is 5MB."
+            f.write(chunk)
+    if size == 0:
+        return 0, filename, "Empty request body"
+    return size, filename, None
+
+async def run_api_job(job):
+    """Drive an ApiJob through the shared pipeline and charge its user on success"""
+    async def track_position(position, eta):
+        job.position = position
+        job.status = 'queued' if position else 'running'
+    
+    job.status = 'running'
+    outcome = 'error'
+    trace = JobTrace('api', job.user_id, api_job=job.id, filename=job.filename)
+    trace.begin()
+    try:
+        job.result = await run_deobfuscation(
+            job.input_path, job.output_path, job.user_id, on_queue_update=track_position, trace=trace
+        )
+        outcome = job.result.outcome
+        if outcome == 'success' and is_token_system_enabled():
+            with trace.span('ledger'):
+                if not use_token(job.user_id):
+                    outcome = 'insufficient_tokens'
+    except Exception as e:
+        job.error = str(e)[:200]
+    finally:
+        trace.finish(
+            outcome,
+            input_bytes=job.input_size,
+            output_bytes=job.result.output_size if job.result else 0,
+            cache_hit=job.result.cache_hit if job.result else False
+        )
+        job.outcome = outcome
+        job.status = 'done'
+        job.finished_at = time.monotonic()
+        DEOBF_REQUESTS.inc(outcome=outcome)
+        try:
+            os.remove(job.input_path)
+        except OSError:
+            pass
+        if outcome == 'success':
+            reaper.schedule(job.output_path, API_JOB_TTL)
+        else:
+            try:
+                os.remove(job.output_path)
+            except OSError:
+                pass
+
+def api_result_response(job):
+    """Stream a finished job's output, or describe why there is none"""
+    if job.outcome != 'success':
+        return web.json_response(job.to_json(), status=API_OUTCOME_STATUS.get(job.outcome, 500))
+    if not os.path.exists(job.output_path):
+        return api_error(410, 'The result has expired')
+    return web.FileResponse(
+        job.output_path,
+        headers={
+            'Content-Type': 'text/plain; charset=utf-8',
+            'Content-Disposition': f'attachment; filename="deobf_{job.filename}"',
+            'X-Job-Id': job.id,
+            'X-Processing-Time': f'{job.result.processing_time:.3f}',
+            'X-Cache': 'hit' if job.result.cache_hit else 'miss',
+        }
+    )
+
+async def api_deobf(request):
+    """POST /api/deobf: deobfuscate the body, ?async=1 returns a job to poll instead of waiting"""
+    user_id = api_user(request)
+    if user_id is None:
+        return api_error(401, 'Missing or invalid API key')
+    if job_scheduler.full:
+        DEOBF_REQUESTS.inc(outcome='rejected')
+        return web.json_response(
+            {'error': 'The deobfuscation queue is full, no tokens were charged'},
+            status=503,
+            headers={'Retry-After': str(int(job_scheduler.avg_runtime) + 1)}
+        )
+    if job_scheduler.at_user_limit(user_id):
+        DEOBF_REQUESTS.inc(outcome='user_limit')
+        return web.json_response(
+            {'error': f'You already have {job_scheduler.max_per_user} jobs queued or running, no tokens were charged'},
+            status=429,
+            headers={'Retry-After': str(int(job_scheduler.avg_runtime) + 1)}
+        )
+    if deobfuscator is None:
+        return api_error(503, 'Deobfuscator not available')
+    
+    prune_api_jobs()
+    job = ApiJob(user_id, os.path.basename(request.query.get('filename') or 'script.lua'))
+    try:
+        size, filename, error = await save_api_upload(request, job.input_path)
+    except Exception:
+        error = 'Could not read the request body'
+    if error:
+        for path in (job.input_path, job.output_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return api_error(413 if 'too large' in error else 400, error)
+    if filename:
+        job.filename = os.path.basename(filename)
+    job.input_size = size
+    INPUT_SIZE.observe(size)
+    
+    error = None
+    if DEOBF_PREFLIGHT:
+        accepted, reason, message = preflight_check(job.input_path)
+        if not accepted:
+            DEOBF_REQUESTS.inc(outcome='preflight_rejected')
+            error = api_error(422, f'Only Moonsec V3 is supported: {message}', reason=reason)
+    if error is None and is_token_system_enabled() and get_user_tokens(user_id) < COST_PER_USE:
+        error = api_error(402, 'Insufficient tokens')
+    if error is not None:
+        for path in (job.input_path, job.output_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return error
+    
+    api_jobs[job.id] = job
+    job.task = asyncio.create_task(run_api_job(job))
+    if request.query.get('async') in ('1', 'true', 'yes'):
+        return web.json_response(
+            {'id': job.id, 'status': job.status, 'status_url': f'/api/jobs/{job.id}'},
+            status=202
+        )
+    # Shielded so a client hanging up leaves the job to finish and be polled
+    await asyncio.shield(job.task)
+    return api_result_response(job)
+
+def owned_api_job(request):
+    user_id = api_user(request)
+    if user_id is None:
+        return None, api_error(401, 'Missing or invalid API key')
+    prune_api_jobs()
+    job = api_jobs.get(request.match_info['job_id'])
+    if job is None or job.user_id != user_id:
+        return None, api_error(404, 'Unknown job')
+    return job, None
+
+async def api_job_status(request):
+    """GET /api/jobs/{job_id}: the job's status and, once done, its outcome"""
+    job, error = owned_api_job(request)
+    if error:
+        return error
+    return web.json_response(job.to_json())
+
+async def api_job_result(request):
+    """GET /api/jobs/{job_id}/result: stream the output of a finished job"""
+    job, error = owned_api_job(request)
+    if error:
+        return error
+    if job.status != 'done':
+        return web.json_response(job.to_json(), status=202)
+    return api_result_response(job)
+
 # HTTP server for Render (required for free tier web services)
 async def health_check(request):
     return web.Response(text="Bot is running!")
 
+async def liveness_check(request):
+    """200 while the event loop keeps up, so orchestrators only restart a wedged process"""
+    alive = event_loop_lag < LIVENESS_MAX_LAG
+    return web.json_response(
+        {'alive': alive, 'event_loop_lag_seconds': round(event_loop_lag, 4)},
+        status=200 if alive else 503
+    )
+
+async def readiness_check(request):
+    """200 only when the bot can take another .deobf job right now"""
+    checks = {
+        'gateway_connected': gateway_connected and not bot.is_closed(),
+        'deobfuscator_resolved': deobfuscator is not None,
+        'accepting_jobs': not job_scheduler.full,
+        'event_loop_responsive': event_loop_lag < READINESS_MAX_LAG,
+    }
+    ready = all(checks.values())
+    return web.json_response(
+        {
+            'ready': ready,
+            'checks': checks,
+            'jobs': {
+                'running': job_scheduler.running,
+                'queued': job_scheduler.queued,
+                'concurrency': job_scheduler.concurrency,
+                'max_queue': job_scheduler.max_queue,
+                'priority_queued': job_scheduler.priority_queued,
+                'max_per_user': job_scheduler.max_per_user,
+            },
+            'event_loop_lag_seconds': round(event_loop_lag, 4),
+        },
+        status=200 if ready else 503
+    )
+
+async def metrics_handler(request):
+    return web.Response(body=render_metrics().encode('utf-8'), headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'})
+
 async def start_http_server():
     app = web.Application()
-    app.router.add_get('/health', health_check)
+    app.router.add_get('/health', liveness_check)
+    app.router.add_get('/live', liveness_check)
+    app.router.add_get('/ready', readiness_check)
     app.router.add_get('/', health_check)
+    app.router.add_get('/metrics', metrics_handler)
+    app.router.add_post('/api/deobf', api_deobf)
+    app.router.add_get('/api/jobs/{job_id}', api_job_status)
+    app.router.add_get('/api/jobs/{job_id}/result', api_job_result)
     
     port = int(os.getenv('PORT', 10000))
     runner = web.AppRunner(app)
@@ -747,11 +3365,33 @@ async def start_http_server():
     await site.start()
     print(f'HTTP server running on port {port}')
 
+def log_setting_change(key, old, new):
+    print(f"Setting changed: {key} = {new!r} (was {old!r})")
+
 async def main():
-    # Start HTTP server first (for Render health checks)
+    settings.load()
+    settings.add_listener(log_setting_change)
+    reaper.prepare()
+    asyncio.create_task(reaper.run())
+    if SETTINGS_WATCH_INTERVAL > 0:
+        asyncio.create_task(settings.watch(SETTINGS_WATCH_INTERVAL))
+    asyncio.create_task(monitor_event_loop_lag())
+    
+    # Start HTTP server first (for Render health checks), /ready says 503 until the deobfuscator is resolved
     await start_http_server()
+    try:
+        # May build the dotnet project, which takes a while
+        await asyncio.get_running_loop().run_in_executor(None, load_deobfuscator)
+    except DeobfuscatorNotFound as e:
+        raise SystemExit(f'Startup failed: {e}')
+    await deobf_pool.start()
     # Then start the Discord bot
-    await bot.start(TOKEN)
+    get_http_session()
+    try:
+        await bot.start(TOKEN)
+    finally:
+        await close_http_session()
+        await deobf_pool.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,433 @@
+"""Long-lived deobfuscation worker driven by bot.py over stdin/stdout
+
+Frames are a 4-byte big-endian length followed by a UTF-8 JSON object.
+The worker sends ``{"ready": true}`` once it is up, then answers every
+job frame ``{"id", "input", "output", "timeout", "limits"}`` with one
+result frame. Each job runs in its own process group under the rlimits in
+``limits`` (``cpu_seconds``, ``memory_bytes``, ``output_bytes``).
+
+With ``--queue DB`` the worker instead claims jobs from the shared SQLite
+JobQueue and writes results back to it, so any number of workers on this
+host, or on other hosts mounting the same volume, can serve one bot. A job
+the bot cancels is killed with its process group as soon as the worker
+sees the ``cancelled`` status.
+
+Usage:
+    python deobf_worker.py --cwd DIR -- <deobfuscator command prefix>
+    python deobf_worker.py --queue DB --cwd DIR -- <deobfuscator command prefix>
+    python deobf_worker.py --fake [--fake-latency S] [--fake-output-bytes N]
+
+Only the standard library is used so the worker starts fast and never
+touches the Discord token.
+"""
+import argparse
+import json
+import os
+import shutil
+import signal
+import socket
+import sqlite3
+import struct
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, jobs run without rlimits there
+    resource = None
+
+FRAME_HEADER = struct.Struct('>I')
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+PR_SET_PDEATHSIG = 1
+if sys.platform.startswith('linux'):
+    import ctypes
+    _libc = ctypes.CDLL(None, use_errno=True)
+else:
+    _libc = None
+
+# Signals the kernel sends when a job's rlimits are exceeded
+LIMIT_SIGNALS = {
+    getattr(signal, 'SIGXCPU', None): 'cpu_limit',
+    getattr(signal, 'SIGXFSZ', None): 'output_limit',
+}
+
+QUEUE_POLL_MIN_INTERVAL = 0.01
+QUEUE_POLL_INTERVAL = 0.2
+QUEUE_MAX_ATTEMPTS = 2
+
+current_job = None
+# Set by the queue worker's watcher when the bot cancels the job that is running
+job_cancelled = threading.Event()
+# Called once the job's process exists, the queue worker starts its cancel watcher
+# there: preexec_fn is not safe to fork with other threads running
+on_job_started = None
+
+
+def encode_frame(message):
+    body = json.dumps(message).encode('utf-8')
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def decode_frame(body):
+    return json.loads(body.decode('utf-8'))
+
+
+def read_frame(stream):
+    """Read one frame from a binary stream, returns None on EOF"""
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f'Frame too large: {size} bytes')
+    body = stream.read(size)
+    if len(body) < size:
+        return None
+    return decode_frame(body)
+
+
+def write_frame(stream, message):
+    stream.write(encode_frame(message))
+    stream.flush()
+
+
+class JobQueue:
+    """Durable job table shared by the bot and queue workers
+
+    The bot inserts jobs and collects their results, workers claim them one
+    ``BEGIN IMMEDIATE`` transaction at a time. A job still running after its
+    timeout plus ``stale_grace`` lost its worker: it goes back in the queue,
+    or fails with ``worker_lost`` after QUEUE_MAX_ATTEMPTS tries. A running
+    job the bot gives up on is marked ``cancelled`` for its worker to kill.
+    """
+
+    def __init__(self, path, stale_grace=30):
+        self.path = path
+        self.stale_grace = stale_grace
+        self._conn = None
+        self._lock = threading.RLock()
+
+    @property
+    def db(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'payload TEXT NOT NULL, '
+                'timeout REAL NOT NULL, '
+                "status TEXT NOT NULL DEFAULT 'queued', "
+                'origin TEXT, '
+                'worker TEXT, '
+                'attempts INTEGER NOT NULL DEFAULT 0, '
+                'claimed_at REAL, '
+                'result TEXT, '
+                'created_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id)')
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            db = self.db
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                yield db
+            except BaseException:
+                db.execute('ROLLBACK')
+                raise
+            db.execute('COMMIT')
+
+    def submit(self, job, origin=None):
+        """Queue a job dict, returns its id"""
+        with self.transaction() as db:
+            cursor = db.execute(
+                'INSERT INTO jobs (payload, timeout, origin, created_at) VALUES (?, ?, ?, ?)',
+                (json.dumps(job), job.get('timeout') or 0, origin, time.time())
+            )
+            return cursor.lastrowid
+
+    def claim(self, worker):
+        """Take the oldest queued job, returns the job dict or None"""
+        now = time.time()
+        with self.transaction() as db:
+            stale = 'status = ? AND claimed_at + timeout + ? < ?'
+            db.execute(
+                f'UPDATE jobs SET status = ?, result = ? WHERE {stale} AND attempts >= ?',
+                ('done', json.dumps({'error': 'worker_lost'}), 'running', self.stale_grace, now, QUEUE_MAX_ATTEMPTS)
+            )
+            db.execute(
+                f'UPDATE jobs SET status = ?, worker = NULL WHERE {stale}',
+                ('queued', 'running', self.stale_grace, now)
+            )
+            # Cancelled jobs whose worker died before it could clean up
+            db.execute(f'DELETE FROM jobs WHERE {stale}', ('cancelled', self.stale_grace, now))
+            row = db.execute('SELECT id, payload FROM jobs WHERE status = ? ORDER BY id LIMIT 1', ('queued',)).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                'UPDATE jobs SET status = ?, worker = ?, claimed_at = ?, attempts = attempts + 1 WHERE id = ?',
+                ('running', worker, now, row[0])
+            )
+        job = json.loads(row[1])
+        job['id'] = row[0]
+        return job
+
+    def finish(self, job_id, result):
+        with self.transaction() as db:
+            db.execute(
+                'UPDATE jobs SET status = ?, result = ? WHERE id = ? AND status = ?',
+                ('done', json.dumps(result), job_id, 'running')
+            )
+
+    def results(self, job_ids):
+        """Map each finished job in job_ids to its result"""
+        with self._lock:
+            placeholders = ', '.join('?' * len(job_ids))
+            rows = self.db.execute(
+                f'SELECT id, result FROM jobs WHERE status = ? AND id IN ({placeholders})',
+                ['done'] + list(job_ids)
+            ).fetchall()
+        return {job_id: json.loads(result) for job_id, result in rows}
+
+    def delete(self, job_id):
+        with self.transaction() as db:
+            db.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+
+    def cancel(self, job_id):
+        """Drop a job, a running one is left as ``cancelled`` for its worker to kill and delete"""
+        with self.transaction() as db:
+            db.execute('DELETE FROM jobs WHERE id = ? AND status != ?', (job_id, 'running'))
+            db.execute('UPDATE jobs SET status = ? WHERE id = ? AND status = ?', ('cancelled', job_id, 'running'))
+
+    def is_cancelled(self, job_id):
+        """True once the bot cancelled the job or dropped it altogether"""
+        with self._lock:
+            row = self.db.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return row is None or row[0] == 'cancelled'
+
+    def take_orphans(self):
+        """Remove every job left by an earlier bot process, returns their origins"""
+        with self.transaction() as db:
+            rows = db.execute('SELECT origin FROM jobs').fetchall()
+            db.execute('DELETE FROM jobs')
+        return [origin for (origin,) in rows if origin]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def log(message):
+    print(f'[worker {os.getpid()}] {message}', file=sys.stderr, flush=True)
+
+
+def set_parent_death_signal():
+    """Have Linux SIGKILL the tool if this worker dies before it"""
+    if _libc is not None:
+        _libc.prctl(PR_SET_PDEATHSIG, signal.SIGKILL)
+
+
+def job_preexec(limits):
+    """preexec_fn that applies a job's rlimits inside the tool process"""
+    def preexec():
+        if resource is not None:
+            cpu_seconds = limits.get('cpu_seconds')
+            if cpu_seconds:
+                # SIGXCPU at the soft limit, SIGKILL one second later
+                resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+            memory_bytes = limits.get('memory_bytes')
+            if memory_bytes:
+                resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+            output_bytes = limits.get('output_bytes')
+            if output_bytes:
+                resource.setrlimit(resource.RLIMIT_FSIZE, (output_bytes, output_bytes))
+        set_parent_death_signal()
+    return preexec
+
+
+def output_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def kill_process_group(proc):
+    """SIGKILL everything in the tool's process group, including children like `dotnet run` spawns"""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_job(prefix, cwd, job):
+    global current_job
+    cmd = prefix + ['-dev', '-i', job['input'], '-o', job['output']]
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd,
+        start_new_session=True,
+        preexec_fn=job_preexec(job.get('limits') or {})
+    )
+    current_job = proc
+    if on_job_started is not None:
+        on_job_started()
+    try:
+        stdout, stderr = proc.communicate(timeout=job.get('timeout'))
+    except subprocess.TimeoutExpired:
+        kill_process_group(proc)
+        proc.communicate()
+        return {'id': job['id'], 'error': 'timeout', 'elapsed': time.perf_counter() - start}
+    finally:
+        current_job = None
+    # Reap anything the tool left running in its group
+    kill_process_group(proc)
+    limit = LIMIT_SIGNALS.get(-proc.returncode)
+    output_bytes = (job.get('limits') or {}).get('output_bytes')
+    if not limit and output_bytes and proc.returncode != 0 and output_size(job['output']) >= output_bytes:
+        # Tools that ignore SIGXFSZ fail with EFBIG instead of being killed
+        limit = 'output_limit'
+    if limit:
+        return {'id': job['id'], 'error': limit, 'elapsed': time.perf_counter() - start}
+    return {
+        'id': job['id'],
+        'returncode': proc.returncode,
+        'stdout': stdout[-2000:],
+        'stderr': stderr[-2000:],
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+def handle_terminate(signum, frame):
+    """bot.py sends SIGTERM to cancel a job: take the running tool down with the worker"""
+    if current_job is not None:
+        kill_process_group(current_job)
+    os._exit(128 + signum)
+
+
+def run_fake_job(latency, output_bytes, job):
+    """Stand-in for the .NET tool: sleep, then copy or pad the input to the output"""
+    start = time.perf_counter()
+    if on_job_started is not None:
+        on_job_started()
+    timeout = job.get('timeout')
+    if timeout is not None and latency > timeout:
+        job_cancelled.wait(timeout)
+        return {'id': job['id'], 'error': 'timeout', 'elapsed': time.perf_counter() - start}
+    if job_cancelled.wait(latency):
+        return {'id': job['id'], 'error': 'cancelled', 'elapsed': time.perf_counter() - start}
+    if output_bytes is None:
+        shutil.copyfile(job['input'], job['output'])
+    else:
+        with open(job['output'], 'wb') as f:
+            f.write(b'-' * output_bytes)
+    return {'id': job['id'], 'returncode': 0, 'stdout': '', 'stderr': '', 'elapsed': time.perf_counter() - start}
+
+
+def serve(handle_job):
+    signal.signal(signal.SIGTERM, handle_terminate)
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    write_frame(stdout, {'ready': True, 'pid': os.getpid()})
+    while True:
+        job = read_frame(stdin)
+        if job is None:
+            return
+        try:
+            response = handle_job(job)
+        except Exception as e:
+            response = {'id': job.get('id'), 'error': f'{type(e).__name__}: {e}'}
+        write_frame(stdout, response)
+
+
+def watch_for_cancel(queue, job_id, done, poll_interval):
+    """Kill the running job's process group once the bot cancels it"""
+    while not done.wait(poll_interval):
+        try:
+            cancelled = queue.is_cancelled(job_id)
+        except sqlite3.Error as e:
+            log(f'Could not check job {job_id} for cancellation: {e}')
+            continue
+        if cancelled:
+            job_cancelled.set()
+            if current_job is not None:
+                kill_process_group(current_job)
+            return
+
+
+def serve_queue(queue, handle_job, poll_interval=QUEUE_POLL_INTERVAL):
+    """Claim and run jobs from a JobQueue until killed"""
+    global on_job_started
+    signal.signal(signal.SIGTERM, handle_terminate)
+    worker = f'{socket.gethostname()}:{os.getpid()}'
+    log(f'Serving jobs from {queue.path}')
+    # Poll quickly while jobs keep coming, back off to poll_interval when idle
+    delay = QUEUE_POLL_MIN_INTERVAL
+    while True:
+        job = queue.claim(worker)
+        if job is None:
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
+            continue
+        delay = QUEUE_POLL_MIN_INTERVAL
+        job_cancelled.clear()
+        done = threading.Event()
+        watcher = threading.Thread(target=watch_for_cancel, args=(queue, job['id'], done, poll_interval), daemon=True)
+        on_job_started = watcher.start
+        try:
+            response = handle_job(job)
+        except Exception as e:
+            response = {'id': job['id'], 'error': f'{type(e).__name__}: {e}'}
+        finally:
+            on_job_started = None
+            done.set()
+            if watcher.ident is not None:
+                watcher.join()
+        if job_cancelled.is_set():
+            log(f'Job {job["id"]} cancelled by the bot')
+            queue.delete(job['id'])
+        else:
+            queue.finish(job['id'], response)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cwd', default=None, help='working directory for the deobfuscator')
+    parser.add_argument('--queue', default=None, help='claim jobs from this shared SQLite queue instead of stdin')
+    parser.add_argument('--fake', action='store_true', help='run a stub instead of the real deobfuscator')
+    parser.add_argument('--fake-latency', type=float, default=0.0, help='seconds each fake job takes')
+    parser.add_argument('--fake-output-bytes', type=int, default=None, help='fake output size, defaults to the input size')
+    parser.add_argument('prefix', nargs='*', help='deobfuscator command prefix')
+    args = parser.parse_args(argv)
+
+    if args.fake:
+        handle_job = lambda job: run_fake_job(args.fake_latency, args.fake_output_bytes, job)
+    elif not args.prefix:
+        parser.error('a deobfuscator command prefix is required')
+    else:
+        handle_job = lambda job: run_job(args.prefix, args.cwd, job)
+
+    if args.queue:
+        serve_queue(JobQueue(args.queue), handle_job)
+    else:
+        serve(handle_job)
+
+
+if __name__ == '__main__':
+    main()